@@ -3,12 +3,11 @@
 """
 Training log analysis tools
 """
-import csv
-import glob
 import os
 from typing import List, Dict, Any, Tuple
 import config
 from analysis.visualizer import TrainingVisualizer
+from src.trainer.trace_store import TraceStore
 
 class TrainingAnalyzer:
     """Analyze training logs and provide insights"""
@@ -40,64 +39,61 @@ class TrainingAnalyzer:
         
         return summary
     
-    def _analyze_detailed_logs(self) -> Dict[str, Any]:
-        """Analyze detailed calculation logs"""
+    def _analyze_detailed_logs(self, epoch: int = None, sample_index: int = None) -> Dict[str, Any]:
+        """Analyze detailed calculation logs (default: sample pertama di trace store)"""
         print("\n=== Detailed Logs Analysis ===")
         
-        log_files = glob.glob(os.path.join(config.LOGS_DIR, 'detailed_logs_*.csv'))
-        
-        if not log_files:
+        trace_file = os.path.join(config.LOGS_DIR, config.LOGGING_CONFIG['trace_file'])
+        if not os.path.exists(trace_file):
             print("No detailed logs found")
             return {}
         
-        print(f"Found {len(log_files)} detailed log files")
-        
-        # Analyze a sample of detailed logs
-        sample_file = log_files[0]  # Analyze first file as example
-        
-        analysis = self._analyze_single_detailed_log(sample_file)
+        store = TraceStore(trace_file)
+        try:
+            samples = store.samples()
+            if not samples:
+                print("No detailed logs found")
+                return {}
+            
+            print(f"Found {len(samples)} traced samples in {os.path.basename(trace_file)}")
+            
+            # Analyze a sample of detailed logs
+            if epoch is None or sample_index is None:
+                epoch, sample_index = samples[0]  # Analyze first sample as example
+            analysis = self._analyze_trace_slice(store, epoch, sample_index)
+        finally:
+            store.close()
         
         return {
-            'detailed_logs_count': len(log_files),
+            'detailed_logs_count': len(samples),
             'sample_analysis': analysis
         }
     
-    def _analyze_single_detailed_log(self, log_file: str) -> Dict[str, Any]:
-        """Analyze a single detailed log file"""
-        print(f"\nAnalyzing: {os.path.basename(log_file)}")
-        
-        with open(log_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            logs = list(reader)
-        
-        if not logs:
-            return {}
+    def load_trace(self, epoch: int = None, sample_index: int = None, step_type: str = None) -> List[Dict[str, Any]]:
+        """Query a slice of the trace store (filter per epoch, sample dan/atau step_type)"""
+        trace_file = os.path.join(config.LOGS_DIR, config.LOGGING_CONFIG['trace_file'])
+        if not os.path.exists(trace_file):
+            return []
+        store = TraceStore(trace_file)
+        try:
+            return store.query(epoch=epoch, sample_index=sample_index, step_type=step_type)
+        finally:
+            store.close()
+    
+    def _analyze_trace_slice(self, store: TraceStore, epoch: int, sample_index: int) -> Dict[str, Any]:
+        """Analyze the trace of a single sample"""
+        print(f"\nAnalyzing: epoch {epoch}, sample {sample_index}")
         
         # Count operation types
-        operation_counts = {}
-        weight_changes = []
-        bias_changes = []
+        operation_counts = store.step_counts(epoch, sample_index)
+        if not operation_counts:
+            return {}
         
-        for log in logs:
-            step_type = log.get('step_type', 'unknown')
-            operation_counts[step_type] = operation_counts.get(step_type, 0) + 1
-            
-            # Collect weight changes
-            if 'weight_change' in log and log['weight_change']:
-                try:
-                    weight_changes.append(float(log['weight_change']))
-                except ValueError:
-                    pass
-            
-            # Collect bias changes
-            if 'bias_change' in log and log['bias_change']:
-                try:
-                    bias_changes.append(float(log['bias_change']))
-                except ValueError:
-                    pass
+        weight_changes = store.column_values('weight_change', epoch, sample_index)
+        bias_changes = store.column_values('bias_change', epoch, sample_index)
         
         analysis = {
-            'total_operations': len(logs),
+            'total_operations': sum(operation_counts.values()),
             'operation_breakdown': operation_counts,
             'weight_updates': len(weight_changes),
             'bias_updates': len(bias_changes)
@@ -151,7 +147,7 @@ class TrainingAnalyzer:
                 f.write(f"Loss reduction: {analysis.get('loss_reduction_percentage', 'N/A'):.2f}%\n\n")
                 
                 if 'detailed_logs_count' in analysis:
-                    f.write(f"Detailed logs generated: {analysis['detailed_logs_count']} files\n")
+                    f.write(f"Detailed logs generated: {analysis['detailed_logs_count']} traced samples\n")
                 
                 f.write(f"\nVisualization saved to: {plot_file}\n")
             
@@ -31,7 +31,8 @@ class TrainingVisualizer:
                     'epoch': int(row['epoch']),
                     'average_loss': float(row['average_loss']),
                     'total_samples': int(row['total_samples']),
-                    'best_loss_so_far': float(row['best_loss_so_far'])
+                    'best_loss_so_far': float(row['best_loss_so_far']),
+                    'learning_rate': float(row['learning_rate']) if row.get('learning_rate') else None
                 })
     
     def plot_training_curve(self, save_path: str = None, show_plot: bool = True):
@@ -9,6 +9,7 @@ RESULTS_DIR = os.path.join(DATA_DIR, 'results')
 LOGS_DIR = os.path.join(RESULTS_DIR, 'logs')
 MODELS_DIR = os.path.join(RESULTS_DIR, 'models')
 PLOTS_DIR = os.path.join(RESULTS_DIR, 'plots')
+CACHE_DIR = os.path.join(DATA_DIR, 'cache')
 
 # Network configuration
 NETWORK_CONFIG = {
@@ -17,30 +18,108 @@ NETWORK_CONFIG = {
     'output_size': 1,
     'learning_rate': 0.5,
     'weight_init_range': (-1.0, 1.0),
-    'bias_init_value': 0.0
+    'bias_init_value': 0.0,
+    'weight_init': 'uniform',        # uniform (weight_init_range), xavier, xavier_normal, he, he_normal, orthogonal
+    'seed': None,                    # Seed numpy Generator per model (None + uniform = modul random global)
+    'hidden_activation': 'sigmoid',  # sigmoid, tanh, relu, leaky_relu, softplus
+    'output_activation': 'sigmoid',
+    'engine': 'python',              # 'python' (per-neuron loop, default) atau 'numpy' (matmul; sama hingga
+                                     # pembulatan float, dibutuhkan untuk batch/optimizer/parallel)
+    'dtype': 'float64'               # 'float32' atau 'float64' (engine 'numpy' saja)
 }
 
 # Training configuration
 TRAINING_CONFIG = {
     'epochs': 10000,
+    'batch_size': 1,                # 1 = online SGD, N = mini-batch, 'full' = full-batch
+    'shuffle_data': False,          # Acak urutan sample setiap epoch (index permutation, tanpa copy data)
+    'shuffle_seed': None,           # None = NETWORK_CONFIG['seed'] (atau acak jika keduanya None)
+    'prefetch_batches': 0,          # Batch yang disiapkan background thread saat shuffle (0 = tanpa thread);
+                                    # hanya menguntungkan jika gather batch lambat (mis. memmap dari disk)
+    'prefetch_min_batch_size': 256, # Thread hanya dipakai untuk batch >= N sample (handoff per batch kecil lebih mahal)
+    'optimizer': 'sgd',             # sgd, momentum, nesterov, rmsprop, adam (selain sgd: engine 'numpy')
+    'optimizer_params': {},         # mis. {'momentum': 0.9} atau {'beta1': 0.9, 'beta2': 0.999, 'eps': 1e-8}
+    'lr_schedule': None,            # None, 'warmup', 'step', 'exponential', 'cosine', 'plateau'
+    'lr_schedule_params': {},       # mis. {'step_size': 1000, 'gamma': 0.5}, {'t_max': 10000},
+                                    # {'patience': 50, 'factor': 0.5}; semua: 'warmup_epochs'
     'log_detailed_every': 1000,      # Log detailed setiap N epochs
     'log_first_epochs': 5,          # Log detailed untuk N epochs pertama
     'print_progress_every': 50,     # Print progress setiap N epochs
     'early_stopping_patience': 100, # Stop if no improvement for N epochs
-    'target_loss': 0.01             # Target loss untuk early stopping
+    'target_loss': 0.01,            # Target loss untuk early stopping
+    'resume_from': None,            # Path checkpoint atau 'latest' untuk melanjutkan training
+    'parallel': None,               # None, 'data' (data-parallel, batch_size >= num_workers) atau 'hogwild'
+                                    # (lock-free SGD), engine 'numpy'
+    'num_workers': None             # Jumlah worker process (None = semua core)
 }
 
 # Logging configuration
 LOGGING_CONFIG = {
     'epoch_summary_file': 'epoch_summary.csv',
-    'detailed_log_pattern': 'detailed_logs_epoch_{epoch}_sample_{sample}.csv',
-    'model_save_pattern': 'model_epoch_{epoch}.json',
-    'final_model_file': 'trained_model.json'
+    'trace_file': 'training_trace.sqlite',  # Detailed calculations semua epoch/sample (SQLite, satu file per run)
+    'model_format': 'binary',       # 'binary' (memory-mappable .ckpt) atau 'json'
+    'model_save_pattern': 'model_epoch_{epoch}.{ext}',
+    'final_model_file': 'trained_model.{ext}',
+    'checkpoint_every_epochs': 1000, # Checkpoint periodik setiap N epochs (None = nonaktif)
+    'checkpoint_every_seconds': None, # dan/atau setiap T detik wall-clock
+    'checkpoint_keep_last': 3,       # Simpan K checkpoint terakhir
+    'checkpoint_keep_best': True,    # ... ditambah checkpoint dengan loss terbaik
+    'summary_flush_every': 100,      # Tulis epoch_summary.csv per N baris ...
+    'summary_flush_seconds': 5.0,    # ... atau setiap T detik (dan selalu di akhir training / saat checkpoint)
+    'epoch_logs_keep': 1000,         # Jumlah epoch terakhir yang disimpan di memory (None = semua, 0 = tidak ada)
+    'async_logging': False,          # True = file log ditulis writer thread (training tidak menunggu disk)
+    'log_queue_size': 1024,          # Maksimal record di antrean writer thread
+    'log_backpressure': 'block',     # Jika antrean penuh: 'block', 'drop_traces' atau 'sample'
+    'trace_sample_every': 10,        # 'sample': simpan 1 dari N detailed trace saat antrean penuh
+    'logs_dir': None,                # Override LOGS_DIR / MODELS_DIR (mis. per worker sweep)
+    'models_dir': None
 }
 
 # Dataset configuration
 DATASET_CONFIG = {
-    'xor_dataset_file': 'xor_dataset.json',
+    'xor_dataset_file': 'xor_dataset.json',   # .json ({"samples": [...]}), .jsonl atau .csv
+    'chunk_size': 1024,             # Jumlah sample per chunk saat membaca dataset
+    'streaming': False,             # True = main.py melatih langsung dari file per chunk (engine 'numpy')
+    'cache': True,                  # Simpan dataset sebagai .npy (X/Y) dan baca dengan mmap pada load berikutnya
+    'cache_dir': None               # None = CACHE_DIR (data/cache)
 }
 
 
+
+# Hyperparameter sweep configuration (sweep.py)
+SWEEP_CONFIG = {
+    'search': 'grid',               # 'grid' (semua kombinasi) atau 'random'
+    'num_samples': 20,              # Jumlah config untuk random search
+    'space': {                      # list = nilai/pilihan, tuple (low, high) = range (random search)
+        'hidden_size': [2, 4, 8],
+        'learning_rate': [0.5, 1.0, 2.0],
+        'weight_init': ['uniform', 'xavier'],
+    },
+    'seed': 0,                      # Trial i memakai seed + i (kecuali 'seed' ada di space)
+    'max_workers': None,            # None = semua core
+    'longest_first': True,          # Submit trial termahal lebih dulu
+    'successive_halving': False,    # Hentikan config yang kalah lebih awal
+    'min_epochs': 500,              # Budget rung pertama
+    'reduction_factor': 3,          # Simpan 1/N terbaik per rung, budget x N
+    'detailed_logs': False,
+    'output_dir': os.path.join(RESULTS_DIR, 'sweeps'),
+    'results_file': 'sweep_results.csv'
+}
+
+# Model-batched training configuration (train_batched.py)
+BATCHED_CONFIG = {
+    'num_models': 256,              # K model dilatih sekaligus sebagai stacked arrays
+    'base_seed': 0,                 # Model k memakai seed base_seed + k
+    'learning_rates': None,         # None = NETWORK_CONFIG['learning_rate'], atau list dengan K nilai
+    'loss_curves_file': 'batched_loss_curves.csv'
+}
+
+# Serving configuration (serve.py)
+SERVING_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8000,
+    'unix_socket': None,            # Path Unix socket, menggantikan host/port jika diisi
+    'max_batch_size': 256,          # Maks baris per micro-batch
+    'max_wait_us': 500,             # Maks waktu tunggu (mikrodetik) untuk mengisi batch
+    'max_body_bytes': 1 << 20       # Body request lebih besar dijawab 413 (Payload Too Large)
+}
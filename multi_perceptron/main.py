@@ -5,6 +5,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.trainer.trainer import MLPTrainer
 from src.data.dataset import XORDataset
+from src.data.streaming import StreamingDataset
 import config
 
 def main():
@@ -13,8 +14,17 @@ def main():
     print("Menggunakan struktur project yang terorganisir")
     print()
     
-    dataset = XORDataset()
-    training_data = dataset.get_data()
+    if config.DATASET_CONFIG.get('streaming'):
+        # Dataset besar: dibaca ulang per chunk setiap epoch
+        training_data = StreamingDataset(
+            os.path.join(config.INPUT_DIR, config.DATASET_CONFIG['xor_dataset_file']),
+            chunk_size=config.DATASET_CONFIG['chunk_size'],
+            input_size=config.NETWORK_CONFIG['input_size'],
+            output_size=config.NETWORK_CONFIG['output_size']
+        )
+    else:
+        dataset = XORDataset()
+        training_data = dataset.get_data()
     
     # Initialize trainer
     trainer = MLPTrainer(
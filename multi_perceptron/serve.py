@@ -0,0 +1,43 @@
+import argparse
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.network.inference import InferenceModel
+from src.serving.server import PredictionServer
+from src.utils.checkpoint import model_file_extension
+import config
+
+def main():
+    """Serve a trained model over HTTP with request micro-batching"""
+    serving = config.SERVING_CONFIG
+    parser = argparse.ArgumentParser(description="MLP prediction server")
+    model_format = config.LOGGING_CONFIG.get('model_format', 'json')
+    default_model = os.path.join(
+        config.MODELS_DIR,
+        config.LOGGING_CONFIG['final_model_file'].format(ext=model_file_extension(model_format))
+    )
+    parser.add_argument('--model', default=default_model)
+    parser.add_argument('--host', default=serving['host'])
+    parser.add_argument('--port', type=int, default=serving['port'])
+    parser.add_argument('--unix-socket', default=serving['unix_socket'])
+    parser.add_argument('--max-batch-size', type=int, default=serving['max_batch_size'])
+    parser.add_argument('--max-wait-us', type=int, default=serving['max_wait_us'])
+    parser.add_argument('--max-body-bytes', type=int, default=serving['max_body_bytes'])
+    args = parser.parse_args()
+    
+    model = InferenceModel.load(args.model)
+    server = PredictionServer(model, args.max_batch_size, args.max_wait_us, args.max_body_bytes)
+    
+    address = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"Serving {model} dari {args.model}")
+    print(f"Listening di {address} (POST /predict, GET /metrics, GET /health)")
+    
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix_socket))
+    except KeyboardInterrupt:
+        print("\nServer dihentikan")
+
+if __name__ == "__main__":
+    main()
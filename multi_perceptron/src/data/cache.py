@@ -0,0 +1,136 @@
+"""
+Binary dataset cache: source file (json/jsonl/csv) -> contiguous X.npy / Y.npy
+
+Nama cache berisi hash dari path, ukuran dan mtime file sumber, sehingga
+file sumber yang berubah otomatis memakai cache baru (cache lama dihapus).
+Cache dibaca dengan np.load(mmap_mode='r'): zero-copy, dan semua proses
+training berbagi satu salinan di page cache.
+"""
+import glob
+import hashlib
+import os
+import numpy as np
+from typing import Any, Iterator, Optional, Tuple
+from ..data.streaming import StreamingDataset
+
+def _path_hash(source_path: str) -> str:
+    """Hash of the absolute source path (identifies the cache family of one file)"""
+    return hashlib.sha256(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:12]
+
+def cache_key(source_path: str) -> str:
+    """Hash of the source path, size and mtime: changes whenever the file changes"""
+    stat = os.stat(source_path)
+    identity = f"{os.path.abspath(source_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+
+def cache_paths(source_path: str, cache_dir: str, dtype: Any = np.float64) -> Tuple[str, str]:
+    """Paths of the X and Y .npy files for the current version of source_path"""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    prefix = os.path.join(cache_dir, f"{stem}-{_path_hash(source_path)}")
+    base = f"{prefix}-{cache_key(source_path)}-{np.dtype(dtype).name}"
+    return f"{base}.X.npy", f"{base}.Y.npy"
+
+def _remove_stale(source_path: str, cache_dir: str, keep: Tuple[str, str]):
+    """Delete caches of older versions of the same source file"""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    pattern = os.path.join(cache_dir, f"{stem}-{_path_hash(source_path)}-*.npy")
+    for path in glob.glob(pattern):
+        if path not in keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def build_cache(source_path: str, x_path: str, y_path: str, dtype: Any = np.float64,
+                chunk_size: int = 1024, input_size: Optional[int] = None, output_size: Optional[int] = None):
+    """
+    Convert source_path into X/Y .npy files. Dua pass streaming: hitung jumlah
+    sample, lalu tulis per chunk ke np.memmap (memory dibatasi ukuran chunk).
+    File ditulis ke .tmp lalu os.replace agar proses lain tidak membaca cache setengah jadi.
+    """
+    dataset = StreamingDataset(source_path, chunk_size=chunk_size, input_size=input_size,
+                               output_size=output_size, dtype=dtype)
+    n_samples = sum(X.shape[0] for X, _ in dataset)
+    if n_samples == 0:
+        raise ValueError(f"Dataset kosong: {source_path}")
+
+    tmp_suffix = f".{os.getpid()}.tmp"
+    X_out = np.lib.format.open_memmap(x_path + tmp_suffix, mode='w+', dtype=dtype,
+                                      shape=(n_samples, dataset.input_size))
+    Y_out = np.lib.format.open_memmap(y_path + tmp_suffix, mode='w+', dtype=dtype,
+                                      shape=(n_samples, dataset.output_size))
+    start = 0
+    for X, Y in dataset:
+        X_out[start:start + X.shape[0]] = X
+        Y_out[start:start + Y.shape[0]] = Y
+        start += X.shape[0]
+    X_out.flush()
+    Y_out.flush()
+    del X_out, Y_out
+
+    os.replace(y_path + tmp_suffix, y_path)
+    os.replace(x_path + tmp_suffix, x_path)
+
+def load_cached_dataset(source_path: str, cache_dir: str, dtype: Any = np.float64,
+                        chunk_size: int = 1024, input_size: Optional[int] = None,
+                        output_size: Optional[int] = None) -> 'ArrayDataset':
+    """
+    Return the dataset backed by read-only memmaps, building the cache on
+    first use or when the source file changed. input_size / output_size
+    dibutuhkan untuk CSV (kolom input diikuti kolom target).
+    """
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"File dataset tidak ditemukan di '{source_path}'")
+    os.makedirs(cache_dir, exist_ok=True)
+    x_path, y_path = cache_paths(source_path, cache_dir, dtype)
+
+    if not (os.path.exists(x_path) and os.path.exists(y_path)):
+        build_cache(source_path, x_path, y_path, dtype, chunk_size, input_size, output_size)
+        _remove_stale(source_path, cache_dir, (x_path, y_path))
+
+    dataset = ArrayDataset.from_cache_files(x_path, y_path)
+    if (input_size is not None and dataset.X.shape[1] != input_size or
+            output_size is not None and dataset.Y.shape[1] != output_size):
+        # Cache dibuat dengan pembagian kolom lain (CSV dengan input_size berbeda): buat ulang
+        build_cache(source_path, x_path, y_path, dtype, chunk_size, input_size, output_size)
+        dataset = ArrayDataset.from_cache_files(x_path, y_path)
+    return dataset
+
+class ArrayDataset:
+    """
+    Dataset di atas array (N, input_size) / (N, output_size), mis. memmap dari cache.
+    Berperilaku seperti list of (inputs, targets) dengan shape (-1, 1) seperti
+    XORDataset, tetapi setiap sample adalah view (tanpa copy). Saat di-pickle
+    (mis. ke worker process) yang dikirim hanya path cache, sehingga worker
+    me-mmap file yang sama dan berbagi page cache.
+    """
+
+    def __init__(self, X: np.ndarray, Y: np.ndarray, cache_files: Optional[Tuple[str, str]] = None):
+        if X.shape[0] != Y.shape[0]:
+            raise ValueError(f"Jumlah baris X ({X.shape[0]}) dan Y ({Y.shape[0]}) berbeda")
+        self.X = X
+        self.Y = Y
+        self.cache_files = cache_files
+
+    @classmethod
+    def from_cache_files(cls, x_path: str, y_path: str) -> 'ArrayDataset':
+        """Map existing cache files read-only"""
+        return cls(np.load(x_path, mmap_mode='r'), np.load(y_path, mmap_mode='r'), (x_path, y_path))
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+    def __getitem__(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        return self.X[index].reshape(-1, 1), self.Y[index].reshape(-1, 1)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reduce__(self):
+        if self.cache_files is not None:
+            return (ArrayDataset.from_cache_files, self.cache_files)
+        return (ArrayDataset, (self.X, self.Y))
+
+    def __repr__(self) -> str:
+        return f"ArrayDataset({len(self)} samples, cache={self.cache_files})"
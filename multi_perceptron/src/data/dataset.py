@@ -1,8 +1,7 @@
-import numpy as np
 import os
-import json
-import random
 import config # Menggunakan variabel dari file config.py
+from ..data.streaming import StreamingDataset
+from ..data.cache import ArrayDataset, load_cached_dataset
 
 class XORDataset:
     """
@@ -27,26 +26,46 @@ class XORDataset:
         
         print(f"Membaca dataset dari: {file_path}")
         
+        # Cache .npy: load pertama mengonversi file, berikutnya hanya mmap
+        # (cache otomatis dibuat ulang jika file sumber berubah)
+        if config.DATASET_CONFIG.get('cache'):
+            try:
+                self.data = load_cached_dataset(
+                    file_path,
+                    config.DATASET_CONFIG.get('cache_dir') or config.CACHE_DIR,
+                    chunk_size=config.DATASET_CONFIG.get('chunk_size', 1024),
+                    input_size=config.NETWORK_CONFIG['input_size'],
+                    output_size=config.NETWORK_CONFIG['output_size']
+                )
+            except FileNotFoundError:
+                print(f"Error: File dataset tidak ditemukan di '{file_path}'")
+                print("Pastikan direktori 'data/input/' sudah ada dan berisi file JSON.")
+                raise
+            return
+        
+        # Dibaca per chunk lewat StreamingDataset (json, jsonl atau csv);
+        # file yang tidak ada menjadi FileNotFoundError, bukan exit()
         try:
-            with open(file_path, 'r') as f:
-                dataset = json.load(f)
+            dataset = StreamingDataset(file_path, chunk_size=config.DATASET_CONFIG.get('chunk_size', 1024),
+                                       input_size=config.NETWORK_CONFIG['input_size'],
+                                       output_size=config.NETWORK_CONFIG['output_size'])
         except FileNotFoundError:
             print(f"Error: File dataset tidak ditemukan di '{file_path}'")
             print("Pastikan direktori 'data/input/' sudah ada dan berisi file JSON.")
-            exit()
+            raise
 
-        # Ubah data dari JSON menjadi list of tuples (input_array, target_array)
-        for sample in dataset['samples']:
-            inputs = np.array(sample['input']).reshape(-1, 1)
-            targets = np.array(sample['target']).reshape(-1, 1)
-            self.data.append((inputs, targets))
+        # Ubah data menjadi list of tuples (input_array, target_array)
+        for X, Y in dataset:
+            for inputs, targets in zip(X, Y):
+                self.data.append((inputs.reshape(-1, 1), targets.reshape(-1, 1)))
 
     def get_data(self):
         """
-        Mengembalikan data training.
-        Data akan diacak jika 'shuffle_data' di config adalah True.
+        Mengembalikan data training dalam urutan file.
+        Pengacakan dilakukan trainer per epoch jika TRAINING_CONFIG['shuffle_data'] True.
         """
         # Buat salinan data agar tidak mengubah urutan asli di self.data
-        training_data = self.data.copy()
+        # (data dari cache adalah memmap read-only, tidak perlu disalin)
+        training_data = self.data if isinstance(self.data, ArrayDataset) else self.data.copy()
                     
         return training_data
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Data pipeline: shuffle per epoch lewat index permutation (data tidak disalin)
+dan perakitan batch di background thread dengan bounded prefetch queue
+"""
+import queue
+import threading
+import numpy as np
+from typing import Iterator, Optional, Tuple
+
+def epoch_permutation(seed: int, epoch: int, n_samples: int) -> np.ndarray:
+    """Sample order for one epoch; depends only on (seed, epoch) so resume replays the same order"""
+    return np.random.default_rng([seed, epoch]).permutation(n_samples)
+
+class BatchPrefetcher:
+    """
+    Iterator (X_batch, Y_batch) untuk satu epoch. Background thread mengumpulkan
+    baris batch berikutnya (np.take ke buffer yang dipakai ulang) selagi batch
+    sekarang dilatih. Queue dibatasi prefetch batch; ring buffer prefetch + 2
+    cukup karena buffer baru ditimpa setelah consumer mengambil batch sesudahnya.
+    Batch hanya valid sampai batch berikutnya diambil.
+    """
+
+    _DONE = object()
+
+    def __init__(self, X: np.ndarray, Y: np.ndarray, batch_size: int, order: np.ndarray, prefetch: int = 2):
+        if prefetch < 1:
+            raise ValueError(f"prefetch harus >= 1, bukan {prefetch}")
+        self.X = X
+        self.Y = Y
+        self.batch_size = batch_size
+        self.order = order
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._buffers = [
+            (np.empty((batch_size,) + X.shape[1:], dtype=X.dtype),
+             np.empty((batch_size,) + Y.shape[1:], dtype=Y.dtype))
+            for _ in range(prefetch + 2)
+        ]
+        self._thread = threading.Thread(target=self._produce, name='BatchPrefetcher', daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        """Blocking put that gives up when the consumer closed the iterator"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self):
+        try:
+            for batch, start in enumerate(range(0, len(self.order), self.batch_size)):
+                indices = self.order[start:start + self.batch_size]
+                X_buffer, Y_buffer = self._buffers[batch % len(self._buffers)]
+                X_batch, Y_batch = X_buffer[:len(indices)], Y_buffer[:len(indices)]
+                np.take(self.X, indices, axis=0, out=X_batch)
+                np.take(self.Y, indices, axis=0, out=Y_batch)
+                if not self._put((X_batch, Y_batch)):
+                    return
+            self._put(self._DONE)
+        except BaseException as e:
+            self._put(e)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the producer thread (also when the epoch is abandoned early)"""
+        self._stop.set()
+        self._thread.join()
+
+def iterate_batches(X: np.ndarray, Y: np.ndarray, batch_size: int, order: Optional[np.ndarray] = None,
+                    prefetch: int = 0) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Batches of one epoch. Tanpa order: slice berurutan (view, tanpa copy).
+    Dengan order: baris batch dikumpulkan sesuai permutation, di background
+    thread jika prefetch > 0.
+    """
+    n_samples = X.shape[0]
+    if order is None:
+        for start in range(0, n_samples, batch_size):
+            yield X[start:start + batch_size], Y[start:start + batch_size]
+    elif prefetch > 0:
+        yield from BatchPrefetcher(X, Y, batch_size, order, prefetch)
+    else:
+        for start in range(0, n_samples, batch_size):
+            indices = order[start:start + batch_size]
+            yield X[indices], Y[indices]
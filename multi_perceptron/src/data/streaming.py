@@ -0,0 +1,191 @@
+"""
+Streaming dataset: baca JSON Lines, CSV atau format {"samples": [...]} per chunk
+tanpa memuat seluruh file ke memory
+"""
+import csv
+import json
+import os
+import numpy as np
+from typing import Any, Iterator, List, Optional, Tuple
+
+DATASET_FORMATS = ('jsonl', 'csv', 'json')
+
+def detect_format(file_path: str) -> str:
+    """Guess the dataset format from the file extension"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if ext == '.csv':
+        return 'csv'
+    if ext == '.json':
+        return 'json'
+    raise ValueError(f"Format dataset tidak dikenali dari ekstensi '{ext}' (pilih {DATASET_FORMATS})")
+
+def _iter_jsonl(f) -> Iterator[Tuple[List[float], List[float]]]:
+    """One {"input": [...], "target": [...]} object per line"""
+    for line in f:
+        line = line.strip()
+        if line:
+            sample = json.loads(line)
+            yield sample['input'], sample['target']
+
+def _iter_csv(f, input_size: Optional[int]) -> Iterator[Tuple[List[float], List[float]]]:
+    """Numeric columns: input_size inputs followed by the targets; a non-numeric first row is a header"""
+    if input_size is None:
+        raise ValueError("Dataset CSV membutuhkan input_size")
+    for line_number, row in enumerate(csv.reader(f)):
+        if not row:
+            continue
+        try:
+            values = [float(value) for value in row]
+        except ValueError:
+            if line_number == 0:
+                continue
+            raise
+        yield values[:input_size], values[input_size:]
+
+def _iter_json_samples(f, read_size: int = 1 << 16) -> Iterator[Tuple[List[float], List[float]]]:
+    """
+    Incremental parser untuk {"samples": [{...}, ...]}: file dibaca per read_size
+    karakter dan setiap sample di-decode sendiri (raw_decode), sehingga memory
+    hanya sebesar buffer, bukan seluruh file. "samples" dicari sebagai key
+    top-level object; nilai key lain di-decode lalu dibuang.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+
+    def read_more() -> bool:
+        """Drop the consumed part of the buffer and append the next chunk"""
+        nonlocal buffer, pos, eof
+        buffer, pos = buffer[pos:], 0
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer += chunk
+        return not eof
+
+    def skip(chars: str = ' \t\r\n') -> str:
+        """Advance past chars, return the next character ('' at end of file)"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ''
+
+    def decode() -> Any:
+        """Decode the JSON value at pos, reading more while it is cut off by the buffer end"""
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # Angka di akhir buffer bisa saja belum lengkap
+                if end < len(buffer) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            read_more()
+
+    if skip() != '{':
+        raise ValueError("File JSON harus berupa object dengan array 'samples'")
+    pos += 1
+
+    # Cari key "samples" di top-level object
+    while True:
+        if skip(' \t\r\n,') != '"':
+            raise ValueError("File JSON tidak berisi array 'samples'")
+        key = decode()
+        if skip() != ':':
+            raise ValueError(f"File JSON tidak valid: ':' tidak ditemukan setelah key '{key}'")
+        pos += 1
+        if key == 'samples':
+            if skip() != '[':
+                raise ValueError("'samples' di file JSON harus berupa array")
+            pos += 1
+            break
+        skip()
+        decode()
+
+    while True:
+        # Lewati whitespace dan koma di antara sample
+        char = skip(' \t\r\n,')
+        if not char:
+            raise ValueError("File JSON terpotong: array 'samples' tidak ditutup")
+        if char == ']':
+            return
+        sample = decode()
+        yield sample['input'], sample['target']
+
+class StreamingDataset:
+    """
+    Dataset yang dibaca ulang dari file setiap pass dan menghasilkan
+    (X_batch, Y_batch) berukuran maksimal chunk_size baris.
+    Iterasi satu kali = satu pass (satu epoch); passes(n) untuk beberapa pass.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = 1024, file_format: Optional[str] = None,
+                 input_size: Optional[int] = None, output_size: Optional[int] = None,
+                 dtype: Any = np.float64):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File dataset tidak ditemukan di '{file_path}'")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size harus >= 1, bukan {chunk_size}")
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.file_format = file_format or detect_format(file_path)
+        if self.file_format not in DATASET_FORMATS:
+            raise ValueError(f"file_format harus salah satu dari {DATASET_FORMATS}, bukan '{self.file_format}'")
+        self.input_size = input_size
+        self.output_size = output_size
+        self.dtype = np.dtype(dtype)
+        self.num_samples = None     # diketahui setelah satu pass penuh
+
+    def samples(self) -> Iterator[Tuple[List[float], List[float]]]:
+        """Iterate over (inputs, targets) of one pass in file order"""
+        with open(self.file_path, 'r', newline='' if self.file_format == 'csv' else None,
+                  encoding='utf-8') as f:
+            if self.file_format == 'jsonl':
+                yield from _iter_jsonl(f)
+            elif self.file_format == 'csv':
+                yield from _iter_csv(f, self.input_size)
+            else:
+                yield from _iter_json_samples(f)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """One pass over the file as (X_batch, Y_batch) chunks"""
+        inputs, targets = [], []
+        count = 0
+        for x, y in self.samples():
+            if self.input_size is None:
+                self.input_size = len(x)
+            if self.output_size is None:
+                self.output_size = len(y)
+            if len(x) != self.input_size or len(y) != self.output_size:
+                raise ValueError(f"Sample {count} berukuran ({len(x)}, {len(y)}), "
+                                 f"diharapkan ({self.input_size}, {self.output_size})")
+            inputs.append(x)
+            targets.append(y)
+            count += 1
+            if len(inputs) == self.chunk_size:
+                yield self._to_arrays(inputs, targets)
+                inputs, targets = [], []
+        if inputs:
+            yield self._to_arrays(inputs, targets)
+        self.num_samples = count
+
+    def passes(self, num_passes: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Chunks of num_passes consecutive passes"""
+        for _ in range(num_passes):
+            yield from self
+
+    def _to_arrays(self, inputs: List[List[float]], targets: List[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert one chunk into contiguous (n, input_size) / (n, output_size) arrays"""
+        X = np.array(inputs, dtype=self.dtype).reshape(len(inputs), self.input_size)
+        Y = np.array(targets, dtype=self.dtype).reshape(len(targets), self.output_size)
+        return X, Y
+
+    def __repr__(self) -> str:
+        return f"StreamingDataset({self.file_path!r}, format={self.file_format}, chunk_size={self.chunk_size})"
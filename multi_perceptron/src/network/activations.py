@@ -3,6 +3,8 @@
 Activation functions and their derivatives
 """
 import math
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
 
 def sigmoid(x: float) -> float:
     """Sigmoid activation function"""
@@ -30,3 +32,161 @@ def tanh(x: float) -> float:
 def tanh_derivative(x: float) -> float:
     """Derivative of tanh function (assumes x is already tanh output)"""
     return 1.0 - x * x
+
+
+# ================================================================
+# Array-aware activations (dipakai oleh engine 'numpy')
+# Setiap fungsi menerima out=, scratch= dan mask= (bool, shape x) agar bisa
+# dipakai tanpa alokasi; out boleh sama dengan x (in-place).
+# Derivative dihitung dari OUTPUT activation, sama seperti versi scalar di atas.
+# ================================================================
+
+def _ensure_out(x: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Allocate an output buffer like x if none was given"""
+    return np.empty_like(x, dtype=np.result_type(x, np.float32)) if out is None else out
+
+def _negative_mask(x: np.ndarray, mask: Optional[np.ndarray]) -> np.ndarray:
+    """x < 0, written into mask if one was given"""
+    return np.less(x, 0, out=mask) if mask is not None else np.less(x, 0)
+
+def sigmoid_array(x: np.ndarray, out: np.ndarray = None, scratch: np.ndarray = None,
+                  mask: np.ndarray = None) -> np.ndarray:
+    """
+    Numerically stable sigmoid (split positive/negative formulation):
+    x >= 0: 1 / (1 + exp(-x)),  x < 0: exp(x) / (1 + exp(x))
+    Keduanya memakai z = exp(-|x|) sehingga exp tidak pernah overflow.
+    """
+    out = _ensure_out(x, out)
+    z = _ensure_out(x, scratch)
+    negative = _negative_mask(x, mask)
+    np.abs(x, out=z)
+    np.negative(z, out=z)
+    np.exp(z, out=z)
+    np.add(z, 1.0, out=out)
+    np.reciprocal(out, out=out)
+    np.multiply(out, z, out=out, where=negative)
+    return out
+
+def sigmoid_derivative_array(y: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Derivative of sigmoid from its output: y * (1 - y)"""
+    out = _ensure_out(y, out)
+    np.subtract(1.0, y, out=out)
+    out *= y
+    return out
+
+def tanh_array(x: np.ndarray, out: np.ndarray = None, scratch: np.ndarray = None,
+               mask: np.ndarray = None) -> np.ndarray:
+    """Tanh activation"""
+    return np.tanh(x, out=_ensure_out(x, out))
+
+def tanh_derivative_array(y: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Derivative of tanh from its output: 1 - y^2"""
+    out = _ensure_out(y, out)
+    np.multiply(y, y, out=out)
+    np.subtract(1.0, out, out=out)
+    return out
+
+def relu_array(x: np.ndarray, out: np.ndarray = None, scratch: np.ndarray = None,
+               mask: np.ndarray = None) -> np.ndarray:
+    """ReLU activation"""
+    return np.maximum(x, 0.0, out=_ensure_out(x, out))
+
+def relu_derivative_array(y: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Derivative of ReLU from its output: 1 if y > 0 else 0"""
+    return np.greater(y, 0.0, out=_ensure_out(y, out))
+
+LEAKY_RELU_ALPHA = 0.01
+
+def leaky_relu_array(x: np.ndarray, out: np.ndarray = None, scratch: np.ndarray = None,
+                     mask: np.ndarray = None) -> np.ndarray:
+    """Leaky ReLU activation: x if x > 0 else alpha * x"""
+    out = _ensure_out(x, out)
+    negative = _negative_mask(x, mask)
+    if out is not x:
+        np.copyto(out, x)
+    np.multiply(out, LEAKY_RELU_ALPHA, out=out, where=negative)
+    return out
+
+def leaky_relu_derivative_array(y: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Derivative of leaky ReLU from its output: 1 if y > 0 else alpha"""
+    out = _ensure_out(y, out)
+    np.greater(y, 0.0, out=out)
+    out *= 1.0 - LEAKY_RELU_ALPHA
+    out += LEAKY_RELU_ALPHA
+    return out
+
+def softplus_array(x: np.ndarray, out: np.ndarray = None, scratch: np.ndarray = None,
+                   mask: np.ndarray = None) -> np.ndarray:
+    """Numerically stable softplus: max(x, 0) + log1p(exp(-|x|))"""
+    out = _ensure_out(x, out)
+    tmp = _ensure_out(x, scratch)
+    np.abs(x, out=tmp)
+    np.negative(tmp, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.log1p(tmp, out=tmp)
+    np.maximum(x, 0.0, out=out)
+    out += tmp
+    return out
+
+def softplus_derivative_array(y: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Derivative of softplus from its output: sigmoid(x) = 1 - exp(-y)"""
+    out = _ensure_out(y, out)
+    np.negative(y, out=out)
+    np.expm1(out, out=out)
+    np.negative(out, out=out)
+    return out
+
+class Activation:
+    """Array activation function bundled with its derivative (from output)"""
+
+    def __init__(self, name: str, forward: Callable, derivative: Callable):
+        self.name = name
+        self.forward = forward
+        self.derivative = derivative
+
+    def __call__(self, x: np.ndarray, out: np.ndarray = None, mask: np.ndarray = None) -> np.ndarray:
+        """Apply the activation to a whole layer"""
+        return self.forward(x, out, None, mask)
+
+    def forward_with_derivative(self, x: np.ndarray, out: np.ndarray = None,
+                                derivative_out: np.ndarray = None,
+                                mask: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fused activation + derivative: derivative_out dipakai sebagai scratch
+        saat forward, lalu diisi derivative dari output. mask: bool buffer seperti x.
+        """
+        derivative_out = _ensure_out(x, derivative_out)
+        out = self.forward(x, out, derivative_out, mask)
+        self.derivative(out, derivative_out)
+        return out, derivative_out
+
+    def __repr__(self) -> str:
+        return f"Activation({self.name!r})"
+
+ACTIVATIONS: Dict[str, Activation] = {
+    'sigmoid': Activation('sigmoid', sigmoid_array, sigmoid_derivative_array),
+    'tanh': Activation('tanh', tanh_array, tanh_derivative_array),
+    'relu': Activation('relu', relu_array, relu_derivative_array),
+    'leaky_relu': Activation('leaky_relu', leaky_relu_array, leaky_relu_derivative_array),
+    'softplus': Activation('softplus', softplus_array, softplus_derivative_array),
+}
+
+# Versi scalar (engine 'python'): (activation, derivative dari output)
+SCALAR_ACTIVATIONS = {
+    'sigmoid': (sigmoid, sigmoid_derivative),
+    'tanh': (tanh, tanh_derivative),
+    'relu': (relu, relu_derivative),
+}
+
+def get_activation(name: str) -> Activation:
+    """Look up an array activation by name"""
+    if name not in ACTIVATIONS:
+        raise ValueError(f"Unknown activation '{name}'. Available: {sorted(ACTIVATIONS)}")
+    return ACTIVATIONS[name]
+
+def get_scalar_activation(name: str) -> Tuple[Callable, Callable]:
+    """Look up a scalar (activation, derivative) pair by name"""
+    if name not in SCALAR_ACTIVATIONS:
+        raise ValueError(f"Activation '{name}' tidak tersedia untuk engine 'python'. "
+                         f"Available: {sorted(SCALAR_ACTIVATIONS)}")
+    return SCALAR_ACTIVATIONS[name]
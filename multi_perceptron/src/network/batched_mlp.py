@@ -0,0 +1,179 @@
+"""
+Model-batched MLP: K jaringan independen dengan arsitektur sama, dilatih sekaligus
+"""
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple, Union
+from ..network.activations import get_activation
+from ..network.initializers import get_initializer
+from ..network.vectorized_mlp import VectorizedMLP
+
+class BatchedMLP:
+    """
+    K MLP yang disimpan sebagai stacked arrays: weights (K, input, hidden),
+    (K, hidden, output), biases (K, hidden), (K, output). Setiap forward/backward
+    step adalah satu batched matmul atas semua K model, sehingga overhead Python
+    per step dibagi ke K model. Model k identik dengan
+    VectorizedMLP(seed=seeds[k], learning_rate=learning_rates[k]).
+    """
+
+    def __init__(self, seeds: Sequence[int], input_size: int, hidden_size: int, output_size: int,
+                 learning_rate: Union[float, Sequence[float]] = 0.5,
+                 weight_init_range: Tuple[float, float] = (-1.0, 1.0),
+                 bias_init_value: float = 0.0,
+                 hidden_activation: str = 'sigmoid',
+                 output_activation: str = 'sigmoid',
+                 dtype: str = 'float64',
+                 weight_init: str = 'uniform'):
+        """Initialize every model from its own seeded Generator"""
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype harus float32 atau float64, bukan '{dtype}'")
+
+        self.seeds = [int(seed) for seed in seeds]
+        self.num_models = len(self.seeds)
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.output_size = output_size
+        self.weight_init_range = weight_init_range
+        self.bias_init_value = bias_init_value
+        self.weight_init = weight_init
+        self.hidden_activation = hidden_activation
+        self.output_activation = output_activation
+        self._hidden_act = get_activation(hidden_activation)
+        self._output_act = get_activation(output_activation)
+
+        self.learning_rates = np.broadcast_to(
+            np.asarray(learning_rate, dtype=self.dtype), (self.num_models,)).copy()
+        if self.learning_rates.shape != (self.num_models,):
+            raise ValueError("learning_rate harus scalar atau satu nilai per model")
+
+        # Parameter setiap model adalah satu baris flat_parameters (K, P);
+        # weights dan biases adalah view dengan shape (K, ...)
+        self.flat_parameters = np.empty((self.num_models, self.num_parameters), dtype=self.dtype)
+        for name, view in self.split_parameters(self.flat_parameters).items():
+            setattr(self, name, view)
+
+        initializer = get_initializer(weight_init)
+        for k, seed in enumerate(self.seeds):
+            rng = np.random.default_rng(seed)
+            self.weights_input_hidden[k] = initializer(rng, input_size, hidden_size, weight_init_range)
+            self.weights_hidden_output[k] = initializer(rng, hidden_size, output_size, weight_init_range)
+        self.bias_hidden[...] = bias_init_value
+        self.bias_output[...] = bias_init_value
+
+        self._buffers = None
+
+    def parameter_shapes(self) -> Dict[str, Tuple[int, ...]]:
+        """Per-model shape of every parameter, same order as VectorizedMLP"""
+        return {
+            'weights_input_hidden': (self.input_size, self.hidden_size),
+            'weights_hidden_output': (self.hidden_size, self.output_size),
+            'bias_hidden': (self.hidden_size,),
+            'bias_output': (self.output_size,)
+        }
+
+    @property
+    def num_parameters(self) -> int:
+        """Number of weights and biases of one model"""
+        return sum(int(np.prod(shape)) for shape in self.parameter_shapes().values())
+
+    def split_parameters(self, flat: np.ndarray) -> Dict[str, np.ndarray]:
+        """Split (K, P) into views with shapes (K, ...)"""
+        views = {}
+        offset = 0
+        for name, shape in self.parameter_shapes().items():
+            size = int(np.prod(shape))
+            views[name] = flat[:, offset:offset + size].reshape((flat.shape[0],) + shape)
+            offset += size
+        return views
+
+    def _allocate_buffers(self, n_samples: int) -> Dict[str, np.ndarray]:
+        """Per-step buffers (K, n, layer) and gradients (K, P), reused across steps"""
+        K, dtype = self.num_models, self.dtype
+        buffers = {
+            'hidden': np.empty((K, n_samples, self.hidden_size), dtype=dtype),
+            'hidden_derivatives': np.empty((K, n_samples, self.hidden_size), dtype=dtype),
+            'output': np.empty((K, n_samples, self.output_size), dtype=dtype),
+            'output_derivatives': np.empty((K, n_samples, self.output_size), dtype=dtype),
+            'output_errors': np.empty((K, n_samples, self.output_size), dtype=dtype),
+            'hidden_errors': np.empty((K, n_samples, self.hidden_size), dtype=dtype),
+            'hidden_mask': np.empty((K, n_samples, self.hidden_size), dtype=bool),
+            'output_mask': np.empty((K, n_samples, self.output_size), dtype=bool),
+            'losses': np.empty(K, dtype=dtype),
+            'gradients': np.empty((K, self.num_parameters), dtype=dtype),
+        }
+        buffers['grads'] = self.split_parameters(buffers['gradients'])
+        return buffers
+
+    def forward_batch(self, X: np.ndarray) -> np.ndarray:
+        """Outputs of all K models for X (N, input_size), returns (K, N, output_size)"""
+        hidden = np.matmul(X, self.weights_input_hidden)
+        hidden += self.bias_hidden[:, None, :]
+        self._hidden_act(hidden, out=hidden)
+        output = np.matmul(hidden, self.weights_hidden_output)
+        output += self.bias_output[:, None, :]
+        return self._output_act(output, out=output)
+
+    def train_step(self, X: np.ndarray, T: np.ndarray, active: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Satu SGD step untuk semua K model pada batch X (N, input), T (N, output).
+        active (K,) bool: model yang tidak aktif tidak di-update (mis. sudah early stop).
+        Returns: jumlah MSE per sample untuk setiap model, shape (K,)
+        """
+        n_samples = X.shape[0]
+        if self._buffers is None or self._buffers['hidden'].shape[1] != n_samples:
+            self._buffers = self._allocate_buffers(n_samples)
+        buf = self._buffers
+        hidden, hidden_derivatives = buf['hidden'], buf['hidden_derivatives']
+        output, output_derivatives = buf['output'], buf['output_derivatives']
+        output_errors, hidden_errors, grads = buf['output_errors'], buf['hidden_errors'], buf['grads']
+
+        # Forward: (N, in) @ (K, in, hidden) -> (K, N, hidden)
+        np.matmul(X, self.weights_input_hidden, out=hidden)
+        hidden += self.bias_hidden[:, None, :]
+        self._hidden_act.forward_with_derivative(hidden, hidden, hidden_derivatives, buf['hidden_mask'])
+
+        np.matmul(hidden, self.weights_hidden_output, out=output)
+        output += self.bias_output[:, None, :]
+        self._output_act.forward_with_derivative(output, output, output_derivatives, buf['output_mask'])
+
+        # Loss per model dan output delta
+        np.subtract(T, output, out=output_errors)
+        np.einsum('knj,knj->k', output_errors, output_errors, out=buf['losses'])
+        losses = buf['losses'] / self.output_size
+        output_errors *= output_derivatives
+
+        np.matmul(output_errors, self.weights_hidden_output.transpose(0, 2, 1), out=hidden_errors)
+        hidden_errors *= hidden_derivatives
+
+        # Gradient per model (dijumlah atas batch), lalu update dengan learning rate per model
+        np.matmul(X.T, hidden_errors, out=grads['weights_input_hidden'])
+        np.matmul(hidden.transpose(0, 2, 1), output_errors, out=grads['weights_hidden_output'])
+        np.sum(hidden_errors, axis=1, out=grads['bias_hidden'])
+        np.sum(output_errors, axis=1, out=grads['bias_output'])
+
+        step = self.learning_rates / n_samples
+        if active is not None:
+            step = np.where(active, step, 0.0)
+        buf['gradients'] *= step[:, None]
+        self.flat_parameters += buf['gradients']
+
+        return losses
+
+    def model(self, k: int) -> VectorizedMLP:
+        """Export model k as a standalone VectorizedMLP (copy of its parameters)"""
+        mlp = VectorizedMLP(self.input_size, self.hidden_size, self.output_size,
+                            learning_rate=float(self.learning_rates[k]),
+                            weight_init_range=self.weight_init_range,
+                            bias_init_value=self.bias_init_value,
+                            hidden_activation=self.hidden_activation,
+                            output_activation=self.output_activation,
+                            dtype=self.dtype.name,
+                            weight_init=self.weight_init,
+                            seed=self.seeds[k])
+        mlp.flat_parameters[...] = self.flat_parameters[k]
+        return mlp
+
+    def __repr__(self) -> str:
+        return (f"BatchedMLP({self.num_models} x {self.input_size} -> {self.hidden_size} -> "
+                f"{self.output_size}, {self.hidden_activation}/{self.output_activation}, {self.dtype.name})")
@@ -0,0 +1,33 @@
+"""
+Network factory: pilih engine MLP berdasarkan NETWORK_CONFIG
+"""
+from typing import Dict, Any
+from ..network.mlp import MLP
+from ..network.vectorized_mlp import VectorizedMLP
+from ..utils.checkpoint import load_model_dict
+
+# Engine yang tersedia: 'python' (nested list, per-neuron loop) dan 'numpy' (matmul)
+ENGINES = {
+    'python': MLP,
+    'numpy': VectorizedMLP
+}
+
+def get_engine_class(engine: str):
+    """Return the MLP class for the given engine name"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Available: {sorted(ENGINES)}")
+    return ENGINES[engine]
+
+def create_network(network_config: Dict[str, Any]) -> MLP:
+    """Create an MLP from NETWORK_CONFIG (key 'engine' selects the implementation)"""
+    params = dict(network_config)
+    engine = params.pop('engine', 'python')
+    return get_engine_class(engine)(**params)
+
+def network_from_dict(data: Dict[str, Any]) -> MLP:
+    """Rebuild a saved model with the engine it was saved from"""
+    return get_engine_class(data.get('engine', 'python')).from_dict(data)
+
+def load_network(filepath: str) -> MLP:
+    """Load a trainable model from a binary checkpoint or JSON file"""
+    return network_from_dict(load_model_dict(filepath, mmap=False))
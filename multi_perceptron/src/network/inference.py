@@ -0,0 +1,161 @@
+"""
+Frozen, read-only inference model exported from a trained MLP
+"""
+import numpy as np
+from typing import Any, Dict, Optional
+from ..network.activations import Activation, get_activation
+from ..utils.checkpoint import load_model_dict
+
+def forward_chunked(X: np.ndarray, weights_input_hidden: np.ndarray, bias_hidden: np.ndarray,
+                    weights_hidden_output: np.ndarray, bias_output: np.ndarray,
+                    hidden_act: Activation, output_act: Activation,
+                    dtype=np.float64, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Forward pass untuk setiap baris X (N, input_size), diproses per chunk.
+    Hanya satu buffer hidden berukuran chunk yang dialokasikan; output
+    ditulis langsung ke array hasil (N, output_size).
+    """
+    n_samples = X.shape[0]
+    outputs = np.empty((n_samples, weights_hidden_output.shape[1]), dtype=dtype)
+    if n_samples == 0:
+        return outputs
+
+    chunk = n_samples if not chunk_size else min(chunk_size, n_samples)
+    hidden = np.empty((chunk, weights_input_hidden.shape[1]), dtype=dtype)
+
+    for start in range(0, n_samples, chunk):
+        stop = min(start + chunk, n_samples)
+        x = np.asarray(X[start:stop], dtype=dtype)
+        h = hidden[:stop - start]
+        np.matmul(x, weights_input_hidden, out=h)
+        h += bias_hidden
+        hidden_act(h, out=h)
+
+        o = outputs[start:stop]
+        np.matmul(h, weights_hidden_output, out=o)
+        o += bias_output
+        output_act(o, out=o)
+
+    return outputs
+
+def _squeeze_trailing(values: Any, dtype) -> np.ndarray:
+    """Drop trailing size-1 axes, e.g. the (n,1) nesting left by column-vector inputs"""
+    arr = np.asarray(values, dtype=dtype)
+    while arr.ndim > 1 and arr.shape[-1] == 1:
+        arr = arr[..., 0]
+    return arr
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Return a C-contiguous, non-writeable copy of arr (read-only views, e.g. memmap, are kept as is)"""
+    if not arr.flags.writeable and arr.flags.c_contiguous:
+        return arr
+    arr = np.array(arr, order='C', copy=True)
+    arr.setflags(write=False)
+    return arr
+
+class InferenceModel:
+    """
+    Model read-only untuk inference: hanya forward pass.
+    Semua parameter C-contiguous dan non-writeable sehingga aman
+    dipakai bersama dari banyak thread.
+    """
+
+    def __init__(self, weights_input_hidden: Any, weights_hidden_output: Any,
+                 bias_hidden: Any, bias_output: Any,
+                 hidden_activation: str = 'sigmoid', output_activation: str = 'sigmoid',
+                 dtype: str = 'float64'):
+        """Validate shapes and freeze the parameters"""
+        self.dtype = np.dtype(dtype)
+
+        w_ih = _squeeze_trailing(weights_input_hidden, self.dtype)
+        w_ho = _squeeze_trailing(weights_hidden_output, self.dtype)
+        b_h = _squeeze_trailing(bias_hidden, self.dtype).reshape(-1)
+        b_o = _squeeze_trailing(bias_output, self.dtype).reshape(-1)
+
+        # weights_hidden_output (hidden, 1) ter-squeeze menjadi (hidden,)
+        if w_ho.ndim == 1:
+            w_ho = w_ho.reshape(-1, 1)
+        if w_ih.ndim == 1:
+            w_ih = w_ih.reshape(-1, 1)
+
+        if w_ih.ndim != 2 or w_ho.ndim != 2:
+            raise ValueError("Weights harus berupa matrix 2-D")
+        if w_ih.shape[1] != w_ho.shape[0] or w_ih.shape[1] != b_h.size:
+            raise ValueError(f"Hidden size tidak konsisten: weights_input_hidden {w_ih.shape}, "
+                             f"weights_hidden_output {w_ho.shape}, bias_hidden {b_h.shape}")
+        if w_ho.shape[1] != b_o.size:
+            raise ValueError(f"Output size tidak konsisten: weights_hidden_output {w_ho.shape}, "
+                             f"bias_output {b_o.shape}")
+
+        self.weights_input_hidden = _frozen(w_ih)
+        self.weights_hidden_output = _frozen(w_ho)
+        self.bias_hidden = _frozen(b_h)
+        self.bias_output = _frozen(b_o)
+
+        self.hidden_activation = hidden_activation
+        self.output_activation = output_activation
+        self._hidden_act = get_activation(hidden_activation)
+        self._output_act = get_activation(output_activation)
+
+    @property
+    def input_size(self) -> int:
+        return self.weights_input_hidden.shape[0]
+
+    @property
+    def hidden_size(self) -> int:
+        return self.weights_input_hidden.shape[1]
+
+    @property
+    def output_size(self) -> int:
+        return self.weights_hidden_output.shape[1]
+
+    @classmethod
+    def from_mlp(cls, mlp) -> 'InferenceModel':
+        """Freeze the current parameters of a trained MLP (either engine)"""
+        return cls(mlp.weights_input_hidden, mlp.weights_hidden_output,
+                   mlp.bias_hidden, mlp.bias_output,
+                   hidden_activation=getattr(mlp, 'hidden_activation', 'sigmoid'),
+                   output_activation=getattr(mlp, 'output_activation', 'sigmoid'),
+                   dtype=getattr(mlp, 'dtype', np.float64))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InferenceModel':
+        """Build from a dictionary produced by MLP.to_dict"""
+        model = cls(data['weights_input_hidden'], data['weights_hidden_output'],
+                    data['bias_hidden'], data['bias_output'],
+                    hidden_activation=data.get('hidden_activation', 'sigmoid'),
+                    output_activation=data.get('output_activation', 'sigmoid'),
+                    dtype=data.get('dtype', 'float64'))
+        if (model.input_size, model.hidden_size, model.output_size) != \
+                (data['input_size'], data['hidden_size'], data['output_size']):
+            raise ValueError("Ukuran layer di file tidak cocok dengan shape weights")
+        return model
+
+    @classmethod
+    def load(cls, filepath: str, mmap: bool = True) -> 'InferenceModel':
+        """
+        Load a model saved by MLPTrainer.save_model (binary checkpoint atau JSON).
+        Binary checkpoint di-memory-map: parameter adalah view read-only dari file.
+        """
+        return cls.from_dict(load_model_dict(filepath, mmap=mmap))
+
+    def predict(self, inputs: Any) -> np.ndarray:
+        """Predict a single input row, returns (output_size,)"""
+        x = np.asarray(inputs, dtype=self.dtype).reshape(-1)
+        h = x @ self.weights_input_hidden
+        h += self.bias_hidden
+        self._hidden_act(h, out=h)
+        o = h @ self.weights_hidden_output
+        o += self.bias_output
+        self._output_act(o, out=o)
+        return o
+
+    def predict_batch(self, X: np.ndarray, chunk_size: Optional[int] = None) -> np.ndarray:
+        """Predict every row of X (N, input_size), returns (N, output_size)"""
+        return forward_chunked(X, self.weights_input_hidden, self.bias_hidden,
+                               self.weights_hidden_output, self.bias_output,
+                               self._hidden_act, self._output_act, self.dtype, chunk_size)
+
+    def __repr__(self) -> str:
+        return (f"InferenceModel({self.input_size} -> {self.hidden_size} -> {self.output_size}, "
+                f"{self.hidden_activation}/{self.output_activation}, {self.dtype.name})")
@@ -0,0 +1,52 @@
+"""
+Weight initialization schemes, semuanya memakai numpy Generator milik model
+"""
+import numpy as np
+from typing import Callable, Dict, Tuple
+
+def uniform_init(rng: np.random.Generator, fan_in: int, fan_out: int,
+                 init_range: Tuple[float, float] = (-1.0, 1.0)) -> np.ndarray:
+    """Uniform over the configured weight_init_range"""
+    min_w, max_w = init_range
+    return rng.uniform(min_w, max_w, size=(fan_in, fan_out))
+
+def xavier_uniform_init(rng, fan_in, fan_out, init_range=None):
+    """Xavier/Glorot uniform: U(-a, a), a = sqrt(6 / (fan_in + fan_out))"""
+    limit = np.sqrt(6.0 / (fan_in + fan_out))
+    return rng.uniform(-limit, limit, size=(fan_in, fan_out))
+
+def xavier_normal_init(rng, fan_in, fan_out, init_range=None):
+    """Xavier/Glorot normal: N(0, 2 / (fan_in + fan_out))"""
+    return rng.normal(0.0, np.sqrt(2.0 / (fan_in + fan_out)), size=(fan_in, fan_out))
+
+def he_uniform_init(rng, fan_in, fan_out, init_range=None):
+    """He uniform (untuk relu): U(-a, a), a = sqrt(6 / fan_in)"""
+    limit = np.sqrt(6.0 / fan_in)
+    return rng.uniform(-limit, limit, size=(fan_in, fan_out))
+
+def he_normal_init(rng, fan_in, fan_out, init_range=None):
+    """He normal (untuk relu): N(0, 2 / fan_in)"""
+    return rng.normal(0.0, np.sqrt(2.0 / fan_in), size=(fan_in, fan_out))
+
+def orthogonal_init(rng, fan_in, fan_out, init_range=None):
+    """(Semi-)orthogonal matrix dari QR decomposition sebuah Gaussian matrix"""
+    rows, cols = max(fan_in, fan_out), min(fan_in, fan_out)
+    q, r = np.linalg.qr(rng.standard_normal((rows, cols)))
+    # Koreksi tanda agar distribusinya uniform (Haar)
+    q *= np.sign(np.diag(r))
+    return q if fan_in >= fan_out else q.T
+
+INITIALIZERS: Dict[str, Callable[..., np.ndarray]] = {
+    'uniform': uniform_init,
+    'xavier': xavier_uniform_init,
+    'xavier_normal': xavier_normal_init,
+    'he': he_uniform_init,
+    'he_normal': he_normal_init,
+    'orthogonal': orthogonal_init,
+}
+
+def get_initializer(name: str) -> Callable[..., np.ndarray]:
+    """Look up a weight initializer by name"""
+    if name not in INITIALIZERS:
+        raise ValueError(f"Unknown weight_init '{name}'. Available: {sorted(INITIALIZERS)}")
+    return INITIALIZERS[name]
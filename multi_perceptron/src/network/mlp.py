@@ -5,8 +5,9 @@ Multi-Layer Perceptron implementation
 import random
 import json
 import numpy as np
-from typing import List, Tuple, Dict, Any
-from ..network.activations import sigmoid, sigmoid_derivative
+from typing import List, Tuple, Dict, Any, Optional
+from ..network.activations import get_scalar_activation
+from ..network.initializers import get_initializer
 
 class MLP:
     """Multi-Layer Perceptron implementation from scratch"""
@@ -14,29 +15,73 @@ class MLP:
     def __init__(self, input_size: int, hidden_size: int, output_size: int, 
                  learning_rate: float = 0.5, 
                  weight_init_range: Tuple[float, float] = (-1.0, 1.0),
-                 bias_init_value: float = 0.0):
-        """Initialize MLP with random weights and specified biases"""
+                 bias_init_value: float = 0.0,
+                 hidden_activation: str = 'sigmoid',
+                 output_activation: str = 'sigmoid',
+                 dtype: str = 'float64',
+                 weight_init: str = 'uniform',
+                 seed: Optional[int] = None,
+                 parameters: Optional[Dict[str, Any]] = None):
+        """
+        Initialize MLP with random weights and specified biases.
+        parameters (weights/biases dari checkpoint): dipakai langsung, tanpa random init.
+        """
+        if dtype != 'float64':
+            raise ValueError("Engine 'python' hanya mendukung dtype float64 (Python float)")
+        
         self.input_size = input_size
         self.hidden_size = hidden_size
         self.output_size = output_size
         self.learning_rate = learning_rate
         
-        # Initialize weights with small random values
-        min_w, max_w = weight_init_range
-        self.weights_input_hidden = [[random.uniform(min_w, max_w) for _ in range(hidden_size)] 
-                                   for _ in range(input_size)]
-        self.weights_hidden_output = [[random.uniform(min_w, max_w) for _ in range(output_size)] 
-                                    for _ in range(hidden_size)]
+        # Activation per layer (nama dari registry di activations.py)
+        self.hidden_activation = hidden_activation
+        self.output_activation = output_activation
+        self._set_activations()
+        
+        # Random generator per model: hasil init hanya bergantung pada seed,
+        # bukan pada state global modul random
+        self.weight_init = weight_init
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        initializer = get_initializer(weight_init)
+        
+        if parameters is not None:
+            # Load dari checkpoint: global random dan rng tidak dipakai
+            self.weights_input_hidden = parameters['weights_input_hidden']
+            self.weights_hidden_output = parameters['weights_hidden_output']
+            self.bias_hidden = parameters['bias_hidden']
+            self.bias_output = parameters['bias_output']
+            return
+        
+        if weight_init == 'uniform' and seed is None:
+            # Perilaku lama: global random.uniform atas weight_init_range
+            min_w, max_w = weight_init_range
+            self.weights_input_hidden = [[random.uniform(min_w, max_w) for _ in range(hidden_size)] 
+                                       for _ in range(input_size)]
+            self.weights_hidden_output = [[random.uniform(min_w, max_w) for _ in range(output_size)] 
+                                        for _ in range(hidden_size)]
+        else:
+            # Xavier/Glorot, He, orthogonal (atau uniform dengan seed)
+            self.weights_input_hidden = initializer(self.rng, input_size, hidden_size, weight_init_range).tolist()
+            self.weights_hidden_output = initializer(self.rng, hidden_size, output_size, weight_init_range).tolist()
         
         # Initialize biases to the specified value
         self.bias_hidden = [bias_init_value] * hidden_size
         self.bias_output = [bias_init_value] * output_size
     
+    def _set_activations(self):
+        """Resolve the configured activation names into functions"""
+        self._hidden_fn, self._hidden_derivative = get_scalar_activation(self.hidden_activation)
+        self._output_fn, self._output_derivative = get_scalar_activation(self.output_activation)
+    
     def forward_pass(self, inputs: List[float]) -> Tuple[List[float], List[float], List[float], List[float]]:
         """
         Perform forward pass through the network
         Returns: (hidden_inputs, hidden_outputs, output_inputs, final_outputs)
         """
+        inputs = _as_floats(inputs)
+        
         # Calculate hidden layer
         hidden_inputs = []
         hidden_outputs = []
@@ -46,7 +91,7 @@ class MLP:
                              for i in range(self.input_size))
             weighted_sum += self.bias_hidden[j]
             hidden_inputs.append(weighted_sum)
-            hidden_outputs.append(sigmoid(weighted_sum))
+            hidden_outputs.append(self._hidden_fn(weighted_sum))
         
         # Calculate output layer
         output_inputs = []
@@ -57,56 +102,65 @@ class MLP:
                              for j in range(self.hidden_size))
             weighted_sum += self.bias_output[k]
             output_inputs.append(weighted_sum)
-            final_outputs.append(sigmoid(weighted_sum))
+            final_outputs.append(self._output_fn(weighted_sum))
         
         return hidden_inputs, hidden_outputs, output_inputs, final_outputs
     
     def backward_pass(self, inputs: List[float], hidden_outputs: List[float], 
-                     final_outputs: List[float], targets: List[float]) -> Dict[str, Any]:
+                     final_outputs: List[float], targets: List[float],
+                     trace: bool = True) -> Optional[Dict[str, Any]]:
         """
-        Perform backpropagation and return detailed calculations
+        Perform backpropagation and return detailed calculations.
+        With trace=False nothing is built for logging and None is returned.
         """
-        calculations = {
-            'output_errors': [],
-            'hidden_errors': [],
-            'weight_updates': {
-                'hidden_to_output': [],
-                'input_to_hidden': []
-            },
-            'bias_updates': {
-                'output': [],
-                'hidden': []
+        inputs, targets = _as_floats(inputs), _as_floats(targets)
+        calculations = None
+        if trace:
+            calculations = {
+                'output_errors': [],
+                'hidden_errors': [],
+                'weight_updates': {
+                    'hidden_to_output': [],
+                    'input_to_hidden': []
+                },
+                'bias_updates': {
+                    'output': [],
+                    'hidden': []
+                }
             }
-        }
         
         # Calculate output layer errors
         output_errors = []
         for k in range(self.output_size):
-            error = (targets[k] - final_outputs[k]) * sigmoid_derivative(final_outputs[k])
+            raw_error = targets[k] - final_outputs[k]
+            derivative = self._output_derivative(final_outputs[k])
+            error = raw_error * derivative
             output_errors.append(error)
-            calculations['output_errors'].append({
-                'neuron': k,
-                'target': targets[k],
-                'prediction': final_outputs[k],
-                'raw_error': targets[k] - final_outputs[k],
-                'sigmoid_derivative': sigmoid_derivative(final_outputs[k]),
-                'final_error': error
-            })
+            if trace:
+                calculations['output_errors'].append({
+                    'neuron': k,
+                    'target': targets[k],
+                    'prediction': final_outputs[k],
+                    'raw_error': raw_error,
+                    'sigmoid_derivative': derivative,
+                    'final_error': error
+                })
         
         # Calculate hidden layer errors
         hidden_errors = []
         for j in range(self.hidden_size):
-            error = sum(output_errors[k] * self.weights_hidden_output[j][k] 
-                       for k in range(self.output_size))
-            error *= sigmoid_derivative(hidden_outputs[j])
+            error_sum = sum(output_errors[k] * self.weights_hidden_output[j][k] 
+                            for k in range(self.output_size))
+            derivative = self._hidden_derivative(hidden_outputs[j])
+            error = error_sum * derivative
             hidden_errors.append(error)
-            calculations['hidden_errors'].append({
-                'neuron': j,
-                'error_sum': sum(output_errors[k] * self.weights_hidden_output[j][k] 
-                               for k in range(self.output_size)),
-                'sigmoid_derivative': sigmoid_derivative(hidden_outputs[j]),
-                'final_error': error
-            })
+            if trace:
+                calculations['hidden_errors'].append({
+                    'neuron': j,
+                    'error_sum': error_sum,
+                    'sigmoid_derivative': derivative,
+                    'final_error': error
+                })
         
         # Update weights and biases
         self._update_weights_and_biases(inputs, hidden_outputs, output_errors, 
@@ -116,8 +170,9 @@ class MLP:
     
     def _update_weights_and_biases(self, inputs: List[float], hidden_outputs: List[float],
                                  output_errors: List[float], hidden_errors: List[float],
-                                 calculations: Dict[str, Any]):
-        """Update all weights and biases"""
+                                 calculations: Optional[Dict[str, Any]] = None):
+        """Update all weights and biases (records each update only if calculations is given)"""
+        trace = calculations is not None
         
         # Update hidden to output weights
         for j in range(self.hidden_size):
@@ -127,13 +182,14 @@ class MLP:
                 new_weight = old_weight + gradient
                 self.weights_hidden_output[j][k] = new_weight
                 
-                calculations['weight_updates']['hidden_to_output'].append({
-                    'from_neuron': j,
-                    'to_neuron': k,
-                    'old_weight': old_weight,
-                    'gradient': gradient,
-                    'new_weight': new_weight
-                })
+                if trace:
+                    calculations['weight_updates']['hidden_to_output'].append({
+                        'from_neuron': j,
+                        'to_neuron': k,
+                        'old_weight': old_weight,
+                        'gradient': gradient,
+                        'new_weight': new_weight
+                    })
         
         # Update input to hidden weights
         for i in range(self.input_size):
@@ -143,13 +199,14 @@ class MLP:
                 new_weight = old_weight + gradient
                 self.weights_input_hidden[i][j] = new_weight
                 
-                calculations['weight_updates']['input_to_hidden'].append({
-                    'from_neuron': i,
-                    'to_neuron': j,
-                    'old_weight': old_weight,
-                    'gradient': gradient,
-                    'new_weight': new_weight
-                })
+                if trace:
+                    calculations['weight_updates']['input_to_hidden'].append({
+                        'from_neuron': i,
+                        'to_neuron': j,
+                        'old_weight': old_weight,
+                        'gradient': gradient,
+                        'new_weight': new_weight
+                    })
         
         # Update output biases
         for k in range(self.output_size):
@@ -158,12 +215,13 @@ class MLP:
             new_bias = old_bias + gradient
             self.bias_output[k] = new_bias
             
-            calculations['bias_updates']['output'].append({
-                'neuron': k,
-                'old_bias': old_bias,
-                'gradient': gradient,
-                'new_bias': new_bias
-            })
+            if trace:
+                calculations['bias_updates']['output'].append({
+                    'neuron': k,
+                    'old_bias': old_bias,
+                    'gradient': gradient,
+                    'new_bias': new_bias
+                })
         
         # Update hidden biases
         for j in range(self.hidden_size):
@@ -172,12 +230,13 @@ class MLP:
             new_bias = old_bias + gradient
             self.bias_hidden[j] = new_bias
             
-            calculations['bias_updates']['hidden'].append({
-                'neuron': j,
-                'old_bias': old_bias,
-                'gradient': gradient,
-                'new_bias': new_bias
-            })
+            if trace:
+                calculations['bias_updates']['hidden'].append({
+                    'neuron': j,
+                    'old_bias': old_bias,
+                    'gradient': gradient,
+                    'new_bias': new_bias
+                })
     
     def calculate_loss(self, predictions: List[float], targets: List[float]) -> float:
         """
@@ -199,31 +258,58 @@ class MLP:
         _, _, _, outputs = self.forward_pass(inputs)
         return outputs
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert model to dictionary for saving, ensuring JSON serializability."""
-        # --- FIX: Konversi semua bobot dan bias ke list Python sebelum disimpan ---
+    def predict_batch(self, X: Any, chunk_size: Optional[int] = None) -> np.ndarray:
+        """Make predictions for every row of X (per-row loop; chunk_size is ignored)"""
+        rows = np.asarray(X, dtype=float).reshape(len(X), -1)
+        return np.array([self.predict(row.tolist()) for row in rows], dtype=float).reshape(
+            len(rows), self.output_size)
+    
+    def _metadata_dict(self) -> Dict[str, Any]:
+        """Model settings saved alongside the parameters"""
         return {
             'input_size': self.input_size,
             'hidden_size': self.hidden_size,
             'output_size': self.output_size,
             'learning_rate': self.learning_rate,
+            'hidden_activation': self.hidden_activation,
+            'output_activation': self.output_activation,
+            'weight_init': self.weight_init,
+            'seed': self.seed
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary for saving, ensuring JSON serializability."""
+        # --- FIX: Konversi semua bobot dan bias ke list Python sebelum disimpan ---
+        data = self._metadata_dict()
+        data.update({
             'weights_input_hidden': np.array(self.weights_input_hidden).tolist(),
             'weights_hidden_output': np.array(self.weights_hidden_output).tolist(),
             'bias_hidden': np.array(self.bias_hidden).tolist(),
             'bias_output': np.array(self.bias_output).tolist()
-        }
+        })
+        return data
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the current model in the to_dict layout (used for checkpointing)"""
+        return self.to_dict()
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MLP':
         """Create model from dictionary"""
-        mlp = cls(
+        return cls(
             input_size=data['input_size'],
             hidden_size=data['hidden_size'],
             output_size=data['output_size'],
-            learning_rate=data['learning_rate']
+            learning_rate=data['learning_rate'],
+            hidden_activation=data.get('hidden_activation', 'sigmoid'),
+            output_activation=data.get('output_activation', 'sigmoid'),
+            weight_init=data.get('weight_init', 'uniform'),
+            seed=data.get('seed'),
+            parameters=data
         )
-        mlp.weights_input_hidden = data['weights_input_hidden']
-        mlp.weights_hidden_output = data['weights_hidden_output']
-        mlp.bias_hidden = data['bias_hidden']
-        mlp.bias_output = data['bias_output']
-        return mlp
\ No newline at end of file
+
+def _as_floats(values: Any) -> List[float]:
+    """Sample dari dataset bisa berupa ndarray (n,) atau (n, 1): jadikan list of Python floats"""
+    if isinstance(values, np.ndarray):
+        return values.reshape(-1).tolist()
+    return values
@@ -0,0 +1,180 @@
+"""
+Optimizers for the vectorized MLP engine
+
+Semua optimizer bekerja pada flat parameter vector (VectorizedMLP.flat_parameters)
+dan flat gradient vector dengan layout yang sama. State per-parameter
+(velocity, moment, ...) juga disimpan sebagai flat array sejajar dengan weights.
+
+Konvensi tanda sama dengan engine 'python': gradient adalah arah turun
+(error * activation), sehingga update selalu params += ...
+"""
+import numpy as np
+from typing import Any, Dict
+
+class Optimizer:
+    """Base class: SGD-style in-place update of a flat parameter vector"""
+
+    name = 'base'
+    buffer_names = ()
+
+    def __init__(self):
+        self.step_count = 0
+        self.buffers: Dict[str, np.ndarray] = {}
+        self._scratch = None
+
+    def initialize(self, num_parameters: int, dtype=np.float64):
+        """Allocate the per-parameter state (zeros) and a scratch buffer"""
+        self.step_count = 0
+        self.buffers = {name: np.zeros(num_parameters, dtype=dtype) for name in self.buffer_names}
+        self._scratch = np.empty(num_parameters, dtype=dtype)
+
+    def step(self, params: np.ndarray, gradients: np.ndarray, learning_rate: float,
+             batch_size: int = 1):
+        """
+        Update params in place. gradients adalah jumlah gradient atas batch_size
+        sample (dirata-rata di sini) dan dipakai sebagai buffer kerja (isinya berubah).
+        """
+        raise NotImplementedError
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Optimizer state for checkpointing (buffers are copied)"""
+        return {
+            'name': self.name,
+            'step_count': self.step_count,
+            'buffers': {name: buffer.copy() for name, buffer in self.buffers.items()}
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Restore state produced by state_dict"""
+        if state['name'] != self.name:
+            raise ValueError(f"State optimizer '{state['name']}' tidak cocok dengan '{self.name}'")
+        self.step_count = state['step_count']
+        for name, buffer in self.buffers.items():
+            buffer[...] = np.asarray(state['buffers'][name], dtype=buffer.dtype)
+
+class SGD(Optimizer):
+    """Vanilla SGD: params += lr * g"""
+
+    name = 'sgd'
+
+    def step(self, params, gradients, learning_rate, batch_size=1):
+        self.step_count += 1
+        gradients *= learning_rate / batch_size
+        params += gradients
+
+class Momentum(Optimizer):
+    """SGD with momentum: v = mu * v + lr * g, params += v"""
+
+    name = 'momentum'
+    buffer_names = ('velocity',)
+
+    def __init__(self, momentum: float = 0.9):
+        super().__init__()
+        self.momentum = momentum
+
+    def step(self, params, gradients, learning_rate, batch_size=1):
+        self.step_count += 1
+        velocity = self.buffers['velocity']
+        gradients *= learning_rate / batch_size
+        velocity *= self.momentum
+        velocity += gradients
+        params += velocity
+
+class Nesterov(Momentum):
+    """Nesterov momentum: v = mu * v + lr * g, params += mu * v + lr * g"""
+
+    name = 'nesterov'
+
+    def step(self, params, gradients, learning_rate, batch_size=1):
+        self.step_count += 1
+        velocity = self.buffers['velocity']
+        gradients *= learning_rate / batch_size
+        velocity *= self.momentum
+        velocity += gradients
+        np.multiply(velocity, self.momentum, out=self._scratch)
+        params += gradients
+        params += self._scratch
+
+class RMSprop(Optimizer):
+    """RMSprop: s = rho * s + (1 - rho) * g^2, params += lr * g / (sqrt(s) + eps)"""
+
+    name = 'rmsprop'
+    buffer_names = ('square_avg',)
+
+    def __init__(self, rho: float = 0.9, eps: float = 1e-8):
+        super().__init__()
+        self.rho = rho
+        self.eps = eps
+
+    def step(self, params, gradients, learning_rate, batch_size=1):
+        self.step_count += 1
+        square_avg = self.buffers['square_avg']
+        scratch = self._scratch
+        if batch_size != 1:
+            gradients /= batch_size
+
+        np.multiply(gradients, gradients, out=scratch)
+        scratch *= 1.0 - self.rho
+        square_avg *= self.rho
+        square_avg += scratch
+
+        np.sqrt(square_avg, out=scratch)
+        scratch += self.eps
+        gradients /= scratch
+        gradients *= learning_rate
+        params += gradients
+
+class Adam(Optimizer):
+    """Adam dengan bias correction (bentuk efisien dari Kingma & Ba)"""
+
+    name = 'adam'
+    buffer_names = ('exp_avg', 'exp_avg_sq')
+
+    def __init__(self, beta1: float = 0.9, beta2: float = 0.999, eps: float = 1e-8):
+        super().__init__()
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+
+    def step(self, params, gradients, learning_rate, batch_size=1):
+        self.step_count += 1
+        exp_avg = self.buffers['exp_avg']
+        exp_avg_sq = self.buffers['exp_avg_sq']
+        scratch = self._scratch
+        if batch_size != 1:
+            gradients /= batch_size
+
+        # m = b1 * m + (1 - b1) * g
+        np.multiply(gradients, 1.0 - self.beta1, out=scratch)
+        exp_avg *= self.beta1
+        exp_avg += scratch
+
+        # v = b2 * v + (1 - b2) * g^2
+        np.multiply(gradients, gradients, out=scratch)
+        scratch *= 1.0 - self.beta2
+        exp_avg_sq *= self.beta2
+        exp_avg_sq += scratch
+
+        # params += lr_t * m / (sqrt(v) + eps_t)
+        correction1 = 1.0 - self.beta1 ** self.step_count
+        correction2 = 1.0 - self.beta2 ** self.step_count
+        step_size = learning_rate * np.sqrt(correction2) / correction1
+        np.sqrt(exp_avg_sq, out=scratch)
+        scratch += self.eps * np.sqrt(correction2)
+        np.divide(exp_avg, scratch, out=scratch)
+        scratch *= step_size
+        params += scratch
+
+OPTIMIZERS = {
+    'sgd': SGD,
+    'momentum': Momentum,
+    'nesterov': Nesterov,
+    'rmsprop': RMSprop,
+    'adam': Adam,
+}
+
+def create_optimizer(name: str = 'sgd', **params) -> Optimizer:
+    """Create an optimizer by name (params: momentum, rho, beta1, beta2, eps)"""
+    if name not in OPTIMIZERS:
+        raise ValueError(f"Unknown optimizer '{name}'. Available: {sorted(OPTIMIZERS)}")
+    return OPTIMIZERS[name](**params)
@@ -0,0 +1,461 @@
+"""
+Vectorized Multi-Layer Perceptron implementation (NumPy matrix engine)
+"""
+import numpy as np
+from typing import Tuple, Dict, Any, NamedTuple, Optional, Union
+from ..network.mlp import MLP
+from ..network.activations import get_activation
+from ..network.inference import forward_chunked
+from ..network.optimizers import Optimizer, SGD
+
+class Workspace:
+    """
+    Buffer yang dialokasikan sekali dan dipakai ulang setiap training step.
+    Ukuran baris = batch_size; batch yang lebih kecil memakai view [:n].
+    """
+
+    def __init__(self, input_size: int, hidden_size: int, output_size: int, batch_size: int,
+                 dtype=np.float64):
+        self.batch_size = batch_size
+
+        # Activations dan deltas per batch
+        self.hidden_inputs = np.empty((batch_size, hidden_size), dtype=dtype)
+        self.hidden_outputs = np.empty((batch_size, hidden_size), dtype=dtype)
+        self.output_inputs = np.empty((batch_size, output_size), dtype=dtype)
+        self.final_outputs = np.empty((batch_size, output_size), dtype=dtype)
+        self.output_errors = np.empty((batch_size, output_size), dtype=dtype)
+        self.hidden_errors = np.empty((batch_size, hidden_size), dtype=dtype)
+        self.hidden_derivatives = np.empty((batch_size, hidden_size), dtype=dtype)
+        self.output_derivatives = np.empty((batch_size, output_size), dtype=dtype)
+        # Mask (x < 0) untuk sigmoid / leaky_relu
+        self.hidden_mask = np.empty((batch_size, hidden_size), dtype=bool)
+        self.output_mask = np.empty((batch_size, output_size), dtype=bool)
+
+        # Gradients: satu flat vector dengan layout yang sama seperti flat_parameters
+        # (weights_input_hidden, weights_hidden_output, bias_hidden, bias_output)
+        n_ih, n_ho = input_size * hidden_size, hidden_size * output_size
+        self.gradients = np.empty(n_ih + n_ho + hidden_size + output_size, dtype=dtype)
+        self.grad_input_hidden = self.gradients[:n_ih].reshape(input_size, hidden_size)
+        self.grad_hidden_output = self.gradients[n_ih:n_ih + n_ho].reshape(hidden_size, output_size)
+        self.grad_bias_hidden = self.gradients[n_ih + n_ho:n_ih + n_ho + hidden_size]
+        self.grad_bias_output = self.gradients[n_ih + n_ho + hidden_size:]
+
+    def rows(self, n: int) -> Tuple[np.ndarray, ...]:
+        """Return views of the per-batch buffers limited to n rows"""
+        if n == self.batch_size:
+            return (self.hidden_inputs, self.hidden_outputs, self.output_inputs, self.final_outputs,
+                    self.output_errors, self.hidden_errors, self.hidden_derivatives, self.output_derivatives,
+                    self.hidden_mask, self.output_mask)
+        return (self.hidden_inputs[:n], self.hidden_outputs[:n], self.output_inputs[:n],
+                self.final_outputs[:n], self.output_errors[:n], self.hidden_errors[:n],
+                self.hidden_derivatives[:n], self.output_derivatives[:n],
+                self.hidden_mask[:n], self.output_mask[:n])
+
+class TraceRecord(NamedTuple):
+    """
+    Satu traced backward pass sebagai array (salinan, aman dikirim ke thread lain).
+    Parameter flat memakai layout flat_parameters (W_ih, W_ho, b_h, b_o);
+    to_dict() membangun dict calculations seperti backward_pass(trace=True).
+    """
+    sizes: Tuple[int, int, int]
+    targets: np.ndarray
+    final_outputs: np.ndarray
+    raw_errors: np.ndarray
+    output_derivatives: np.ndarray
+    output_errors: np.ndarray
+    error_sums: np.ndarray
+    hidden_derivatives: np.ndarray
+    hidden_errors: np.ndarray
+    updates: np.ndarray
+    old_parameters: np.ndarray
+    new_parameters: np.ndarray
+
+    def _split(self, flat: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(W_ih, W_ho, b_h, b_o) views of a flat parameter vector"""
+        input_size, hidden_size, output_size = self.sizes
+        ih, ho = input_size * hidden_size, hidden_size * output_size
+        return (flat[:ih].reshape(input_size, hidden_size),
+                flat[ih:ih + ho].reshape(hidden_size, output_size),
+                flat[ih + ho:ih + ho + hidden_size],
+                flat[ih + ho + hidden_size:])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the calculations dict in the same layout as MLP.backward_pass"""
+        input_size, hidden_size, output_size = self.sizes
+        targets, final_outputs, raw_errors = self.targets, self.final_outputs, self.raw_errors
+        output_derivatives, output_errors = self.output_derivatives, self.output_errors
+        error_sums, hidden_derivatives, hidden_errors = self.error_sums, self.hidden_derivatives, self.hidden_errors
+        grad_ih, grad_ho, grad_bh, grad_bo = self._split(self.updates)
+        old_ih, old_ho, old_bh, old_bo = self._split(self.old_parameters)
+        new_ih, new_ho, new_bh, new_bo = self._split(self.new_parameters)
+
+        calculations = {
+            'output_errors': [
+                {
+                    'neuron': k,
+                    'target': float(targets[k]),
+                    'prediction': float(final_outputs[k]),
+                    'raw_error': float(raw_errors[k]),
+                    'sigmoid_derivative': float(output_derivatives[k]),
+                    'final_error': float(output_errors[k])
+                }
+                for k in range(output_size)
+            ],
+            'hidden_errors': [
+                {
+                    'neuron': j,
+                    'error_sum': float(error_sums[j]),
+                    'sigmoid_derivative': float(hidden_derivatives[j]),
+                    'final_error': float(hidden_errors[j])
+                }
+                for j in range(hidden_size)
+            ],
+            'weight_updates': {
+                'hidden_to_output': [
+                    {
+                        'from_neuron': j,
+                        'to_neuron': k,
+                        'old_weight': float(old_ho[j, k]),
+                        'gradient': float(grad_ho[j, k]),
+                        'new_weight': float(new_ho[j, k])
+                    }
+                    for j in range(hidden_size) for k in range(output_size)
+                ],
+                'input_to_hidden': [
+                    {
+                        'from_neuron': i,
+                        'to_neuron': j,
+                        'old_weight': float(old_ih[i, j]),
+                        'gradient': float(grad_ih[i, j]),
+                        'new_weight': float(new_ih[i, j])
+                    }
+                    for i in range(input_size) for j in range(hidden_size)
+                ]
+            },
+            'bias_updates': {
+                'output': [
+                    {
+                        'neuron': k,
+                        'old_bias': float(old_bo[k]),
+                        'gradient': float(grad_bo[k]),
+                        'new_bias': float(new_bo[k])
+                    }
+                    for k in range(output_size)
+                ],
+                'hidden': [
+                    {
+                        'neuron': j,
+                        'old_bias': float(old_bh[j]),
+                        'gradient': float(grad_bh[j]),
+                        'new_bias': float(new_bh[j])
+                    }
+                    for j in range(hidden_size)
+                ]
+            }
+        }
+        return calculations
+
+class VectorizedMLP(MLP):
+    """
+    MLP yang menyimpan weights sebagai 2-D ndarray dan menghitung setiap
+    layer dengan satu matmul + activation ufunc (dipilih per layer dari config).
+    Hasilnya ekuivalen secara numerik dengan engine 'python' (MLP).
+    """
+
+    def __init__(self, input_size: int, hidden_size: int, output_size: int,
+                 learning_rate: float = 0.5,
+                 weight_init_range: Tuple[float, float] = (-1.0, 1.0),
+                 bias_init_value: float = 0.0,
+                 hidden_activation: str = 'sigmoid',
+                 output_activation: str = 'sigmoid',
+                 dtype: str = 'float64',
+                 weight_init: str = 'uniform',
+                 seed: Optional[int] = None,
+                 parameters: Optional[Dict[str, Any]] = None):
+        """
+        Initialize weights with the same random sequence as MLP (atau dari parameters),
+        then store them as arrays
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype harus float32 atau float64, bukan '{dtype}'")
+        super().__init__(input_size, hidden_size, output_size, learning_rate,
+                         weight_init_range, bias_init_value,
+                         hidden_activation, output_activation,
+                         weight_init=weight_init, seed=seed, parameters=parameters)
+
+        # Semua parameter disimpan dalam satu flat array; weights dan biases
+        # adalah view-nya dengan shape (input_size, hidden_size), (hidden_size, output_size), ...
+        initial = {
+            'weights_input_hidden': self.weights_input_hidden,
+            'weights_hidden_output': self.weights_hidden_output,
+            'bias_hidden': self.bias_hidden,
+            'bias_output': self.bias_output
+        }
+        self.bind_parameters(np.empty(self.num_parameters, dtype=self.dtype))
+        self.load_parameters(initial)
+
+        self.workspace = None
+        self.set_optimizer(SGD())
+
+    def set_optimizer(self, optimizer: Optimizer):
+        """Use optimizer for every update; its per-parameter state is sized to flat_parameters"""
+        optimizer.initialize(self.num_parameters, self.dtype)
+        self.optimizer = optimizer
+
+    def parameter_shapes(self) -> Dict[str, Tuple[int, ...]]:
+        """Shape of every parameter, in the order they are stored in flat_parameters"""
+        return {
+            'weights_input_hidden': (self.input_size, self.hidden_size),
+            'weights_hidden_output': (self.hidden_size, self.output_size),
+            'bias_hidden': (self.hidden_size,),
+            'bias_output': (self.output_size,)
+        }
+
+    @property
+    def num_parameters(self) -> int:
+        """Total number of weights and biases"""
+        return sum(int(np.prod(shape)) for shape in self.parameter_shapes().values())
+
+    def split_parameters(self, flat: np.ndarray) -> Dict[str, np.ndarray]:
+        """Split a flat vector into views with the parameter shapes"""
+        views = {}
+        offset = 0
+        for name, shape in self.parameter_shapes().items():
+            size = int(np.prod(shape))
+            views[name] = flat[offset:offset + size].reshape(shape)
+            offset += size
+        return views
+
+    def bind_parameters(self, flat: np.ndarray):
+        """
+        Use flat (mis. buffer shared memory) as parameter storage; weights dan biases
+        menjadi view-nya. Nilainya tidak disalin, panggil load_parameters bila perlu.
+        """
+        if flat.shape != (self.num_parameters,) or flat.dtype != self.dtype:
+            raise ValueError(f"Parameter buffer harus ({self.num_parameters},) {self.dtype.name}")
+        self.flat_parameters = flat
+        for name, view in self.split_parameters(flat).items():
+            setattr(self, name, view)
+
+    def load_parameters(self, params: Dict[str, Any]):
+        """Copy parameter values in place (also accepts the nested (n,1) layout of older saves)"""
+        for name, shape in self.parameter_shapes().items():
+            getattr(self, name)[...] = np.asarray(params[name], dtype=self.dtype).reshape(shape)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cheap copy of the model: metadata plus views into one copy of flat_parameters"""
+        data = self._metadata_dict()
+        data.update(self.split_parameters(self.flat_parameters.copy()))
+        return data
+
+    def allocate_workspace(self, batch_size: int) -> Workspace:
+        """(Re)allocate the reusable training buffers for the given batch size"""
+        self.workspace = Workspace(self.input_size, self.hidden_size, self.output_size, batch_size,
+                                   self.dtype)
+        return self.workspace
+
+    def _set_activations(self):
+        """Resolve the configured activation names from the array registry"""
+        self._hidden_act = get_activation(self.hidden_activation)
+        self._output_act = get_activation(self.output_activation)
+
+    def forward_pass(self, inputs) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Perform forward pass through the network
+        Returns: (hidden_inputs, hidden_outputs, output_inputs, final_outputs)
+        """
+        x = np.asarray(inputs, dtype=self.dtype).reshape(1, -1)
+        hidden_inputs, hidden_outputs, output_inputs, final_outputs = self.forward_batch(x)
+        return hidden_inputs[0], hidden_outputs[0], output_inputs[0], final_outputs[0]
+
+    def forward_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Forward pass untuk satu batch, X berukuran (N, input_size)
+        Returns: (hidden_inputs, hidden_outputs, output_inputs, final_outputs), masing-masing (N, layer_size)
+        """
+        hidden_inputs = X @ self.weights_input_hidden + self.bias_hidden
+        hidden_outputs = self._hidden_act(hidden_inputs)
+
+        output_inputs = hidden_outputs @ self.weights_hidden_output + self.bias_output
+        final_outputs = self._output_act(output_inputs)
+
+        return hidden_inputs, hidden_outputs, output_inputs, final_outputs
+
+    def backward_batch(self, X: np.ndarray, hidden_outputs: np.ndarray,
+                       final_outputs: np.ndarray, T: np.ndarray):
+        """
+        Backpropagation untuk satu batch: gradient dirata-rata atas N sample,
+        lalu weights dan biases di-update satu kali oleh optimizer.
+        """
+        output_errors = (T - final_outputs) * self._output_act.derivative(final_outputs)
+        hidden_errors = (output_errors @ self.weights_hidden_output.T) * self._hidden_act.derivative(hidden_outputs)
+
+        gradients = np.empty(self.num_parameters, dtype=self.dtype)
+        grads = self.split_parameters(gradients)
+        np.matmul(X.T, hidden_errors, out=grads['weights_input_hidden'])
+        np.matmul(hidden_outputs.T, output_errors, out=grads['weights_hidden_output'])
+        np.sum(hidden_errors, axis=0, out=grads['bias_hidden'])
+        np.sum(output_errors, axis=0, out=grads['bias_output'])
+        self.optimizer.step(self.flat_parameters, gradients, self.learning_rate, X.shape[0])
+
+    def train_step(self, X: np.ndarray, T: np.ndarray) -> float:
+        """
+        Satu training step (forward + backward + update) tanpa alokasi array baru:
+        semua activation, delta dan gradient ditulis in-place ke workspace.
+        Returns: jumlah MSE per sample di batch ini (sama dengan calculate_batch_loss).
+        """
+        loss = self.compute_gradients(X, T)
+        self.optimizer.step(self.flat_parameters, self.workspace.gradients, self.learning_rate, X.shape[0])
+        return loss
+
+    def compute_gradients(self, X: np.ndarray, T: np.ndarray, gradients: Optional[np.ndarray] = None) -> float:
+        """
+        Forward + backward untuk satu batch tanpa update. Jumlah gradient atas
+        batch ditulis ke gradients (flat, layout flat_parameters; default workspace.gradients).
+        Returns: jumlah MSE per sample di batch ini.
+        """
+        n_samples = X.shape[0]
+        ws = self.workspace
+        if ws is None or ws.batch_size < n_samples:
+            ws = self.allocate_workspace(n_samples)
+        hidden_inputs, hidden_outputs, output_inputs, final_outputs, \
+            output_errors, hidden_errors, hidden_derivatives, output_derivatives, \
+            hidden_mask, output_mask = ws.rows(n_samples)
+
+        # Forward: z = XW + b, a = f(z), sekaligus f'(z) dari output (fused)
+        np.matmul(X, self.weights_input_hidden, out=hidden_inputs)
+        hidden_inputs += self.bias_hidden
+        self._hidden_act.forward_with_derivative(hidden_inputs, hidden_outputs, hidden_derivatives, hidden_mask)
+
+        np.matmul(hidden_outputs, self.weights_hidden_output, out=output_inputs)
+        output_inputs += self.bias_output
+        self._output_act.forward_with_derivative(output_inputs, final_outputs, output_derivatives, output_mask)
+
+        # Loss dan output delta: (t - y) * f'(y)
+        np.subtract(T, final_outputs, out=output_errors)
+        loss = float(np.vdot(output_errors, output_errors)) / self.output_size
+        output_errors *= output_derivatives
+
+        # Hidden delta: (delta_o W2^T) * f'(h), dihitung sebelum W2 di-update
+        np.matmul(output_errors, self.weights_hidden_output.T, out=hidden_errors)
+        hidden_errors *= hidden_derivatives
+
+        # Jumlah gradient ke flat buffer (update dilakukan oleh caller)
+        if gradients is None:
+            grad_input_hidden, grad_hidden_output = ws.grad_input_hidden, ws.grad_hidden_output
+            grad_bias_hidden, grad_bias_output = ws.grad_bias_hidden, ws.grad_bias_output
+        else:
+            grads = self.split_parameters(gradients)
+            grad_input_hidden, grad_hidden_output = grads['weights_input_hidden'], grads['weights_hidden_output']
+            grad_bias_hidden, grad_bias_output = grads['bias_hidden'], grads['bias_output']
+        np.matmul(hidden_outputs.T, output_errors, out=grad_hidden_output)
+        np.matmul(X.T, hidden_errors, out=grad_input_hidden)
+        np.sum(output_errors, axis=0, out=grad_bias_output)
+        np.sum(hidden_errors, axis=0, out=grad_bias_hidden)
+
+        return loss
+
+    def predict(self, inputs) -> np.ndarray:
+        """Make prediction for a single input row"""
+        return self.predict_batch(np.asarray(inputs).reshape(1, -1))[0]
+
+    def predict_batch(self, X: np.ndarray, chunk_size: Optional[int] = None) -> np.ndarray:
+        """
+        Prediksi untuk setiap baris X (N, input_size), termasuk np.memmap.
+        Dengan chunk_size, X diproses per chunk sehingga memory dibatasi
+        oleh ukuran chunk; intermediate activation tidak disimpan.
+        Returns: array (N, output_size)
+        """
+        return forward_chunked(X, self.weights_input_hidden, self.bias_hidden,
+                               self.weights_hidden_output, self.bias_output,
+                               self._hidden_act, self._output_act, self.dtype, chunk_size)
+
+    def calculate_loss(self, predictions, targets) -> float:
+        """Calculate Mean Squared Error loss without copying array inputs"""
+        predictions_arr = np.asarray(predictions, dtype=self.dtype)
+        targets_arr = np.asarray(targets, dtype=self.dtype).reshape(predictions_arr.shape)
+        return float(np.mean(np.square(predictions_arr - targets_arr)))
+
+    def calculate_batch_loss(self, final_outputs: np.ndarray, T: np.ndarray) -> float:
+        """Sum of per-sample MSE over the batch (dibagi jumlah sample oleh trainer)"""
+        return float(np.mean(np.square(final_outputs - T), axis=1).sum())
+
+    def backward_pass(self, inputs, hidden_outputs: np.ndarray,
+                     final_outputs: np.ndarray, targets,
+                     trace: Union[bool, str] = True) -> Union[Dict[str, Any], TraceRecord, None]:
+        """
+        Perform backpropagation and return detailed calculations.
+        With trace=False the update goes through backward_batch and None is returned;
+        trace='record' returns a TraceRecord (arrays) instead of the dict.
+        """
+        if not trace:
+            self.backward_batch(np.asarray(inputs, dtype=self.dtype).reshape(1, -1),
+                                hidden_outputs.reshape(1, -1), final_outputs.reshape(1, -1),
+                                np.asarray(targets, dtype=self.dtype).reshape(1, -1))
+            return None
+
+        x = np.asarray(inputs, dtype=self.dtype).reshape(-1)
+        t = np.array(targets, dtype=self.dtype).reshape(-1)
+
+        # Error per layer (delta)
+        raw_errors = t - final_outputs
+        output_derivatives = self._output_act.derivative(final_outputs)
+        output_errors = raw_errors * output_derivatives
+
+        error_sums = self.weights_hidden_output @ output_errors
+        hidden_derivatives = self._hidden_act.derivative(hidden_outputs)
+        hidden_errors = error_sums * hidden_derivatives
+
+        gradients = np.empty(self.num_parameters, dtype=self.dtype)
+        grads = self.split_parameters(gradients)
+        np.outer(x, hidden_errors, out=grads['weights_input_hidden'])
+        np.outer(hidden_outputs, output_errors, out=grads['weights_hidden_output'])
+        grads['bias_hidden'][...] = hidden_errors
+        grads['bias_output'][...] = output_errors
+
+        old_flat = self.flat_parameters.copy()
+        self.optimizer.step(self.flat_parameters, gradients, self.learning_rate)
+
+        # Yang di-log sebagai 'gradient' adalah update yang benar-benar diterapkan
+        # (untuk SGD: learning_rate * gradient, sama seperti engine 'python')
+        updates = gradients if isinstance(self.optimizer, SGD) else self.flat_parameters - old_flat
+
+        record = TraceRecord(
+            (self.input_size, self.hidden_size, self.output_size),
+            t, final_outputs, raw_errors, output_derivatives, output_errors,
+            error_sums, hidden_derivatives, hidden_errors,
+            updates, old_flat, self.flat_parameters.copy()
+        )
+        return record if trace == 'record' else record.to_dict()
+
+    def _metadata_dict(self) -> Dict[str, Any]:
+        """Model settings saved alongside the parameters"""
+        data = super()._metadata_dict()
+        data['engine'] = 'numpy'
+        data['dtype'] = self.dtype.name
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary for saving"""
+        data = self._metadata_dict()
+        # tolist() langsung dari array (nilai float32 tetap exact saat dibaca ulang sebagai float32)
+        for name, value in self.split_parameters(self.flat_parameters).items():
+            data[name] = value.tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VectorizedMLP':
+        """Create model from dictionary (also accepts the nested (n,1) layout of older saves)"""
+        return cls(
+            input_size=data['input_size'],
+            hidden_size=data['hidden_size'],
+            output_size=data['output_size'],
+            learning_rate=data['learning_rate'],
+            hidden_activation=data.get('hidden_activation', 'sigmoid'),
+            output_activation=data.get('output_activation', 'sigmoid'),
+            dtype=data.get('dtype', 'float64'),
+            weight_init=data.get('weight_init', 'uniform'),
+            seed=data.get('seed'),
+            parameters=data
+        )
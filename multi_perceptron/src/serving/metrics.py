@@ -0,0 +1,95 @@
+"""
+Latency histogram and throughput counters for the prediction server
+"""
+import math
+import time
+from typing import Dict, Any, List
+
+class LatencyHistogram:
+    """
+    Histogram latency dengan bucket log2 dalam mikrodetik (1us .. ~67s).
+    Record O(1), tanpa menyimpan setiap sample.
+    """
+
+    def __init__(self, num_buckets: int = 27):
+        # Bucket i berisi latency <= 2^i mikrodetik; bucket terakhir menampung sisanya
+        self.bounds_us = [2 ** i for i in range(num_buckets)]
+        self.counts = [0] * (num_buckets + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def record(self, seconds: float):
+        """Record one latency measurement"""
+        us = seconds * 1e6
+        index = (math.ceil(us) - 1).bit_length() if us > 1 else 0
+        self.counts[min(index, len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total_us += us
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (us) of the bucket containing the q-th percentile"""
+        if self.count == 0:
+            return 0.0
+        target = q / 100.0 * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return float(self.bounds_us[index]) if index < len(self.bounds_us) else self.max_us
+        return self.max_us
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return summary statistics and non-empty buckets"""
+        buckets: List[Dict[str, Any]] = []
+        for index, count in enumerate(self.counts):
+            if count:
+                le = self.bounds_us[index] if index < len(self.bounds_us) else 'inf'
+                buckets.append({'le_us': le, 'count': count})
+        return {
+            'count': self.count,
+            'mean_us': self.total_us / self.count if self.count else 0.0,
+            'p50_us': self.percentile(50),
+            'p95_us': self.percentile(95),
+            'p99_us': self.percentile(99),
+            'max_us': self.max_us,
+            'buckets': buckets
+        }
+
+class ServerMetrics:
+    """Request/batch counters plus request latency histogram"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def record_request(self, num_rows: int, seconds: float):
+        """Record a completed prediction request"""
+        self.requests += 1
+        self.rows += num_rows
+        self.latency.record(seconds)
+
+    def record_batch(self):
+        """Record one vectorized forward pass"""
+        self.batches += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all counters as a JSON-serializable dict"""
+        uptime = time.monotonic() - self.started_at
+        return {
+            'uptime_seconds': uptime,
+            'requests_total': self.requests,
+            'rows_total': self.rows,
+            'batches_total': self.batches,
+            'errors_total': self.errors,
+            'requests_per_second': self.requests / uptime if uptime > 0 else 0.0,
+            'rows_per_second': self.rows / uptime if uptime > 0 else 0.0,
+            'mean_batch_rows': self.rows / self.batches if self.batches else 0.0,
+            'latency': self.latency.snapshot()
+        }
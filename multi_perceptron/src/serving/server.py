@@ -0,0 +1,271 @@
+"""
+Local asyncio prediction server with request micro-batching (stdlib only)
+"""
+import asyncio
+import json
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from ..network.inference import InferenceModel
+from ..serving.metrics import ServerMetrics
+
+class MicroBatcher:
+    """
+    Mengumpulkan request yang datang bersamaan menjadi satu batch
+    (maks max_batch_size baris atau max_wait_us setelah request pertama),
+    lalu menjawab semuanya dengan satu vectorized forward pass.
+    """
+
+    def __init__(self, model: InferenceModel, max_batch_size: int = 256,
+                 max_wait_us: int = 500, metrics: Optional[ServerMetrics] = None):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_us / 1e6
+        self.metrics = metrics or ServerMetrics()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the batching loop on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel the batching loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, rows: np.ndarray) -> np.ndarray:
+        """Queue rows (n, input_size) and wait for their predictions"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((rows, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        """Wait for the first request, then gather more until the batch is full or the deadline passes"""
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        batch = [first]
+        num_rows = len(first[0])
+        deadline = loop.time() + self.max_wait
+
+        while num_rows < self.max_batch_size:
+            # Ambil yang sudah antre tanpa menunggu
+            if not self._queue.empty():
+                item = self._queue.get_nowait()
+            else:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item)
+            num_rows += len(item[0])
+
+        return batch
+
+    async def _run(self):
+        """Batching loop: one forward pass per collected batch"""
+        while True:
+            batch = await self._collect()
+            try:
+                X = np.concatenate([rows for rows, _ in batch]) if len(batch) > 1 else batch[0][0]
+                # Forward pass cukup cepat untuk dijalankan langsung di event loop
+                outputs = self.model.predict_batch(X)
+                self.metrics.record_batch()
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            start = 0
+            for rows, future in batch:
+                stop = start + len(rows)
+                if not future.done():
+                    future.set_result(outputs[start:stop])
+                start = stop
+
+class PayloadTooLarge(ValueError):
+    """Request body larger than max_body_bytes (HTTP 413)"""
+
+class PredictionServer:
+    """
+    HTTP/1.1 server minimal (TCP atau Unix socket).
+    Routes:
+      POST /predict  body {"inputs": [..]} atau {"inputs": [[..], [..]]}
+      GET  /metrics  latency histogram dan throughput counters
+      GET  /health
+    Body lebih besar dari max_body_bytes dijawab 413 tanpa dibaca.
+    """
+
+    def __init__(self, model: InferenceModel, max_batch_size: int = 256, max_wait_us: int = 500,
+                 max_body_bytes: int = 1 << 20):
+        self.model = model
+        self.max_body_bytes = max_body_bytes
+        self.metrics = ServerMetrics()
+        self.batcher = MicroBatcher(model, max_batch_size, max_wait_us, self.metrics)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8000,
+                    unix_socket: Optional[str] = None) -> asyncio.AbstractServer:
+        """Start listening on host:port, or on unix_socket if given"""
+        self.batcher.start()
+        if unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_socket)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def stop(self):
+        """Stop accepting connections and the batching loop"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self, host: str = '127.0.0.1', port: int = 8000,
+                            unix_socket: Optional[str] = None):
+        """Start and run until cancelled"""
+        server = await self.start(host, port, unix_socket)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one (keep-alive) connection"""
+        try:
+            while True:
+                request = await self._read_request(reader, self.max_body_bytes)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.LimitOverrunError) as exc:
+            # Request line / header rusak (400) atau body terlalu besar (413): jawab lalu tutup
+            # (posisi stream tidak bisa dipercaya)
+            self.metrics.errors += 1
+            status = 413 if isinstance(exc, PayloadTooLarge) else 400
+            try:
+                self._write_response(writer, status, {'error': str(exc) or 'Bad Request'}, keep_alive=False)
+                await writer.drain()
+                await self._discard_input(reader, writer)
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _discard_input(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                             timeout: float = 1.0):
+        """
+        Setelah error response: tutup sisi tulis dan buang sisa input sampai EOF (maks timeout),
+        agar close() tidak mengirim RST yang membuat client kehilangan response.
+        """
+        if writer.can_write_eof():
+            writer.write_eof()
+        async def drain_input():
+            while await reader.read(65536):
+                pass
+        try:
+            await asyncio.wait_for(drain_input(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader,
+                            max_body_bytes: int) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Parse one HTTP request; None when the client closed the connection.
+        Raises ValueError (atau LimitOverrunError untuk header terlalu besar) jika request rusak,
+        PayloadTooLarge jika Content-Length melebihi max_body_bytes.
+        """
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+
+        lines = head.decode('latin-1').split('\r\n')
+        request_line = lines[0].split(' ')
+        if len(request_line) != 3 or not request_line[2].startswith('HTTP/'):
+            raise ValueError(f"Request line tidak valid: {lines[0][:100]!r}")
+        method, path, _ = request_line
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            if ':' not in line:
+                raise ValueError(f"Header tidak valid: {line[:100]!r}")
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = headers.get('content-length', '0')
+        if not content_length.isdigit():
+            raise ValueError(f"Content-Length tidak valid: {content_length[:100]!r}")
+        length = int(content_length)
+        if length > max_body_bytes:
+            raise PayloadTooLarge(f"Body {length} bytes melebihi batas {max_body_bytes} bytes")
+        body = await reader.readexactly(length) if length else b''
+        return method, path, headers, body
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Route a request and return (status, JSON payload)"""
+        if path == '/predict' and method == 'POST':
+            return await self._handle_predict(body)
+        if path == '/metrics' and method == 'GET':
+            return 200, self.metrics.snapshot()
+        if path == '/health' and method == 'GET':
+            return 200, {'status': 'ok', 'model': repr(self.model)}
+        return 404, {'error': f'{method} {path} not found'}
+
+    async def _handle_predict(self, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Validate the request body and wait for the batched prediction"""
+        start = time.perf_counter()
+        try:
+            inputs = json.loads(body)['inputs']
+            rows = np.asarray(inputs, dtype=self.model.dtype)
+            single = rows.ndim == 1
+            rows = rows.reshape(1, -1) if single else rows
+            if rows.ndim != 2 or rows.shape[1] != self.model.input_size:
+                raise ValueError(f"inputs harus berukuran (n, {self.model.input_size})")
+        except (ValueError, KeyError, TypeError) as exc:
+            self.metrics.errors += 1
+            return 400, {'error': str(exc)}
+
+        try:
+            outputs = await self.batcher.predict(rows)
+        except Exception as exc:
+            self.metrics.errors += 1
+            return 500, {'error': str(exc)}
+
+        self.metrics.record_request(len(rows), time.perf_counter() - start)
+        return 200, {'outputs': outputs[0].tolist() if single else outputs.tolist()}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any],
+                        keep_alive: bool):
+        """Write a JSON HTTP response"""
+        reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large',
+                   500: 'Internal Server Error'}
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {reasons.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
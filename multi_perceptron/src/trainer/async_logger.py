@@ -0,0 +1,109 @@
+"""
+Non-blocking TrainingLogger: semua I/O log dijalankan oleh writer thread
+"""
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+from ..trainer.logger import TrainingLogger
+
+BACKPRESSURE_POLICIES = ('block', 'drop_traces', 'sample')
+
+class AsyncTrainingLogger(TrainingLogger):
+    """
+    Training thread hanya memasukkan record ringkas (tuple berisi angka/array;
+    untuk engine 'numpy' backward pass berupa TraceRecord, bukan dict) ke bounded
+    queue; writer thread membangun calculations, baris CSV dan trace lalu menulisnya. Jika queue penuh (disk lambat) backpressure menentukan:
+      'block'       - training menunggu (tidak ada log yang hilang)
+      'drop_traces' - detailed trace dibuang, epoch summary tetap ditulis
+      'sample'      - hanya setiap trace_sample_every trace yang ditunggu, sisanya dibuang
+    Array yang dikirim tidak boleh diubah lagi oleh pemanggil (forward_pass dan
+    backward_pass selalu mengembalikan object baru). close() menunggu queue kosong.
+    """
+
+    trace_records = True
+
+    _SUMMARY, _TRACE, _FLUSH = 'summary', 'trace', 'flush'
+
+    def __init__(self, logging_config: Dict[str, Any], resume_epoch: Optional[int] = None):
+        super().__init__(logging_config, resume_epoch)
+        self.backpressure = logging_config.get('log_backpressure', 'block')
+        if self.backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"log_backpressure harus salah satu dari {BACKPRESSURE_POLICIES}, "
+                             f"bukan '{self.backpressure}'")
+        self.trace_sample_every = logging_config.get('trace_sample_every') or 1
+        self.dropped_traces = 0
+        self.errors: List[Exception] = []
+        self._full_count = 0
+        self._queue = queue.Queue(logging_config.get('log_queue_size') or 1024)
+        self._thread = None
+
+    def _put(self, item: tuple, droppable: bool = False):
+        """Enqueue a record, applying the backpressure policy to droppable (trace) records"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer_loop, name='log-writer', daemon=True)
+            self._thread.start()
+        if droppable and self.backpressure != 'block':
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                self._full_count += 1
+                if self.backpressure == 'drop_traces' or self._full_count % self.trace_sample_every:
+                    self.dropped_traces += 1
+                    return
+        self._queue.put(item)
+
+    def _write_summary_row(self, row: List[Any]):
+        # Running best dan epoch_logs tetap di training thread (O(1)); file I/O di writer thread
+        self._put((self._SUMMARY, row))
+
+    def log_detailed_calculation(self, epoch: int, sample_idx: int,
+                                 inputs, targets, hidden_inputs, hidden_outputs,
+                                 output_inputs, final_outputs, loss: float, calculations):
+        """Queue the raw trace (calculations: dict atau TraceRecord); rows are built by the writer thread"""
+        self._put((self._TRACE, epoch, sample_idx, inputs, targets, hidden_inputs, hidden_outputs,
+                   output_inputs, final_outputs, loss, calculations), droppable=True)
+
+    def flush(self, wait: bool = False):
+        """
+        Flush the records queued so far. wait=False hanya meminta flush;
+        wait=True menunggu sampai writer thread selesai menulisnya (mis. sebelum checkpoint).
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._put((self._FLUSH, done))
+        if wait:
+            done.wait()
+
+    def close(self):
+        """Write everything still queued, close the trace store and stop the writer thread"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        super().close()
+        for error in self.errors:
+            print(f"Warning: log gagal ditulis: {error}")
+        self.errors = []
+        if self.dropped_traces:
+            print(f"Warning: {self.dropped_traces} detailed trace dibuang (log_backpressure='{self.backpressure}')")
+
+    def _writer_loop(self):
+        """Serialize and write queued records in order"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                if item[0] == self._SUMMARY:
+                    TrainingLogger._write_summary_row(self, item[1])
+                elif item[0] == self._TRACE:
+                    self._write_trace(*item[1:])
+                else:
+                    try:
+                        self._flush_files()
+                    finally:
+                        item[1].set()
+            except Exception as exc:
+                self.errors.append(exc)
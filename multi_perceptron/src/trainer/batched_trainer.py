@@ -0,0 +1,143 @@
+"""
+Training K small MLPs at once (BatchedMLP) with per-model loss curves
+"""
+import csv
+import os
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..network.batched_mlp import BatchedMLP
+from ..trainer.trainer import MLPTrainer
+from ..utils.checkpoint import save_model as save_model_file, model_file_extension
+import config
+
+class BatchedTrainer:
+    """
+    Latih K model independen (seed dan/atau learning rate berbeda) dengan satu
+    BatchedMLP. Early stopping (target_loss, patience) berlaku per model: model
+    yang berhenti dibekukan, training selesai jika semua model berhenti.
+    """
+
+    def __init__(self, network_config: Dict[str, Any], training_config: Dict[str, Any],
+                 logging_config: Dict[str, Any], seeds: Sequence[int],
+                 learning_rates: Optional[Sequence[float]] = None):
+        self.network_config = network_config
+        self.training_config = training_config
+        self.logging_config = logging_config
+        self.models_dir = logging_config.get('models_dir') or config.MODELS_DIR
+        self.logs_dir = logging_config.get('logs_dir') or config.LOGS_DIR
+
+        # Setting TRAINING_CONFIG yang tidak diimplementasikan di sini ditolak, bukan diabaikan diam-diam
+        if training_config.get('optimizer', 'sgd') != 'sgd':
+            raise ValueError("BatchedTrainer hanya mendukung optimizer 'sgd'")
+        if training_config.get('lr_schedule') not in (None, 'constant'):
+            raise ValueError("BatchedTrainer belum mendukung lr_schedule (learning rate konstan per model)")
+        for key in ('shuffle_data', 'parallel', 'resume_from'):
+            if training_config.get(key):
+                raise ValueError(f"BatchedTrainer belum mendukung {key}")
+        batch_size = training_config.get('batch_size', 1)
+        if batch_size != 'full' and not (isinstance(batch_size, int) and batch_size >= 1):
+            raise ValueError(f"batch_size harus integer >= 1 atau 'full', bukan {batch_size!r}")
+
+        params = {key: value for key, value in network_config.items()
+                  if key not in ('engine', 'seed', 'learning_rate')}
+        self.mlp = BatchedMLP(seeds, learning_rate=network_config['learning_rate'] if learning_rates is None
+                              else learning_rates, **params)
+        self.batch_size = batch_size
+
+        K = self.mlp.num_models
+        self.loss_curves = np.empty((0, K))
+        self.best_loss = np.full(K, np.inf)
+        self.best_epoch = np.full(K, -1)
+        self.epochs_without_improvement = np.zeros(K, dtype=int)
+        self.stopped_epoch = np.full(K, -1)     # -1 = masih training
+        self.best_index = None
+
+    @property
+    def active(self) -> np.ndarray:
+        """Models that have not stopped yet"""
+        return self.stopped_epoch < 0
+
+    def train(self, training_data: List[Tuple[Any, Any]]):
+        """Train all K models; each epoch is one pass of batched train steps"""
+        K = self.mlp.num_models
+        X, Y = MLPTrainer._stack_data(training_data, self.mlp.dtype)
+        n_samples = X.shape[0]
+        batch_size = n_samples if self.batch_size == 'full' else min(self.batch_size, n_samples)
+        epochs = self.training_config['epochs']
+        target_loss = self.training_config['target_loss']
+        patience = self.training_config['early_stopping_patience']
+
+        print(f"Batched training: {K} models {self.mlp.input_size} -> {self.mlp.hidden_size} -> "
+              f"{self.mlp.output_size}, {n_samples} samples, batch size {batch_size}")
+
+        curves = np.empty((epochs, K))
+        epoch_loss = np.empty(K)
+        epoch = -1
+        for epoch in range(epochs):
+            active = self.active
+            epoch_loss[...] = 0.0
+            for start in range(0, n_samples, batch_size):
+                epoch_loss += self.mlp.train_step(X[start:start + batch_size], Y[start:start + batch_size], active)
+            epoch_loss /= n_samples
+
+            # Model yang sudah berhenti: loss terakhirnya dibawa terus di curve
+            curves[epoch] = np.where(active, epoch_loss, curves[epoch - 1] if epoch > 0 else epoch_loss)
+
+            improved = active & (epoch_loss < self.best_loss)
+            self.best_loss[improved] = epoch_loss[improved]
+            self.best_epoch[improved] = epoch
+            self.epochs_without_improvement[improved] = 0
+            self.epochs_without_improvement[active & ~improved] += 1
+
+            stop = active & ((epoch_loss <= target_loss) | (self.epochs_without_improvement >= patience))
+            self.stopped_epoch[stop] = epoch
+
+            if epoch % self.training_config['print_progress_every'] == 0:
+                print(f"Epoch {epoch:4d}: best model loss = {self.best_loss.min():.6f}, "
+                      f"active = {int(self.active.sum())}/{K}")
+            if not self.active.any():
+                print(f"\nSemua model berhenti pada epoch {epoch}")
+                break
+
+        self.loss_curves = curves[:epoch + 1]
+        self.best_index = self.select_best()
+        print(f"\nTraining completed! Best model: {self.best_index} "
+              f"(seed {self.mlp.seeds[self.best_index]}, lr {self.mlp.learning_rates[self.best_index]}), "
+              f"best loss: {self.best_loss[self.best_index]:.6f}")
+
+    def select_best(self) -> int:
+        """Index of the best model: lowest best loss, ties broken by the earlier epoch"""
+        return int(np.lexsort((self.best_epoch, self.best_loss))[0])
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Per-model summary (seed, learning rate, best loss, epochs trained)"""
+        final_epoch = len(self.loss_curves) - 1
+        return [{
+            'model': k,
+            'seed': self.mlp.seeds[k],
+            'learning_rate': float(self.mlp.learning_rates[k]),
+            'best_loss': float(self.best_loss[k]),
+            'best_epoch': int(self.best_epoch[k]),
+            'epochs': int(self.stopped_epoch[k] if self.stopped_epoch[k] >= 0 else final_epoch) + 1,
+            'final_loss': float(self.loss_curves[-1, k])
+        } for k in range(self.mlp.num_models)]
+
+    def save_loss_curves(self, filename: str = 'batched_loss_curves.csv'):
+        """Write the loss curves as CSV: one row per epoch, one column per model"""
+        filepath = os.path.join(self.logs_dir, filename)
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['epoch'] + [f'model_{k}' for k in range(self.mlp.num_models)])
+            for epoch, losses in enumerate(self.loss_curves):
+                writer.writerow([epoch] + losses.tolist())
+        return filepath
+
+    def save_best_model(self, model_format: str = None) -> str:
+        """Save the best model in the same format as MLPTrainer.save_model"""
+        model_format = model_format or self.logging_config.get('model_format', 'json')
+        filepath = os.path.join(
+            self.models_dir,
+            self.logging_config['final_model_file'].format(ext=model_file_extension(model_format))
+        )
+        save_model_file(filepath, self.mlp.model(self.best_index).snapshot(), model_format)
+        return filepath
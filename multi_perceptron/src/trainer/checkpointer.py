@@ -0,0 +1,162 @@
+"""
+Background asynchronous checkpointing with a retention policy
+"""
+import glob
+import os
+import queue
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..utils.checkpoint import save_model, model_file_extension, load_model_metadata
+
+def list_checkpoints(directory: str, pattern: str, model_format: str = 'binary') -> List[Tuple[int, str]]:
+    """(epoch, path) of every checkpoint in directory matching pattern, sorted by epoch"""
+    ext = model_file_extension(model_format)
+    prefix, suffix = pattern.format(epoch='{epoch}', ext=ext).split('{epoch}')
+    regex = re.compile('^' + re.escape(prefix) + r'(\d+)' + re.escape(suffix) + '$')
+    found = []
+    for path in glob.glob(os.path.join(directory, pattern.format(epoch='*', ext=ext))):
+        match = regex.search(os.path.basename(path))
+        if match:
+            found.append((int(match.group(1)), path))
+    return sorted(found)
+
+def find_latest_checkpoint(directory: str, pattern: str, model_format: str = 'binary') -> Optional[str]:
+    """Return the checkpoint in directory with the highest epoch, or None"""
+    found = list_checkpoints(directory, pattern, model_format)
+    return found[-1][1] if found else None
+
+class AsyncCheckpointer:
+    """
+    Checkpoint periodik (setiap N epochs dan/atau setiap T detik).
+    Training loop hanya mengambil snapshot parameter (satu array copy);
+    serialisasi dan fsync dijalankan oleh writer thread di background.
+    Retention: simpan K checkpoint terakhir + checkpoint dengan loss terbaik.
+    Saat resume (resume_epoch), checkpoint run sebelumnya sampai epoch itu ikut
+    dihitung; loss-nya dibaca dari header (checkpoint_loss, inf jika tidak ada).
+    Run baru hanya mengelola checkpoint yang ditulisnya sendiri.
+    """
+
+    def __init__(self, directory: str, pattern: str, model_format: str = 'binary',
+                 every_epochs: Optional[int] = None, every_seconds: Optional[float] = None,
+                 keep_last: int = 3, keep_best: bool = True, max_pending: int = 2,
+                 resume_epoch: Optional[int] = None):
+        self.directory = directory
+        self.pattern = pattern
+        self.model_format = model_format
+        self.every_epochs = every_epochs
+        self.every_seconds = every_seconds
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+
+        # (epoch, loss, path) yang dikelola retention
+        self.saved: List[Tuple[int, float, str]] = \
+            self._existing_checkpoints(resume_epoch) if resume_epoch is not None else []
+        self.skipped = 0
+        self.errors: List[Exception] = []
+        self._last_time = time.monotonic()
+        self._queue: "queue.Queue[Optional[Tuple[int, float, Dict[str, Any]]]]" = queue.Queue(max_pending)
+        self._thread = threading.Thread(target=self._writer_loop, name='checkpoint-writer', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, directory: str, logging_config: Dict[str, Any],
+                    resume_epoch: Optional[int] = None) -> Optional['AsyncCheckpointer']:
+        """Build from LOGGING_CONFIG; None when periodic checkpointing is disabled"""
+        every_epochs = logging_config.get('checkpoint_every_epochs')
+        every_seconds = logging_config.get('checkpoint_every_seconds')
+        if not every_epochs and not every_seconds:
+            return None
+        return cls(directory, logging_config['model_save_pattern'],
+                   model_format=logging_config.get('model_format', 'json'),
+                   every_epochs=every_epochs, every_seconds=every_seconds,
+                   keep_last=logging_config.get('checkpoint_keep_last', 3),
+                   keep_best=logging_config.get('checkpoint_keep_best', True),
+                   resume_epoch=resume_epoch)
+
+    def _existing_checkpoints(self, resume_epoch: int) -> List[Tuple[int, float, str]]:
+        """Checkpoints of the resumed run up to resume_epoch, oldest first"""
+        saved = []
+        for epoch, path in list_checkpoints(self.directory, self.pattern, self.model_format):
+            if epoch > resume_epoch:
+                continue
+            try:
+                loss = load_model_metadata(path).get('checkpoint_loss')
+            except (OSError, ValueError):
+                loss = None
+            saved.append((epoch, float('inf') if loss is None else loss, path))
+        return saved
+
+    def is_due(self, epoch: int) -> bool:
+        """Check whether the epoch or wall-clock interval has elapsed"""
+        if self.every_epochs and (epoch + 1) % self.every_epochs == 0:
+            return True
+        return bool(self.every_seconds) and time.monotonic() - self._last_time >= self.every_seconds
+
+    def maybe_checkpoint(self, epoch: int, loss: float, snapshot_fn: Callable[[], Dict[str, Any]]) -> bool:
+        """Snapshot and queue a checkpoint if one is due"""
+        if not self.is_due(epoch):
+            return False
+        return self.checkpoint(epoch, loss, snapshot_fn)
+
+    def checkpoint(self, epoch: int, loss: float, snapshot_fn: Callable[[], Dict[str, Any]]) -> bool:
+        """
+        Take a snapshot (snapshot_fn returns a model dict) and hand it to the writer thread.
+        Tidak pernah blocking: jika antrean penuh (disk lambat), checkpoint ini dilewati.
+        """
+        self._last_time = time.monotonic()
+        if self._queue.full():
+            self.skipped += 1
+            return False
+        try:
+            self._queue.put_nowait((epoch, loss, snapshot_fn()))
+            return True
+        except queue.Full:
+            self.skipped += 1
+            return False
+
+    def close(self):
+        """Wait until all queued checkpoints are written, then stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        for error in self.errors:
+            print(f"Warning: checkpoint gagal ditulis: {error}")
+
+    def _writer_loop(self):
+        """Serialize, fsync and apply the retention policy"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            epoch, loss, model_dict = item
+            filepath = os.path.join(
+                self.directory,
+                self.pattern.format(epoch=epoch, ext=model_file_extension(self.model_format))
+            )
+            try:
+                save_model(filepath, dict(model_dict, checkpoint_loss=loss), self.model_format, fsync=True)
+            except Exception as exc:
+                self.errors.append(exc)
+                continue
+            self.saved = [entry for entry in self.saved if entry[2] != filepath]
+            self.saved.append((epoch, loss, filepath))
+            self._apply_retention()
+
+    def _apply_retention(self):
+        """Delete checkpoints outside keep-last-K and keep-best"""
+        keep = {path for _, _, path in self.saved[-self.keep_last:]} if self.keep_last > 0 else set()
+        if self.keep_best and self.saved:
+            keep.add(min(self.saved, key=lambda entry: entry[1])[2])
+
+        remaining = []
+        for entry in self.saved:
+            if entry[2] in keep:
+                remaining.append(entry)
+                continue
+            try:
+                os.remove(entry[2])
+            except OSError as exc:
+                self.errors.append(exc)
+        self.saved = remaining
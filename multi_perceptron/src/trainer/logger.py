@@ -4,193 +4,236 @@ Logging functionality for training process
 """
 import csv
 import os
-from typing import List, Dict, Any
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional
+import numpy as np
+from ..network.vectorized_mlp import TraceRecord
+from ..trainer.trace_store import TraceStore, trace_row
 import config
 
 class TrainingLogger:
     """Handles all logging operations during training"""
     
-    def __init__(self, logging_config: Dict[str, Any]):
+    # True: trainer mengirim TraceRecord (array) dan dict calculations dibangun saat menulis
+    trace_records = False
+    
+    def __init__(self, logging_config: Dict[str, Any], resume_epoch: Optional[int] = None):
         self.logging_config = logging_config
-        self.epoch_logs = []
-        self._setup_log_files()
+        self.logs_dir = logging_config.get('logs_dir') or config.LOGS_DIR
+        
+        # Riwayat epoch di memory dibatasi epoch_logs_keep entry terakhir (None = semua)
+        self.epoch_logs = deque(maxlen=logging_config.get('epoch_logs_keep'))
+        self.best_loss = float('inf')
+        self.last_loss = None
+        
+        # Baris epoch summary di-buffer dan ditulis per flush_every baris / flush_seconds detik
+        self.flush_every = logging_config.get('summary_flush_every') or 1
+        self.flush_seconds = logging_config.get('summary_flush_seconds')
+        self._pending_rows = []
+        self._last_flush = time.monotonic()
+        
+        self._setup_log_files(resume_epoch)
+        self._setup_trace_store(resume_epoch)
     
-    def _setup_log_files(self):
-        """Setup log files and directories"""
+    def _setup_log_files(self, resume_epoch: Optional[int] = None):
+        """Setup log files and directories (resume_epoch: append instead of truncating)"""
         # Create epoch summary file
         self.epoch_summary_file = os.path.join(
-            config.LOGS_DIR, 
+            self.logs_dir, 
             self.logging_config['epoch_summary_file']
         )
         
+        if resume_epoch is not None and os.path.exists(self.epoch_summary_file):
+            self._restore_epoch_summary(resume_epoch)
+            return
+        
         # Write header for epoch summary
         with open(self.epoch_summary_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(['epoch', 'average_loss', 'total_samples', 'best_loss_so_far'])
+            writer.writerow(['epoch', 'average_loss', 'total_samples', 'best_loss_so_far', 'learning_rate'])
+    
+    def _setup_trace_store(self, resume_epoch: Optional[int] = None):
+        """
+        Trace store dibuka saat detailed log pertama. Run baru menghapus trace lama;
+        resume membuang baris setelah resume_epoch (seperti epoch summary).
+        """
+        self.trace_file = os.path.join(self.logs_dir, self.logging_config['trace_file'])
+        self.trace_store = None
+        self._trace_epoch = None
+        
+        if resume_epoch is not None and os.path.exists(self.trace_file):
+            self.trace_store = TraceStore(self.trace_file)
+            self.trace_store.truncate_after(resume_epoch)
+        else:
+            TraceStore.create(self.trace_file).close()
     
-    def log_epoch_summary(self, epoch: int, avg_loss: float, total_samples: int):
-        """Log epoch summary information"""
+    def _restore_epoch_summary(self, resume_epoch: int):
+        """
+        Load the existing epoch summary up to resume_epoch and continue appending.
+        Baris setelah resume_epoch (epoch setelah checkpoint terakhir) dibuang
+        agar log sama dengan run yang tidak terputus.
+        """
+        with open(self.epoch_summary_file, 'r', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        header, rows = rows[0], rows[1:]
+        kept = [row for row in rows if int(row[0]) <= resume_epoch]
+        
+        self.epoch_logs.extend({
+            'epoch': int(row[0]),
+            'average_loss': float(row[1]),
+            'total_samples': int(row[2]),
+            'best_loss_so_far': float(row[3]),
+            'learning_rate': float(row[4]) if len(row) > 4 and row[4] else None
+        } for row in kept)
+        self.best_loss = min([float(row[1]) for row in kept] + [float('inf')])
+        self.last_loss = float(kept[-1][1]) if kept else None
+        
+        if len(kept) != len(rows):
+            with open(self.epoch_summary_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(kept)
+    
+    def log_epoch_summary(self, epoch: int, avg_loss: float, total_samples: int,
+                          learning_rate: Optional[float] = None):
+        """Log epoch summary information (O(1): running best, CSV ditulis per batch)"""
         # Determine if this is the best loss so far
-        best_loss = min([log.get('average_loss', float('inf')) for log in self.epoch_logs] + [avg_loss])
+        self.best_loss = min(self.best_loss, avg_loss)
+        self.last_loss = avg_loss
         
         # Store in memory
-        epoch_data = {
-            'epoch': epoch,
-            'average_loss': avg_loss,
-            'total_samples': total_samples,
-            'best_loss_so_far': best_loss
-        }
-        self.epoch_logs.append(epoch_data)
-        
-        # Write to CSV
-        with open(self.epoch_summary_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([epoch, avg_loss, total_samples, best_loss])
+        if self.epoch_logs.maxlen != 0:
+            self.epoch_logs.append({
+                'epoch': epoch,
+                'average_loss': avg_loss,
+                'total_samples': total_samples,
+                'best_loss_so_far': self.best_loss,
+                'learning_rate': learning_rate
+            })
+        
+        self._write_summary_row([epoch, avg_loss, total_samples, self.best_loss, learning_rate])
+    
+    def _write_summary_row(self, row: List[Any]):
+        """Buffer row, tulis ke CSV jika buffer penuh atau sudah flush_seconds sejak flush terakhir"""
+        self._pending_rows.append(row)
+        if (len(self._pending_rows) >= self.flush_every or
+                self.flush_seconds is not None and time.monotonic() - self._last_flush >= self.flush_seconds):
+            self._flush_files()
+    
+    def flush(self, wait: bool = True):
+        """Append the buffered epoch summary rows to the CSV file and commit the trace"""
+        self._flush_files()
+    
+    def _flush_files(self):
+        """Write the pending summary rows and commit the trace store"""
+        if self.trace_store is not None:
+            self.trace_store.commit()
+        if self._pending_rows:
+            with open(self.epoch_summary_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerows(self._pending_rows)
+            self._pending_rows = []
+        self._last_flush = time.monotonic()
     
     def log_detailed_calculation(self, epoch: int, sample_idx: int, 
                                inputs: List[float], targets: List[float],
                                hidden_inputs: List[float], hidden_outputs: List[float],
                                output_inputs: List[float], final_outputs: List[float],
                                loss: float, calculations: Dict[str, Any]):
-        """Log detailed calculations for a specific sample"""
-        
-        detailed_log_file = os.path.join(
-            config.LOGS_DIR,
-            self.logging_config['detailed_log_pattern'].format(
-                epoch=epoch, sample=sample_idx
-            )
-        )
-        
-        # Prepare detailed log entries
-        log_entries = []
+        """Log detailed calculations for a specific sample (satu baris per step di trace store)"""
+        self._write_trace(epoch, sample_idx, inputs, targets, hidden_inputs, hidden_outputs,
+                          output_inputs, final_outputs, loss, calculations)
+    
+    def _write_trace(self, epoch: int, sample_idx: int, inputs: List[float], targets: List[float],
+                     hidden_inputs: List[float], hidden_outputs: List[float],
+                     output_inputs: List[float], final_outputs: List[float],
+                     loss: float, calculations: Dict[str, Any]):
+        """Convert one traced sample into trace rows and insert them"""
+        if isinstance(calculations, TraceRecord):
+            calculations = calculations.to_dict()
+        if self.trace_store is None:
+            self.trace_store = TraceStore(self.trace_file)
+        if epoch != self._trace_epoch:
+            # Commit per epoch: satu transaksi untuk semua sample dalam epoch
+            self.trace_store.commit()
+            self._trace_epoch = epoch
+        
+        def row(step_type: str, **fields) -> tuple:
+            return trace_row(epoch, sample_idx, step_type, **fields)
+        
+        targets = _flat(targets)
+        rows = []
         
         # Sample info
-        log_entries.append({
-            'step_type': 'sample_info',
-            'epoch': epoch,
-            'sample_index': sample_idx,
-            'input_0': inputs[0] if len(inputs) > 0 else None,
-            'input_1': inputs[1] if len(inputs) > 1 else None,
-            'target_0': targets[0] if len(targets) > 0 else None,
-            'description': f'Processing sample {sample_idx} in epoch {epoch}'
-        })
+        rows.extend(row('sample_input', neuron_index=i, value=x) for i, x in enumerate(_flat(inputs)))
+        rows.extend(row('sample_target', neuron_index=i, value=t) for i, t in enumerate(targets))
         
         # Forward pass - Hidden layer
-        for i, (h_input, h_output) in enumerate(zip(hidden_inputs, hidden_outputs)):
-            log_entries.append({
-                'step_type': 'forward_hidden',
-                'neuron_index': i,
-                'weighted_sum': h_input,
-                'activation_output': h_output,
-                'description': f'Hidden neuron {i} forward pass'
-            })
+        for i, (h_input, h_output) in enumerate(zip(_flat(hidden_inputs), _flat(hidden_outputs))):
+            rows.append(row('forward_hidden', neuron_index=i, weighted_sum=h_input, activation_output=h_output))
         
         # Forward pass - Output layer
-        for i, (o_input, o_output) in enumerate(zip(output_inputs, final_outputs)):
-            log_entries.append({
-                'step_type': 'forward_output',
-                'neuron_index': i,
-                'weighted_sum': o_input,
-                'activation_output': o_output,
-                'target': targets[i],
-                'error': targets[i] - o_output,
-                'description': f'Output neuron {i} forward pass'
-            })
+        for i, (o_input, o_output) in enumerate(zip(_flat(output_inputs), _flat(final_outputs))):
+            rows.append(row('forward_output', neuron_index=i, weighted_sum=o_input, activation_output=o_output,
+                            target=targets[i], error=targets[i] - o_output))
         
         # Loss calculation
-        log_entries.append({
-            'step_type': 'loss_calculation',
-            'loss_value': loss,
-            'description': f'MSE loss calculation'
-        })
+        rows.append(row('loss_calculation', loss_value=float(loss)))
         
         # Backpropagation - Output errors
         for error_info in calculations['output_errors']:
-            log_entries.append({
-                'step_type': 'backprop_output_error',
-                'neuron_index': error_info['neuron'],
-                'target': error_info['target'],
-                'prediction': error_info['prediction'],
-                'raw_error': error_info['raw_error'],
-                'sigmoid_derivative': error_info['sigmoid_derivative'],
-                'final_error': error_info['final_error'],
-                'description': f'Output neuron {error_info["neuron"]} error calculation'
-            })
+            rows.append(row('backprop_output_error',
+                            neuron_index=int(error_info['neuron']),
+                            target=float(error_info['target']),
+                            prediction=float(error_info['prediction']),
+                            raw_error=float(error_info['raw_error']),
+                            sigmoid_derivative=float(error_info['sigmoid_derivative']),
+                            final_error=float(error_info['final_error'])))
         
         # Backpropagation - Hidden errors
         for error_info in calculations['hidden_errors']:
-            log_entries.append({
-                'step_type': 'backprop_hidden_error',
-                'neuron_index': error_info['neuron'],
-                'error_sum': error_info['error_sum'],
-                'sigmoid_derivative': error_info['sigmoid_derivative'],
-                'final_error': error_info['final_error'],
-                'description': f'Hidden neuron {error_info["neuron"]} error calculation'
-            })
+            rows.append(row('backprop_hidden_error',
+                            neuron_index=int(error_info['neuron']),
+                            error_sum=float(error_info['error_sum']),
+                            sigmoid_derivative=float(error_info['sigmoid_derivative']),
+                            final_error=float(error_info['final_error'])))
         
         # Weight updates
-        for update_info in calculations['weight_updates']['input_to_hidden']:
-            log_entries.append({
-                'step_type': 'weight_update_input_hidden',
-                'from_neuron': update_info['from_neuron'],
-                'to_neuron': update_info['to_neuron'],
-                'old_weight': update_info['old_weight'],
-                'gradient': update_info['gradient'],
-                'new_weight': update_info['new_weight'],
-                'weight_change': update_info['new_weight'] - update_info['old_weight'],
-                'description': f'Weight update: input {update_info["from_neuron"]} -> hidden {update_info["to_neuron"]}'
-            })
-        
-        for update_info in calculations['weight_updates']['hidden_to_output']:
-            log_entries.append({
-                'step_type': 'weight_update_hidden_output',
-                'from_neuron': update_info['from_neuron'],
-                'to_neuron': update_info['to_neuron'],
-                'old_weight': update_info['old_weight'],
-                'gradient': update_info['gradient'],
-                'new_weight': update_info['new_weight'],
-                'weight_change': update_info['new_weight'] - update_info['old_weight'],
-                'description': f'Weight update: hidden {update_info["from_neuron"]} -> output {update_info["to_neuron"]}'
-            })
+        for step_type, updates in (('weight_update_input_hidden', calculations['weight_updates']['input_to_hidden']),
+                                   ('weight_update_hidden_output', calculations['weight_updates']['hidden_to_output'])):
+            for update_info in updates:
+                old_weight, new_weight = float(update_info['old_weight']), float(update_info['new_weight'])
+                rows.append(row(step_type,
+                                from_neuron=int(update_info['from_neuron']),
+                                to_neuron=int(update_info['to_neuron']),
+                                old_weight=old_weight,
+                                gradient=float(update_info['gradient']),
+                                new_weight=new_weight,
+                                weight_change=new_weight - old_weight))
         
         # Bias updates
-        for update_info in calculations['bias_updates']['hidden']:
-            log_entries.append({
-                'step_type': 'bias_update_hidden',
-                'neuron_index': update_info['neuron'],
-                'old_bias': update_info['old_bias'],
-                'gradient': update_info['gradient'],
-                'new_bias': update_info['new_bias'],
-                'bias_change': update_info['new_bias'] - update_info['old_bias'],
-                'description': f'Bias update: hidden neuron {update_info["neuron"]}'
-            })
-        
-        for update_info in calculations['bias_updates']['output']:
-            log_entries.append({
-                'step_type': 'bias_update_output',
-                'neuron_index': update_info['neuron'],
-                'old_bias': update_info['old_bias'],
-                'gradient': update_info['gradient'],
-                'new_bias': update_info['new_bias'],
-                'bias_change': update_info['new_bias'] - update_info['old_bias'],
-                'description': f'Bias update: output neuron {update_info["neuron"]}'
-            })
-        
-        # Write to CSV
-        self._write_detailed_log_to_csv(detailed_log_file, log_entries)
+        for step_type, updates in (('bias_update_hidden', calculations['bias_updates']['hidden']),
+                                   ('bias_update_output', calculations['bias_updates']['output'])):
+            for update_info in updates:
+                old_bias, new_bias = float(update_info['old_bias']), float(update_info['new_bias'])
+                rows.append(row(step_type,
+                                neuron_index=int(update_info['neuron']),
+                                old_bias=old_bias,
+                                gradient=float(update_info['gradient']),
+                                new_bias=new_bias,
+                                bias_change=new_bias - old_bias))
+        
+        self.trace_store.append(rows)
     
-    def _write_detailed_log_to_csv(self, filename: str, log_entries: List[Dict[str, Any]]):
-        """Write detailed log entries to CSV file"""
-        if not log_entries:
-            return
-        
-        # Get all possible fieldnames from all entries
-        fieldnames = set()
-        for entry in log_entries:
-            fieldnames.update(entry.keys())
-        fieldnames = sorted(list(fieldnames))
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(log_entries)
\ No newline at end of file
+    def close(self):
+        """Flush the epoch summary and close the trace store"""
+        self._flush_files()
+        if self.trace_store is not None:
+            self.trace_store.close()
+            self.trace_store = None
+            self._trace_epoch = None
+
+def _flat(values: Any) -> List[float]:
+    """List, ndarray (n,) atau (n, 1) -> list of Python floats"""
+    return np.asarray(values, dtype=np.float64).reshape(-1).tolist()
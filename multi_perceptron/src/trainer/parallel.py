@@ -0,0 +1,267 @@
+"""
+Multi-process training dengan multiprocessing.shared_memory
+
+Dataset (X, Y), parameter dan gradient slot per worker disimpan di shared memory,
+sehingga tidak ada array yang di-pickle per step; worker hanya menerima
+indeks batch lewat shared control array dan disinkronkan dengan Barrier.
+"""
+import multiprocessing as mp
+import numpy as np
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Any, Dict, Tuple
+from ..network.vectorized_mlp import VectorizedMLP
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without registering it with the resource tracker (Python 3.13+)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+class SharedArrays:
+    """
+    Sekumpulan ndarray di shared memory. Proses pembuat memanggil create(),
+    worker memanggil attach(spec) dengan spec (nama block, shape, dtype) yang picklable.
+    """
+
+    def __init__(self, blocks: Dict[str, shared_memory.SharedMemory], spec: Dict[str, Tuple[str, Tuple[int, ...], str]],
+                 owner: bool):
+        self._blocks = blocks
+        self.spec = spec
+        self.owner = owner
+        self.arrays = {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=blocks[name].buf)
+            for name, (_, shape, dtype) in spec.items()
+        }
+
+    @classmethod
+    def create(cls, arrays: Dict[str, Tuple[Tuple[int, ...], Any]]) -> 'SharedArrays':
+        """Allocate zero-filled shared arrays: {name: (shape, dtype)}"""
+        blocks, spec = {}, {}
+        for name, (shape, dtype) in arrays.items():
+            nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            blocks[name] = shared_memory.SharedMemory(create=True, size=nbytes)
+            spec[name] = (blocks[name].name, tuple(shape), np.dtype(dtype).str)
+        shared = cls(blocks, spec, owner=True)
+        for arr in shared.arrays.values():
+            arr.fill(0)
+        return shared
+
+    @classmethod
+    def attach(cls, spec: Dict[str, Tuple[str, Tuple[int, ...], str]]) -> 'SharedArrays':
+        """Map the arrays created by another process"""
+        return cls({name: _attach(block) for name, (block, _, _) in spec.items()}, spec, owner=False)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def close(self):
+        """Release the mapping (dan unlink jika proses ini pembuatnya)"""
+        self.arrays = {}
+        for block in self._blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+        self._blocks = {}
+
+def _model_spec(mlp: VectorizedMLP) -> Dict[str, Any]:
+    """Picklable description of the network, enough to rebuild it in a worker"""
+    return {
+        'input_size': mlp.input_size,
+        'hidden_size': mlp.hidden_size,
+        'output_size': mlp.output_size,
+        'hidden_activation': mlp.hidden_activation,
+        'output_activation': mlp.output_activation,
+        'dtype': mlp.dtype.name
+    }
+
+def _shard(start: int, stop: int, worker_id: int, num_workers: int) -> Tuple[int, int]:
+    """Contiguous rows of [start, stop) handled by one worker"""
+    n = stop - start
+    return start + n * worker_id // num_workers, start + n * (worker_id + 1) // num_workers
+
+def _data_parallel_worker(worker_id: int, num_workers: int, model_spec: Dict[str, Any],
+                          shared_spec: Dict[str, Any], barrier):
+    """
+    Worker loop: tunggu batch di control, hitung gradient shard-nya ke
+    gradients[worker_id] dan loss ke losses[worker_id], lalu sinyal selesai.
+    """
+    shared = SharedArrays.attach(shared_spec)
+    try:
+        mlp = VectorizedMLP(**model_spec)
+        mlp.bind_parameters(shared['params'])
+        X, Y, control = shared['X'], shared['Y'], shared['control']
+        gradients, losses = shared['gradients'][worker_id], shared['losses']
+
+        while True:
+            barrier.wait()
+            start, stop = int(control[0]), int(control[1])
+            if start < 0:
+                break
+            lo, hi = _shard(start, stop, worker_id, num_workers)
+            if hi > lo:
+                losses[worker_id] = mlp.compute_gradients(X[lo:hi], Y[lo:hi], gradients)
+            else:
+                gradients.fill(0)
+                losses[worker_id] = 0.0
+            barrier.wait()
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        shared.close()
+
+def _hogwild_worker(worker_id: int, num_workers: int, model_spec: Dict[str, Any],
+                    shared_spec: Dict[str, Any], barrier):
+    """
+    Worker loop Hogwild: setiap epoch, latih shard sample milik worker ini dan
+    update parameter shared langsung (tanpa lock). Loss shard ditulis ke losses[worker_id].
+    """
+    shared = SharedArrays.attach(shared_spec)
+    try:
+        mlp = VectorizedMLP(**model_spec)
+        mlp.bind_parameters(shared['params'])
+        X, Y, control, losses = shared['X'], shared['Y'], shared['control'], shared['losses']
+        lo, hi = _shard(0, X.shape[0], worker_id, num_workers)
+
+        while True:
+            barrier.wait()
+            batch_size, learning_rate = int(control[0]), float(control[1])
+            if batch_size < 0:
+                break
+            mlp.learning_rate = learning_rate
+            total_loss = 0.0
+            for start in range(lo, hi, batch_size):
+                stop = min(start + batch_size, hi)
+                total_loss += mlp.train_step(X[start:stop], Y[start:stop])
+            losses[worker_id] = total_loss
+            barrier.wait()
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        shared.close()
+
+class SharedMemoryEngine:
+    """
+    Basis engine multi-process: dataset dan parameter model di shared memory,
+    N worker process, sinkronisasi coordinator <-> worker dengan satu Barrier.
+    """
+
+    worker_target = None
+
+    def __init__(self, mlp: VectorizedMLP, X: np.ndarray, Y: np.ndarray, num_workers: int = None):
+        self.mlp = mlp
+        self.num_workers = num_workers or mp.cpu_count()
+        self.shared = SharedArrays.create(dict({
+            'X': (X.shape, mlp.dtype),
+            'Y': (Y.shape, mlp.dtype),
+            'params': ((mlp.num_parameters,), mlp.dtype),
+            'losses': ((self.num_workers,), np.float64),
+        }, **self._extra_arrays()))
+        self.shared['X'][...] = X
+        self.shared['Y'][...] = Y
+
+        # Parameter model dipindah ke shared memory; update langsung terlihat oleh semua proses
+        self.shared['params'][...] = mlp.flat_parameters
+        mlp.bind_parameters(self.shared['params'])
+
+        self._barrier = mp.Barrier(self.num_workers + 1)
+        self._workers = [
+            mp.Process(target=type(self).worker_target, name=f'{type(self).__name__}-{w}',
+                       args=(w, self.num_workers, _model_spec(mlp), self.shared.spec, self._barrier),
+                       daemon=True)
+            for w in range(self.num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _extra_arrays(self) -> Dict[str, Tuple[Tuple[int, ...], Any]]:
+        """Additional shared arrays needed by the subclass"""
+        return {}
+
+    def _wait(self):
+        """Barrier wait that turns a crashed worker into an exception"""
+        try:
+            self._barrier.wait()
+        except BrokenBarrierError:
+            raise RuntimeError(f"Worker {type(self).__name__} berhenti dengan error") from None
+
+    def train_epoch(self, batch_size: int) -> float:
+        """One epoch over the shared dataset; returns the average loss"""
+        raise NotImplementedError
+
+    def close(self):
+        """Stop the workers, copy the parameters back into private memory and free the shared blocks"""
+        if self.shared.arrays:
+            self.shared['control'][0] = -1
+            try:
+                self._barrier.wait(timeout=5)
+            except BrokenBarrierError:
+                pass
+            for worker in self._workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+            self.mlp.bind_parameters(self.mlp.flat_parameters.copy())
+            self.shared.close()
+
+class DataParallelEngine(SharedMemoryEngine):
+    """
+    Synchronous data-parallel training: setiap batch dibagi ke N worker,
+    gradient shard dijumlah (reduce) oleh coordinator lalu satu update
+    dengan optimizer model. Hasilnya sama dengan mini-batch single-process
+    (hanya berbeda urutan penjumlahan floating point).
+    """
+
+    worker_target = _data_parallel_worker
+
+    def __init__(self, mlp: VectorizedMLP, X: np.ndarray, Y: np.ndarray, num_workers: int = None):
+        super().__init__(mlp, X, Y, num_workers)
+        self._gradient_sum = np.empty(mlp.num_parameters, dtype=mlp.dtype)
+
+    def _extra_arrays(self):
+        return {
+            'gradients': ((self.num_workers, self.mlp.num_parameters), self.mlp.dtype),
+            'control': ((2,), np.int64),
+        }
+
+    def train_step(self, start: int, stop: int) -> float:
+        """One synchronous step on rows [start, stop); returns the summed per-sample MSE"""
+        control = self.shared['control']
+        control[0], control[1] = start, stop
+        self._wait()    # worker mulai menghitung gradient
+        self._wait()    # semua gradient shard sudah ditulis
+
+        np.sum(self.shared['gradients'], axis=0, out=self._gradient_sum)
+        self.mlp.optimizer.step(self.mlp.flat_parameters, self._gradient_sum, self.mlp.learning_rate, stop - start)
+        return float(self.shared['losses'].sum())
+
+    def train_epoch(self, batch_size: int) -> float:
+        n_samples = self.shared['X'].shape[0]
+        total_loss = 0.0
+        for start in range(0, n_samples, batch_size):
+            total_loss += self.train_step(start, min(start + batch_size, n_samples))
+        return total_loss / n_samples
+
+class HogwildEngine(SharedMemoryEngine):
+    """
+    Hogwild (lock-free) SGD: setiap worker melatih shard sample-nya sendiri dan
+    menulis update langsung ke parameter shared tanpa lock. Update bisa saling
+    menimpa (noisy), sebagai gantinya throughput naik hampir linear dengan jumlah core.
+    Coordinator hanya memulai epoch dan menjumlahkan loss per worker.
+    """
+
+    worker_target = _hogwild_worker
+
+    def _extra_arrays(self):
+        # control: [batch_size (-1 = stop), learning_rate]
+        return {'control': ((2,), np.float64)}
+
+    def train_epoch(self, batch_size: int) -> float:
+        control = self.shared['control']
+        control[0], control[1] = batch_size, self.mlp.learning_rate
+        self._wait()    # worker mulai epoch
+        self._wait()    # semua shard selesai
+        return float(self.shared['losses'].sum()) / self.shared['X'].shape[0]
@@ -0,0 +1,137 @@
+"""
+Learning rate schedulers: learning_rate(epoch) dievaluasi di awal setiap epoch,
+step(epoch, loss) dipanggil trainer di akhir epoch (state plateau hanya berubah di sini)
+"""
+import math
+from typing import Any, Dict, Optional
+
+class LRScheduler:
+    """
+    Base scheduler: learning rate konstan dengan optional linear warmup.
+    Selama warmup_epochs pertama LR naik linear dari base_lr / warmup_epochs ke base_lr.
+    """
+
+    name = 'constant'
+
+    def __init__(self, base_lr: float, warmup_epochs: int = 0):
+        self.base_lr = base_lr
+        self.warmup_epochs = warmup_epochs
+
+    def learning_rate(self, epoch: int) -> float:
+        """Learning rate for the given epoch (tanpa side effect)"""
+        if epoch < self.warmup_epochs:
+            return self.base_lr * (epoch + 1) / self.warmup_epochs
+        return self._scheduled_lr(epoch - self.warmup_epochs)
+
+    def _scheduled_lr(self, epoch: int) -> float:
+        """Learning rate after warmup (epoch counted from the end of warmup)"""
+        return self.base_lr
+
+    def step(self, epoch: int, loss: float):
+        """Record the loss of a finished epoch (no-op for epoch-based schedules)"""
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Mutable state for checkpointing (empty for epoch-based schedules)"""
+        return {}
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Restore state produced by state_dict"""
+
+class StepLR(LRScheduler):
+    """LR dikali gamma setiap step_size epochs"""
+
+    name = 'step'
+
+    def __init__(self, base_lr: float, step_size: int = 1000, gamma: float = 0.5, warmup_epochs: int = 0):
+        super().__init__(base_lr, warmup_epochs)
+        self.step_size = step_size
+        self.gamma = gamma
+
+    def _scheduled_lr(self, epoch):
+        return self.base_lr * self.gamma ** (epoch // self.step_size)
+
+class ExponentialLR(LRScheduler):
+    """LR = base_lr * gamma^epoch"""
+
+    name = 'exponential'
+
+    def __init__(self, base_lr: float, gamma: float = 0.999, warmup_epochs: int = 0):
+        super().__init__(base_lr, warmup_epochs)
+        self.gamma = gamma
+
+    def _scheduled_lr(self, epoch):
+        return self.base_lr * self.gamma ** epoch
+
+class CosineLR(LRScheduler):
+    """Cosine annealing dari base_lr ke min_lr dalam t_max epochs (setelah itu min_lr)"""
+
+    name = 'cosine'
+
+    def __init__(self, base_lr: float, t_max: int = 10000, min_lr: float = 0.0, warmup_epochs: int = 0):
+        super().__init__(base_lr, warmup_epochs)
+        self.t_max = t_max
+        self.min_lr = min_lr
+
+    def _scheduled_lr(self, epoch):
+        progress = min(epoch, self.t_max) / self.t_max
+        return self.min_lr + 0.5 * (self.base_lr - self.min_lr) * (1.0 + math.cos(math.pi * progress))
+
+class ReduceOnPlateau(LRScheduler):
+    """
+    LR dikali factor setiap patience epochs tanpa improvement loss (dihitung di step,
+    sama seperti early stopping di trainer). Reduksi selama warmup ditunda sampai warmup selesai.
+    Pilih early_stopping_patience > patience agar LR sempat turun sebelum training dihentikan.
+    """
+
+    name = 'plateau'
+
+    def __init__(self, base_lr: float, patience: int = 50, factor: float = 0.5,
+                 min_lr: float = 1e-6, warmup_epochs: int = 0):
+        super().__init__(base_lr, warmup_epochs)
+        if not 0.0 < factor < 1.0:
+            raise ValueError(f"factor harus di antara 0 dan 1, bukan {factor}")
+        self.patience = patience
+        self.factor = factor
+        self.min_lr = min_lr
+        self.best_loss = float('inf')
+        self.epochs_without_improvement = 0
+        self.num_reductions = 0
+
+    def _scheduled_lr(self, epoch):
+        return max(self.base_lr * self.factor ** self.num_reductions, self.min_lr)
+
+    def step(self, epoch, loss):
+        if loss < self.best_loss:
+            self.best_loss = loss
+            self.epochs_without_improvement = 0
+        else:
+            self.epochs_without_improvement += 1
+        # Reduksi berlaku mulai epoch berikutnya (jika sudah lewat warmup)
+        if (epoch + 1 >= self.warmup_epochs and self.epochs_without_improvement > 0
+                and self.epochs_without_improvement % self.patience == 0):
+            self.num_reductions += 1
+
+    def state_dict(self):
+        return {'best_loss': self.best_loss, 'epochs_without_improvement': self.epochs_without_improvement,
+                'num_reductions': self.num_reductions}
+
+    def load_state_dict(self, state):
+        self.best_loss = state.get('best_loss', float('inf'))
+        self.epochs_without_improvement = state.get('epochs_without_improvement', 0)
+        self.num_reductions = state['num_reductions']
+
+SCHEDULERS = {
+    'constant': LRScheduler,
+    'warmup': LRScheduler,
+    'step': StepLR,
+    'exponential': ExponentialLR,
+    'cosine': CosineLR,
+    'plateau': ReduceOnPlateau,
+}
+
+def create_scheduler(name: Optional[str], base_lr: float, **params) -> LRScheduler:
+    """Create a scheduler by name (None = constant learning rate)"""
+    name = name or 'constant'
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown lr_schedule '{name}'. Available: {sorted(SCHEDULERS)}")
+    return SCHEDULERS[name](base_lr, **params)
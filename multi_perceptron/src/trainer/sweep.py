@@ -0,0 +1,285 @@
+"""
+Parallel hyperparameter sweep: grid / random search over NETWORK_CONFIG dan
+TRAINING_CONFIG, dijalankan di semua core dengan ProcessPoolExecutor.
+Setiap trial adalah MLPTrainer yang terisolasi dengan output directory dan seed sendiri.
+"""
+import contextlib
+import csv
+import itertools
+import os
+import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+from ..trainer.trainer import MLPTrainer
+
+RESULT_FIELDS = ['trial_id', 'seed', 'status', 'epochs', 'final_loss', 'best_loss', 'wall_time', 'output_dir',
+                 'error', 'failed_at_rung']
+
+def grid_search(space: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the listed values"""
+    keys = list(space)
+    for key in keys:
+        if not isinstance(space[key], list):
+            raise ValueError(f"Grid search membutuhkan list nilai untuk '{key}', bukan {space[key]!r}")
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+def random_search(space: Dict[str, Any], num_samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Sample num_samples configs. list = pilih salah satu nilai,
+    tuple (low, high) = uniform (integer jika keduanya int).
+    """
+    rng = np.random.default_rng(seed)
+    samples = []
+    for _ in range(num_samples):
+        params = {}
+        for key, values in space.items():
+            if isinstance(values, list):
+                params[key] = values[int(rng.integers(len(values)))]
+            elif isinstance(values, tuple) and len(values) == 2:
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    params[key] = int(rng.integers(low, high + 1))
+                else:
+                    params[key] = float(rng.uniform(low, high))
+            else:
+                raise ValueError(f"Search space '{key}' harus list atau tuple (low, high), bukan {values!r}")
+        samples.append(params)
+    return samples
+
+def split_params(params: Dict[str, Any], network_config: Dict[str, Any],
+                 training_config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Apply a sampled config on top of NETWORK_CONFIG / TRAINING_CONFIG"""
+    network_config, training_config = dict(network_config), dict(training_config)
+    for key, value in params.items():
+        if key in network_config or key in ('weight_init', 'seed'):
+            network_config[key] = value
+        elif key in training_config or key in ('optimizer', 'optimizer_params', 'lr_schedule', 'lr_schedule_params'):
+            training_config[key] = value
+        else:
+            raise ValueError(f"Parameter sweep '{key}' tidak ada di NETWORK_CONFIG maupun TRAINING_CONFIG")
+    return network_config, training_config
+
+def estimate_cost(trial: Dict[str, Any]) -> float:
+    """Relative cost of a trial: epochs x parameters x samples (dipakai untuk longest-first)"""
+    net = trial['network_config']
+    num_parameters = (net['input_size'] + 1) * net['hidden_size'] + (net['hidden_size'] + 1) * net['output_size']
+    return trial['training_config']['epochs'] * num_parameters * len(trial['training_data'])
+
+def run_trial(trial: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker: train one config in its own output directory.
+    Output print trainer ditulis ke train.log di directory trial.
+    """
+    output_dir = trial['output_dir']
+    logging_config = dict(trial['logging_config'],
+                          logs_dir=os.path.join(output_dir, 'logs'),
+                          models_dir=os.path.join(output_dir, 'models'))
+    os.makedirs(logging_config['logs_dir'], exist_ok=True)
+    os.makedirs(logging_config['models_dir'], exist_ok=True)
+
+    training_config = dict(trial['training_config'])
+    if trial.get('resume'):
+        training_config['resume_from'] = 'latest'
+    else:
+        random.seed(trial['seed'])
+
+    start = time.perf_counter()
+    with open(os.path.join(output_dir, 'train.log'), 'a', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log):
+        trainer = MLPTrainer(trial['network_config'], training_config, logging_config)
+        trainer.train(trial['training_data'])
+        # Checkpoint akhir rung, dipakai untuk melanjutkan trial di rung berikutnya
+        if trial.get('keep_checkpoint') and trainer.current_epoch + 1 >= training_config['epochs']:
+            trainer.save_checkpoint()
+    wall_time = trial.get('wall_time', 0.0) + time.perf_counter() - start
+
+    epochs = trainer.current_epoch + 1
+    result = {
+        'trial_id': trial['trial_id'],
+        'seed': trial['seed'],
+        'status': 'early_stop' if epochs < training_config['epochs'] else 'completed',
+        'epochs': epochs,
+        'final_loss': trainer.logger.last_loss,
+        'best_loss': trainer.best_loss,
+        'wall_time': wall_time,
+        'output_dir': output_dir
+    }
+    result.update(trial['params'])
+    return result
+
+def failed_result(trial: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    """Result row for a trial whose worker raised (tanpa loss; tidak ikut halving)"""
+    result = {
+        'trial_id': trial['trial_id'],
+        'seed': trial['seed'],
+        'status': 'failed',
+        'epochs': None,
+        'final_loss': None,
+        'best_loss': None,
+        'wall_time': trial.get('wall_time', 0.0),
+        'output_dir': trial['output_dir'],
+        'error': f"{type(error).__name__}: {error}"
+    }
+    result.update(trial['params'])
+    return result
+
+def _sort_key(result: Dict[str, Any]) -> float:
+    """best_loss, trial yang gagal di akhir"""
+    return float('inf') if result['best_loss'] is None else result['best_loss']
+
+class HyperparameterSweep:
+    """
+    Jalankan banyak trial paralel dan kumpulkan hasilnya dalam satu tabel.
+    Dengan successive halving, semua trial dilatih min_epochs dulu; hanya
+    1/reduction_factor terbaik (best_loss) yang dilanjutkan (resume dari
+    checkpoint) dengan budget epochs x reduction_factor, sampai TRAINING_CONFIG['epochs'].
+    Trial yang gagal di rung berikutnya menyimpan hasil rung terakhir yang selesai
+    (error dan failed_at_rung dicatat di baris yang sama).
+    """
+
+    def __init__(self, network_config: Dict[str, Any], training_config: Dict[str, Any],
+                 logging_config: Dict[str, Any], sweep_config: Dict[str, Any]):
+        self.network_config = network_config
+        self.training_config = training_config
+        self.logging_config = logging_config
+        self.sweep_config = sweep_config
+        self.results: List[Dict[str, Any]] = []
+
+    def build_trials(self, training_data: List[Tuple[Any, Any]]) -> List[Dict[str, Any]]:
+        """Expand the search space into trials with their own seed and output directory"""
+        sweep = self.sweep_config
+        base_seed = sweep.get('seed', 0)
+        if sweep.get('search', 'grid') == 'grid':
+            configs = grid_search(sweep['space'])
+        elif sweep['search'] == 'random':
+            configs = random_search(sweep['space'], sweep.get('num_samples', 20), base_seed)
+        else:
+            raise ValueError(f"search harus 'grid' atau 'random', bukan '{sweep['search']}'")
+
+        training_config = dict(self.training_config, resume_from=None)
+        if not sweep.get('detailed_logs', False):
+            training_config.update(log_first_epochs=0, log_detailed_every=None)
+        logging_config = dict(self.logging_config, checkpoint_every_epochs=None, checkpoint_every_seconds=None)
+
+        trials = []
+        for trial_id, params in enumerate(configs):
+            network, training = split_params(params, self.network_config, training_config)
+            seed = params.get('seed', base_seed + trial_id)
+            network['seed'] = seed
+            trials.append({
+                'trial_id': trial_id,
+                'params': params,
+                'seed': seed,
+                'network_config': network,
+                'training_config': training,
+                'logging_config': logging_config,
+                'output_dir': os.path.join(sweep['output_dir'], f'trial_{trial_id:04d}'),
+                'training_data': training_data
+            })
+        return trials
+
+    def run(self, training_data: List[Tuple[Any, Any]]) -> List[Dict[str, Any]]:
+        """Run the sweep and return the results sorted by best_loss"""
+        trials = self.build_trials(training_data)
+        print(f"Sweep: {len(trials)} trials, {self.sweep_config.get('max_workers') or os.cpu_count()} workers")
+
+        with ProcessPoolExecutor(max_workers=self.sweep_config.get('max_workers')) as executor:
+            if self.sweep_config.get('successive_halving'):
+                results = self._successive_halving(executor, trials)
+            else:
+                results = self._run_batch(executor, trials)
+
+        self.results = sorted(results, key=_sort_key)
+        return self.results
+
+    def _run_batch(self, executor: ProcessPoolExecutor, trials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit trials (longest-first when enabled) and wait for all of them"""
+        if self.sweep_config.get('longest_first', True):
+            trials = sorted(trials, key=estimate_cost, reverse=True)
+        futures = {executor.submit(run_trial, trial): trial for trial in trials}
+        results = []
+        for future in as_completed(futures):
+            # Satu trial yang gagal (mis. config tidak valid) tidak menghentikan sweep
+            try:
+                result = future.result()
+            except Exception as e:
+                result = failed_result(futures[future], e)
+                results.append(result)
+                print(f"  trial {result['trial_id']:4d}: gagal - {result['error']}")
+                continue
+            results.append(result)
+            print(f"  trial {result['trial_id']:4d}: best_loss = {result['best_loss']:.6f} "
+                  f"({result['epochs']} epochs, {result['wall_time']:.1f}s)")
+        return results
+
+    def _successive_halving(self, executor: ProcessPoolExecutor,
+                            trials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Train in rungs of growing epoch budgets, keeping the best 1/reduction_factor each rung"""
+        max_epochs = self.training_config['epochs']
+        eta = self.sweep_config.get('reduction_factor', 3)
+        budget = min(self.sweep_config.get('min_epochs', 500), max_epochs)
+        by_id = {trial['trial_id']: trial for trial in trials}
+        final: Dict[int, Dict[str, Any]] = {}
+        active = trials
+        rung = 0
+
+        while active:
+            print(f"Rung: {len(active)} trials, {budget} epochs")
+            last_rung = budget >= max_epochs
+            for trial in active:
+                trial['training_config'] = dict(trial['training_config'], epochs=budget)
+                trial['keep_checkpoint'] = not last_rung
+            rung_results = self._run_batch(executor, active)
+            for result in rung_results:
+                previous = final.get(result['trial_id'])
+                if result['status'] == 'failed':
+                    result['failed_at_rung'] = rung
+                    if previous is not None:
+                        # Gagal saat dilanjutkan: hasil rung terakhir yang selesai tetap dipakai
+                        previous.update(error=result['error'], failed_at_rung=rung)
+                        continue
+                final[result['trial_id']] = result
+            if last_rung:
+                break
+
+            # Trial yang sudah berhenti sendiri (target loss / patience) atau gagal tidak dilanjutkan
+            contenders = sorted((r for r in rung_results if r['status'] == 'completed'),
+                                key=lambda r: r['best_loss'])
+            keep = max(1, len(contenders) // eta) if contenders else 0
+            for result in contenders[keep:]:
+                result['status'] = 'pruned'
+
+            active = []
+            for result in contenders[:keep]:
+                trial = by_id[result['trial_id']]
+                trial['resume'] = True
+                trial['wall_time'] = result['wall_time']
+                active.append(trial)
+            budget = min(budget * eta, max_epochs)
+            rung += 1
+
+        return list(final.values())
+
+    def save_results(self, filepath: str):
+        """Write the results table as CSV (one row per trial, sorted by best_loss)"""
+        param_fields = sorted({key for result in self.results for key in result} - set(RESULT_FIELDS))
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS[:1] + param_fields + RESULT_FIELDS[1:])
+            writer.writeheader()
+            writer.writerows(self.results)
+
+    def print_results(self, top: int = 10):
+        """Print the best trials"""
+        print(f"\n{'trial':>5} | {'status':<10} | {'epochs':>6} | {'best_loss':>10} | {'time':>7} | params")
+        print("-" * 80)
+        for result in self.results[:top]:
+            params = {key: value for key, value in result.items() if key not in RESULT_FIELDS}
+            if result['status'] == 'failed':
+                print(f"{result['trial_id']:5d} | {'failed':<10} | {'-':>6} | {'-':>10} | "
+                      f"{result['wall_time']:6.1f}s | {params} ({result['error']})")
+                continue
+            failure = f" (gagal di rung {result['failed_at_rung']}: {result['error']})" if result.get('error') else ""
+            print(f"{result['trial_id']:5d} | {result['status']:<10} | {result['epochs']:6d} | "
+                  f"{result['best_loss']:10.6f} | {result['wall_time']:6.1f}s | {params}{failure}")
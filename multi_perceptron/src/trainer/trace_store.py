@@ -0,0 +1,139 @@
+"""
+Trace store: semua detailed calculation satu run dalam satu file SQLite
+dengan schema tetap, di-index per (epoch, sample) dan step_type
+"""
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Kolom tabel trace; kolom yang tidak relevan untuk suatu step_type bernilai NULL
+TRACE_COLUMNS = (
+    ('epoch', 'INTEGER NOT NULL'),
+    ('sample_index', 'INTEGER NOT NULL'),
+    ('step_type', 'TEXT NOT NULL'),
+    ('neuron_index', 'INTEGER'),
+    ('from_neuron', 'INTEGER'),
+    ('to_neuron', 'INTEGER'),
+    ('value', 'REAL'),
+    ('weighted_sum', 'REAL'),
+    ('activation_output', 'REAL'),
+    ('target', 'REAL'),
+    ('error', 'REAL'),
+    ('loss_value', 'REAL'),
+    ('prediction', 'REAL'),
+    ('raw_error', 'REAL'),
+    ('sigmoid_derivative', 'REAL'),
+    ('final_error', 'REAL'),
+    ('error_sum', 'REAL'),
+    ('old_weight', 'REAL'),
+    ('new_weight', 'REAL'),
+    ('weight_change', 'REAL'),
+    ('old_bias', 'REAL'),
+    ('new_bias', 'REAL'),
+    ('bias_change', 'REAL'),
+    ('gradient', 'REAL'),
+)
+COLUMN_NAMES = tuple(name for name, _ in TRACE_COLUMNS)
+COLUMN_INDEX = {name: i for i, name in enumerate(COLUMN_NAMES)}
+
+def trace_row(epoch: int, sample_index: int, step_type: str, **fields: Any) -> Tuple[Any, ...]:
+    """Build one row tuple in column order (unspecified columns are NULL)"""
+    row = [None] * len(COLUMN_NAMES)
+    row[0], row[1], row[2] = epoch, sample_index, step_type
+    for name, value in fields.items():
+        row[COLUMN_INDEX[name]] = value
+    return tuple(row)
+
+class TraceStore:
+    """
+    Satu file SQLite per run. Baris ditulis per sample dengan executemany dan
+    di-commit per epoch / saat flush, sehingga tidak ada file per sample.
+    Query dengan filter epoch, sample dan step_type memakai index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS trace "
+                           f"({', '.join(f'{name} {sql_type}' for name, sql_type in TRACE_COLUMNS)})")
+        self._conn.execute('CREATE INDEX IF NOT EXISTS trace_epoch_sample ON trace (epoch, sample_index)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS trace_step_type ON trace (step_type, epoch)')
+        self._conn.commit()
+        self._insert = f"INSERT INTO trace VALUES ({', '.join('?' * len(COLUMN_NAMES))})"
+
+    @classmethod
+    def create(cls, path: str) -> 'TraceStore':
+        """Start a new, empty trace file (an existing one is replaced)"""
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return cls(path)
+
+    def append(self, rows: Sequence[Tuple[Any, ...]]):
+        """Insert rows built with trace_row (committed on the next commit())"""
+        self._conn.executemany(self._insert, rows)
+
+    def truncate_after(self, epoch: int):
+        """Remove rows of epochs after the given one (resume from a checkpoint)"""
+        self._conn.execute('DELETE FROM trace WHERE epoch > ?', (epoch,))
+        self._conn.commit()
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _where(epoch: Optional[int] = None, sample_index: Optional[int] = None,
+               step_type: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """WHERE clause for the optional epoch / sample / step_type filters"""
+        conditions, params = [], []
+        for column, value in (('epoch', epoch), ('sample_index', sample_index), ('step_type', step_type)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(conditions)) if conditions else '', params
+
+    def query(self, epoch: Optional[int] = None, sample_index: Optional[int] = None,
+              step_type: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Rows matching the filters as dicts, in insertion order"""
+        selected = columns or COLUMN_NAMES
+        unknown = set(selected) - set(COLUMN_NAMES)
+        if unknown:
+            raise ValueError(f"Kolom trace tidak dikenal: {sorted(unknown)}")
+        where, params = self._where(epoch, sample_index, step_type)
+        cursor = self._conn.execute(f"SELECT {', '.join(selected)} FROM trace{where} ORDER BY rowid", params)
+        return [dict(row) for row in cursor]
+
+    def column_values(self, column: str, epoch: Optional[int] = None, sample_index: Optional[int] = None,
+                      step_type: Optional[str] = None) -> List[float]:
+        """Non-NULL values of one column, e.g. weight_change of all weight updates"""
+        if column not in COLUMN_INDEX:
+            raise ValueError(f"Kolom trace tidak dikenal: {column}")
+        where, params = self._where(epoch, sample_index, step_type)
+        where = f"{where} AND {column} IS NOT NULL" if where else f" WHERE {column} IS NOT NULL"
+        return [row[0] for row in self._conn.execute(f'SELECT {column} FROM trace{where}', params)]
+
+    def step_counts(self, epoch: Optional[int] = None, sample_index: Optional[int] = None) -> Dict[str, int]:
+        """Number of rows per step_type"""
+        where, params = self._where(epoch, sample_index)
+        cursor = self._conn.execute(f'SELECT step_type, COUNT(*) FROM trace{where} GROUP BY step_type', params)
+        return {step_type: count for step_type, count in cursor}
+
+    def samples(self) -> List[Tuple[int, int]]:
+        """All traced (epoch, sample_index) pairs"""
+        cursor = self._conn.execute('SELECT DISTINCT epoch, sample_index FROM trace ORDER BY epoch, sample_index')
+        return [(epoch, sample_index) for epoch, sample_index in cursor]
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM trace').fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"TraceStore({self.path!r})"
@@ -4,10 +4,21 @@
 Training logic for MLP
 """
 import os
-import json
-from typing import List, Tuple, Dict, Any
-from ..network.mlp import MLP
+import random
+import numpy as np
+from typing import List, Tuple, Dict, Any, Optional, Union
+from ..network.factory import create_network, network_from_dict
+from ..network.vectorized_mlp import VectorizedMLP
+from ..network.optimizers import create_optimizer
 from ..trainer.logger import TrainingLogger
+from ..trainer.async_logger import AsyncTrainingLogger
+from ..trainer.checkpointer import AsyncCheckpointer, find_latest_checkpoint
+from ..trainer.schedulers import create_scheduler
+from ..trainer.parallel import DataParallelEngine, HogwildEngine
+from ..data.streaming import StreamingDataset
+from ..data.cache import ArrayDataset
+from ..data.pipeline import epoch_permutation, iterate_batches
+from ..utils.checkpoint import save_model as save_model_file, model_file_extension, load_model_dict
 import config
 
 class MLPTrainer:
@@ -20,67 +31,190 @@ class MLPTrainer:
         self.network_config = network_config
         self.training_config = training_config
         self.logging_config = logging_config
+        self.models_dir = logging_config.get('models_dir') or config.MODELS_DIR
+        
+        # Resume: TRAINING_CONFIG['resume_from'] berisi path checkpoint atau 'latest'
+        resume_data = self._load_resume_checkpoint(training_config.get('resume_from'))
         
         # Initialize network
-        self.mlp = MLP(**network_config)
+        if resume_data is not None:
+            self.mlp = network_from_dict(resume_data)
+        else:
+            self.mlp = create_network(network_config)
+        
+        # Batch size: 1 = online SGD, N = mini-batch, 'full' = full-batch
+        self.batch_size = training_config.get('batch_size', 1)
+        if self.batch_size != 1 and not isinstance(self.mlp, VectorizedMLP):
+            raise ValueError("batch_size selain 1 membutuhkan NETWORK_CONFIG['engine'] = 'numpy'")
+        
+        # Multi-process training: None, 'data' (data-parallel) atau 'hogwild' (lock-free SGD)
+        self.parallel = training_config.get('parallel')
+        if self.parallel not in (None, 'data', 'hogwild'):
+            raise ValueError(f"parallel harus None, 'data' atau 'hogwild', bukan '{self.parallel}'")
+        if self.parallel and not isinstance(self.mlp, VectorizedMLP):
+            raise ValueError("Mode parallel membutuhkan NETWORK_CONFIG['engine'] = 'numpy'")
+        if self.parallel == 'hogwild' and training_config.get('optimizer', 'sgd') != 'sgd':
+            raise ValueError("Mode 'hogwild' hanya mendukung optimizer 'sgd'")
+        # Data-parallel: setiap worker minimal satu sample per batch, selain itu lebih lambat dari serial
+        num_workers = training_config.get('num_workers') or os.cpu_count()
+        if self.parallel == 'data' and self.batch_size != 'full' and self.batch_size < num_workers:
+            raise ValueError(f"parallel 'data' membutuhkan batch_size >= num_workers ({num_workers}) "
+                             f"atau 'full', bukan {self.batch_size}")
+        
+        # Optimizer: 'sgd', 'momentum', 'nesterov', 'rmsprop' atau 'adam'
+        self.optimizer_name = training_config.get('optimizer', 'sgd')
+        optimizer_params = training_config.get('optimizer_params') or {}
+        if isinstance(self.mlp, VectorizedMLP):
+            self.mlp.set_optimizer(create_optimizer(self.optimizer_name, **optimizer_params))
+        elif self.optimizer_name != 'sgd':
+            raise ValueError(f"Optimizer '{self.optimizer_name}' membutuhkan NETWORK_CONFIG['engine'] = 'numpy'")
+        
+        # Learning rate schedule: None/'constant', 'warmup', 'step', 'exponential', 'cosine', 'plateau'
+        self.scheduler = create_scheduler(training_config.get('lr_schedule'), network_config['learning_rate'],
+                                          **(training_config.get('lr_schedule_params') or {}))
         
-        # Initialize logger
-        self.logger = TrainingLogger(logging_config)
+        # Shuffle per epoch: urutan sample = permutation dari (shuffle_seed, epoch)
+        self.shuffle_data = training_config.get('shuffle_data', False)
+        self.prefetch_batches = training_config.get('prefetch_batches', 0)
+        self.prefetch_min_batch_size = training_config.get('prefetch_min_batch_size', 256)
+        self.shuffle_seed = training_config.get('shuffle_seed')
+        if self.shuffle_seed is None:
+            self.shuffle_seed = network_config.get('seed')
+        if self.shuffle_seed is None:
+            self.shuffle_seed = int(np.random.SeedSequence().entropy % 2**32)
+        if self.shuffle_data and self.parallel:
+            raise ValueError("shuffle_data belum didukung untuk mode parallel")
         
         # Training state
+        self.start_epoch = 0
         self.current_epoch = 0
         self.best_loss = float('inf')
         self.epochs_without_improvement = 0
+        if resume_data is not None:
+            self._restore_trainer_state(resume_data['trainer_state'])
+            self._restore_optimizer_state(resume_data)
+        
+        # Initialize logger (append ke log yang ada saat resume; async_logging = writer thread)
+        self.resume_epoch = self.start_epoch - 1 if resume_data is not None else None
+        logger_class = AsyncTrainingLogger if logging_config.get('async_logging') else TrainingLogger
+        self.logger = logger_class(logging_config, resume_epoch=self.resume_epoch)
     
-    def train(self, training_data: List[Tuple[List[float], List[float]]]):
-        """Main training loop"""
-        print(f"Training dimulai dengan {len(training_data)} samples")
+    def train(self, training_data: Union[List[Tuple[List[float], List[float]]], StreamingDataset]):
+        """Main training loop (training_data: list of samples atau StreamingDataset)"""
+        streaming = isinstance(training_data, StreamingDataset)
+        if streaming and (not isinstance(self.mlp, VectorizedMLP) or self.parallel):
+            raise ValueError("StreamingDataset membutuhkan engine 'numpy' tanpa mode parallel")
+        if streaming and self.shuffle_data:
+            raise ValueError("shuffle_data membutuhkan dataset di memory, bukan StreamingDataset")
+        
+        if streaming:
+            print(f"Training dimulai dengan streaming dataset {training_data}")
+        else:
+            print(f"Training dimulai dengan {len(training_data)} samples")
         print(f"Network: {self.network_config['input_size']} -> {self.network_config['hidden_size']} -> {self.network_config['output_size']}")
-        print(f"Learning rate: {self.network_config['learning_rate']}")
+        print(f"Learning rate: {self.network_config['learning_rate']} (schedule: {self.scheduler.name})")
+        print(f"Batch size: {self.batch_size}")
+        print(f"Optimizer: {self.optimizer_name}")
+        if self.parallel:
+            print(f"Parallel: {self.parallel} ({self.training_config.get('num_workers') or os.cpu_count()} workers)")
         print()
         
-        for epoch in range(self.training_config['epochs']):
-            self.current_epoch = epoch
-            
-            # Determine if we should log detailed calculations
-            should_log_detailed = self._should_log_detailed(epoch)
-            
-            # Train one epoch
-            avg_loss = self._train_epoch(training_data, epoch, should_log_detailed)
-            
-            # Log epoch summary
-            self.logger.log_epoch_summary(epoch, avg_loss, len(training_data))
-            
-            # Print progress
-            if epoch % self.training_config['print_progress_every'] == 0:
-                print(f"Epoch {epoch:4d}: Loss = {avg_loss:.6f}")
-            
-            # Check for improvement
-            if avg_loss < self.best_loss:
-                self.best_loss = avg_loss
-                self.epochs_without_improvement = 0
-            else:
-                self.epochs_without_improvement += 1
-                        
-            # Early stopping
-            if self._should_stop_early(avg_loss):
-                print(f"\nEarly stopping at epoch {epoch}")
-                print(f"Target loss {self.training_config['target_loss']} reached!")
-                break
+        # Engine 'numpy': stack semua sample sekali saja menjadi matrix (N, size)
+        # dan alokasikan workspace untuk training step tanpa alokasi
+        # Streaming: dataset dibaca per chunk setiap epoch, tidak pernah di-stack seluruhnya
+        use_workspace = isinstance(self.mlp, VectorizedMLP)
+        if streaming:
+            self.mlp.allocate_workspace(self._resolve_batch_size(training_data.chunk_size))
+        elif use_workspace:
+            X, Y = self._stack_data(training_data, self.mlp.dtype)
+            self.mlp.allocate_workspace(self._resolve_batch_size(len(X)))
+        n_samples = None if streaming else len(training_data)
+        
+        # Saat resume, checkpoint run sebelumnya (sampai epoch resume) ikut retention policy
+        checkpointer = AsyncCheckpointer.from_config(self.models_dir, self.logging_config,
+                                                     resume_epoch=self.resume_epoch)
+        parallel_engine = None
+        
+        try:
+            # Worker processes dengan dataset dan parameter di shared memory
+            if self.parallel == 'data':
+                parallel_engine = DataParallelEngine(self.mlp, X, Y, self.training_config.get('num_workers'))
+            elif self.parallel == 'hogwild':
+                parallel_engine = HogwildEngine(self.mlp, X, Y, self.training_config.get('num_workers'))
             
-            if self.epochs_without_improvement >= self.training_config['early_stopping_patience']:
-                print(f"\nEarly stopping at epoch {epoch}")
-                print(f"No improvement for {self.training_config['early_stopping_patience']} epochs")
-                break
+            for epoch in range(self.start_epoch, self.training_config['epochs']):
+                self.current_epoch = epoch
+                
+                # Learning rate untuk epoch ini
+                self.mlp.learning_rate = self.scheduler.learning_rate(epoch)
+                
+                # Determine if we should log detailed calculations
+                should_log_detailed = self._should_log_detailed(epoch)
+                
+                # Urutan sample epoch ini (None = urutan file)
+                order = epoch_permutation(self.shuffle_seed, epoch, n_samples) if self.shuffle_data else None
+                
+                # Train one epoch
+                # Epoch yang di-log detail memakai jalur per-sample (dengan trace),
+                # selainnya memakai workspace (mode batch/parallel tidak mendukung detailed log)
+                if streaming:
+                    avg_loss, n_samples = self._train_epoch_stream(training_data)
+                elif parallel_engine is not None:
+                    avg_loss = parallel_engine.train_epoch(self._resolve_batch_size(len(X)))
+                elif use_workspace and (self.batch_size != 1 or not should_log_detailed):
+                    avg_loss = self._train_epoch_batched(X, Y, order)
+                else:
+                    avg_loss = self._train_epoch(training_data, epoch, should_log_detailed, order)
+                
+                # Log epoch summary
+                self.logger.log_epoch_summary(epoch, avg_loss, n_samples, self.mlp.learning_rate)
+                
+                # Print progress
+                if epoch % self.training_config['print_progress_every'] == 0:
+                    print(f"Epoch {epoch:4d}: Loss = {avg_loss:.6f}")
+                
+                # Check for improvement
+                if avg_loss < self.best_loss:
+                    self.best_loss = avg_loss
+                    self.epochs_without_improvement = 0
+                else:
+                    self.epochs_without_improvement += 1
+                self.scheduler.step(epoch, avg_loss)
+                
+                # Periodic checkpoint (ditulis oleh background thread)
+                if checkpointer is not None:
+                    checkpointer.maybe_checkpoint(epoch, avg_loss, lambda: self._snapshot(epoch))
+                
+                # Early stopping
+                if self._should_stop_early(avg_loss):
+                    print(f"\nEarly stopping at epoch {epoch}")
+                    print(f"Target loss {self.training_config['target_loss']} reached!")
+                    break
+                
+                if self.epochs_without_improvement >= self.training_config['early_stopping_patience']:
+                    print(f"\nEarly stopping at epoch {epoch}")
+                    print(f"No improvement for {self.training_config['early_stopping_patience']} epochs")
+                    break
+        finally:
+            # Hentikan worker (parameter disalin kembali dari shared memory)
+            if parallel_engine is not None:
+                parallel_engine.close()
+            # Tunggu checkpoint yang masih antre, juga saat training berhenti karena exception
+            if checkpointer is not None:
+                checkpointer.close()
+            # Tulis baris epoch summary yang masih di-buffer dan tutup trace store
+            self.logger.close()
         
         print(f"\nTraining completed! Best loss: {self.best_loss:.6f}")
     
     def _train_epoch(self, training_data: List[Tuple[List[float], List[float]]], 
-                    epoch: int, log_detailed: bool) -> float:
-        """Train for one epoch"""
+                    epoch: int, log_detailed: bool, order: np.ndarray = None) -> float:
+        """Train for one epoch (order: urutan sample, None = urutan dataset)"""
         total_loss = 0.0
         
-        for sample_idx, (inputs, targets) in enumerate(training_data):
+        for sample_idx in (range(len(training_data)) if order is None else order.tolist()):
+            inputs, targets = training_data[sample_idx]
+            
             # Forward pass
             hidden_inputs, hidden_outputs, output_inputs, final_outputs = self.mlp.forward_pass(inputs)
             
@@ -88,8 +222,13 @@ class MLPTrainer:
             loss = self.mlp.calculate_loss(final_outputs, targets)
             total_loss += loss
             
-            # Backward pass
-            calculations = self.mlp.backward_pass(inputs, hidden_outputs, final_outputs, targets)
+            # Backward pass (trace hanya dibangun untuk epoch yang di-log detail;
+            # logger async menerima TraceRecord dan membangun dict-nya di writer thread)
+            trace = log_detailed
+            if log_detailed and self.logger.trace_records and isinstance(self.mlp, VectorizedMLP):
+                trace = 'record'
+            calculations = self.mlp.backward_pass(inputs, hidden_outputs, final_outputs, targets,
+                                                  trace=trace)
             
             # Log detailed calculations if needed
             if log_detailed:
@@ -101,53 +240,191 @@ class MLPTrainer:
         
         return total_loss / len(training_data)
     
+    def _train_epoch_batched(self, X: np.ndarray, Y: np.ndarray, order: np.ndarray = None) -> float:
+        """
+        Train for one epoch on stacked data (online, mini-batch atau full-batch).
+        Satu train_step per batch, gradient dirata-rata sebelum update.
+        Detailed per-sample logging hanya tersedia untuk batch_size = 1.
+        Dengan order, batch dirakit sesuai permutation (di background thread jika prefetch_batches > 0
+        dan batch cukup besar untuk menutup biaya handoff antar thread).
+        """
+        n_samples = X.shape[0]
+        batch_size = self._resolve_batch_size(n_samples)
+        total_loss = 0.0
+        
+        prefetch = self.prefetch_batches if batch_size >= self.prefetch_min_batch_size else 0
+        for X_batch, Y_batch in iterate_batches(X, Y, batch_size, order, prefetch):
+            total_loss += self.mlp.train_step(X_batch, Y_batch)
+        
+        return total_loss / n_samples
+    
+    def _train_epoch_stream(self, dataset: StreamingDataset) -> Tuple[float, int]:
+        """
+        One pass over a StreamingDataset: setiap chunk dilatih dengan batch_size
+        ('full' = satu batch per chunk). Returns: (average loss, jumlah sample)
+        """
+        total_loss = 0.0
+        n_samples = 0
+        
+        for X, Y in dataset:
+            batch_size = self._resolve_batch_size(X.shape[0])
+            for start in range(0, X.shape[0], batch_size):
+                total_loss += self.mlp.train_step(X[start:start + batch_size], Y[start:start + batch_size])
+            n_samples += X.shape[0]
+        
+        if n_samples == 0:
+            raise ValueError(f"Dataset kosong: {dataset.file_path}")
+        return total_loss / n_samples, n_samples
+    
+    def _resolve_batch_size(self, n_samples: int) -> int:
+        """Convert the configured batch_size into a concrete number of samples"""
+        if self.batch_size in ('full', None, 0):
+            return n_samples
+        if not isinstance(self.batch_size, int) or self.batch_size < 0:
+            raise ValueError(f"batch_size tidak valid: {self.batch_size!r}")
+        return min(self.batch_size, n_samples)
+    
+    @staticmethod
+    def _stack_data(training_data: List[Tuple[Any, Any]], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """Stack (inputs, targets) tuples into X (N, input_size) and Y (N, output_size)"""
+        if isinstance(training_data, ArrayDataset):
+            # Sudah berupa array (memmap dari cache): dipakai langsung tanpa copy jika dtype sama
+            return np.asarray(training_data.X, dtype=dtype), np.asarray(training_data.Y, dtype=dtype)
+        X = np.array([np.asarray(inputs).reshape(-1) for inputs, _ in training_data], dtype=dtype)
+        Y = np.array([np.asarray(targets).reshape(-1) for _, targets in training_data], dtype=dtype)
+        return X, Y
+    
     def _should_log_detailed(self, epoch: int) -> bool:
-        """Determine if we should log detailed calculations"""
+        """Determine if we should log detailed calculations (log_detailed_every None = off)"""
+        every = self.training_config['log_detailed_every']
         return (epoch < self.training_config['log_first_epochs'] or 
-                epoch % self.training_config['log_detailed_every'] == 0)
+                bool(every) and epoch % every == 0)
     
     def _should_stop_early(self, current_loss: float) -> bool:
         """Check if we should stop training early"""
         return current_loss <= self.training_config['target_loss']
     
-    def _save_checkpoint(self, epoch: int):
-        """Save model checkpoint"""
-        checkpoint_file = os.path.join(
-            config.MODELS_DIR, 
-            self.logging_config['model_save_pattern'].format(epoch=epoch)
-        )
+    def _snapshot(self, epoch: int) -> Dict[str, Any]:
+        """Model snapshot plus the trainer state needed to resume after this epoch"""
+        data = self.mlp.snapshot()
+        data['trainer_state'] = self._trainer_state(epoch)
+        
+        # Epoch summary sampai epoch ini harus ada di file sebelum checkpoint-nya (untuk resume);
+        # async logger: tunggu writer thread
+        self.logger.flush(wait=True)
         
-        with open(checkpoint_file, 'w') as f:
-            json.dump(self.mlp.to_dict(), f, indent=2)
+        # State optimizer: buffers per-parameter disimpan sebagai array (optimizer_<buffer>)
+        if isinstance(self.mlp, VectorizedMLP):
+            state = self.mlp.optimizer.state_dict()
+            data['trainer_state']['optimizer'] = {'name': state['name'], 'step_count': state['step_count']}
+            for name, buffer in state['buffers'].items():
+                data[f'optimizer_{name}'] = buffer
+        return data
+    
+    def _trainer_state(self, epoch: int) -> Dict[str, Any]:
+        """Training state at the end of the given epoch (JSON-serializable)"""
+        version, internal, gauss_next = random.getstate()
+        return {
+            'epoch': epoch,
+            'best_loss': self.best_loss,
+            'epochs_without_improvement': self.epochs_without_improvement,
+            'scheduler': self.scheduler.state_dict(),
+            'shuffle_seed': self.shuffle_seed,
+            'python_random_state': [version, list(internal), gauss_next]
+        }
+    
+    def _restore_trainer_state(self, state: Dict[str, Any]):
+        """Restore the state saved by _trainer_state; training continues at the next epoch"""
+        self.start_epoch = state['epoch'] + 1
+        self.current_epoch = state['epoch']
+        self.best_loss = state['best_loss']
+        self.epochs_without_improvement = state['epochs_without_improvement']
+        self.scheduler.load_state_dict(state.get('scheduler', {}))
+        self.shuffle_seed = state.get('shuffle_seed', self.shuffle_seed)
+        version, internal, gauss_next = state['python_random_state']
+        random.setstate((version, tuple(internal), gauss_next))
     
-    def save_model(self):
-        """Save final trained model"""
-        model_file = os.path.join(config.MODELS_DIR, self.logging_config['final_model_file'])
+    def _restore_optimizer_state(self, data: Dict[str, Any]):
+        """Restore the optimizer buffers saved by _snapshot (checkpoints without them start fresh)"""
+        state = data['trainer_state'].get('optimizer')
+        if state is None or not isinstance(self.mlp, VectorizedMLP):
+            return
+        buffers = {name: data[f'optimizer_{name}'] for name in self.mlp.optimizer.buffers}
+        self.mlp.optimizer.load_state_dict({**state, 'buffers': buffers})
+    
+    def _load_resume_checkpoint(self, resume_from: str = None) -> Dict[str, Any]:
+        """Load the checkpoint to resume from (None when not resuming)"""
+        if not resume_from:
+            return None
+        if resume_from == 'latest':
+            resume_from = find_latest_checkpoint(self.models_dir, self.logging_config['model_save_pattern'],
+                                                 self.logging_config.get('model_format', 'json'))
+            if resume_from is None:
+                print("Tidak ada checkpoint untuk di-resume, training dimulai dari awal")
+                return None
         
-        with open(model_file, 'w') as f:
-            json.dump(self.mlp.to_dict(), f, indent=2)
+        data = load_model_dict(resume_from, mmap=False)
+        if 'trainer_state' not in data:
+            raise ValueError(f"Checkpoint '{resume_from}' tidak berisi trainer_state (bukan checkpoint periodik)")
+        print(f"Resume dari checkpoint: {resume_from} (epoch {data['trainer_state']['epoch']})")
+        return data
+    
+    def save_checkpoint(self, epoch: Optional[int] = None) -> str:
+        """
+        Save a resumable checkpoint (model + trainer state) synchronously and return its path.
+        epoch None = epoch terakhir yang selesai dilatih.
+        """
+        if epoch is None:
+            epoch = self.current_epoch
+        model_format = self.logging_config.get('model_format', 'json')
+        checkpoint_file = os.path.join(
+            self.models_dir, 
+            self.logging_config['model_save_pattern'].format(epoch=epoch, ext=model_file_extension(model_format))
+        )
+        save_model_file(checkpoint_file, self._snapshot(epoch), model_format)
+        return checkpoint_file
+    
+    def save_model(self, model_format: str = None):
+        """Save final trained model (model_format overrides LOGGING_CONFIG, e.g. 'json' for export)"""
+        model_format = model_format or self.logging_config.get('model_format', 'json')
+        model_file = os.path.join(
+            self.models_dir,
+            self.logging_config['final_model_file'].format(ext=model_file_extension(model_format))
+        )
+        self._write_model(model_file, model_format)
         
         print(f"Model saved to: {model_file}")
     
-    def test(self, test_data: List[Tuple[Any, Any]]):
+    def _write_model(self, filepath: str, model_format: str):
+        """Write the current model as a binary checkpoint or pretty-printed JSON"""
+        save_model_file(filepath, self.mlp.snapshot(), model_format)
+    
+    def test(self, test_data: Union[List[Tuple[Any, Any]], StreamingDataset]):
         """Test the trained network"""
         # Sedikit penyesuaian pada header untuk output yang lebih rapi
         print("Input\t\t| Expected | Predicted | Error")
         print("-" * 50)
         
-        for inputs, expected in test_data:
-            # Mengambil prediksi dari model
-            prediction = self.mlp.predict(inputs.flatten().tolist())
-            
-            # --- FIX: Ekstrak nilai skalar dari array NumPy menggunakan .item() ---
-            expected_value = expected.item()
+        # Prediksi sekaligus dengan satu batched forward pass (per chunk untuk StreamingDataset)
+        if isinstance(test_data, StreamingDataset):
+            chunks = iter(test_data)
+        else:
+            chunks = [self._stack_data(test_data, getattr(self.mlp, 'dtype', np.float64))]
+        
+        for X, Y in chunks:
+            self._print_predictions(X, Y, self.mlp.predict_batch(X))
+    
+    def _print_predictions(self, X: np.ndarray, Y: np.ndarray, predictions: np.ndarray):
+        """Print one row per sample: input, expected, predicted, error"""
+        for inputs, expected, prediction in zip(X, Y, predictions):
+            expected_value = expected[0]
             prediction_value = prediction[0]
             
             # Hitung error menggunakan nilai skalar
             error = abs(expected_value - prediction_value)
             
             # Mengubah input array menjadi string yang lebih rapi untuk dicetak
-            input_str = str(inputs.flatten().tolist())
+            input_str = str(inputs.tolist())
             
             # Cetak menggunakan nilai skalar yang sudah diekstrak
             print(f"{input_str:<15}\t| {expected_value:.4f}   | {prediction_value:.4f}    | {error:.4f}")
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Binary, memory-mappable model checkpoint format
+
+Layout file:
+    MAGIC (8 bytes) | header_len (uint32 little-endian) | JSON header | raw arrays
+JSON header berisi metadata model (sizes, dtype, activation, ...) dan
+untuk setiap array: dtype, shape dan offset (byte) di dalam file.
+Setiap array disimpan C-order dan di-align ke 64 byte sehingga bisa
+dibaca langsung sebagai view dari satu np.memmap (read-only), dan
+banyak proses berbagi satu salinan di page cache.
+"""
+import json
+import os
+import numpy as np
+from typing import Any, Dict, Tuple
+
+MAGIC = b'MLPCKPT1'
+ALIGNMENT = 64
+PARAM_NAMES = ('weights_input_hidden', 'weights_hidden_output', 'bias_hidden', 'bias_output')
+
+def _align(offset: int) -> int:
+    """Round offset up to the next multiple of ALIGNMENT"""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def model_file_extension(model_format: str) -> str:
+    """File extension used for a model_format ('binary' -> ckpt, 'json' -> json)"""
+    return 'ckpt' if model_format == 'binary' else 'json'
+
+def is_binary_checkpoint(filepath: str) -> bool:
+    """Check the magic bytes of a file"""
+    with open(filepath, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def save_binary_checkpoint(filepath: str, arrays: Dict[str, np.ndarray],
+                           metadata: Dict[str, Any], fsync: bool = False):
+    """
+    Write arrays + metadata to filepath.
+    File ditulis ke .tmp lalu os.replace, sehingga reader tidak pernah
+    melihat file setengah jadi.
+    """
+    arrays = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+
+    # Hitung offset relatif terhadap awal data section
+    entries = {}
+    offset = 0
+    for name, arr in arrays.items():
+        offset = _align(offset)
+        entries[name] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+        offset += arr.nbytes
+
+    header = {'metadata': metadata, 'arrays': entries}
+    header_bytes = json.dumps(header).encode('utf-8')
+    prefix_len = len(MAGIC) + 4
+    data_start = _align(prefix_len + len(header_bytes))
+    header_bytes += b' ' * (data_start - prefix_len - len(header_bytes))
+
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        for name, arr in arrays.items():
+            position = data_start + entries[name]['offset']
+            f.write(b'\0' * (position - f.tell()))
+            f.write(arr.tobytes(order='C'))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    if fsync:
+        _fsync_directory(filepath)
+
+def _fsync_directory(filepath: str):
+    """fsync the parent directory so the rename itself is durable (POSIX only)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(filepath)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _read_header(f, filepath: str) -> Tuple[Dict[str, Any], int]:
+    """Read the JSON header; returns (header, offset of the data section)"""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"Bukan binary checkpoint: {filepath}")
+    header_len = int.from_bytes(f.read(4), 'little')
+    return json.loads(f.read(header_len)), len(MAGIC) + 4 + header_len
+
+def load_binary_checkpoint(filepath: str, mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Read a checkpoint. Dengan mmap=True setiap array adalah view read-only
+    dari satu np.memmap (zero-copy); dengan mmap=False array dibaca ke memory.
+    Returns: (metadata, arrays)
+    """
+    with open(filepath, 'rb') as f:
+        header, data_start = _read_header(f, filepath)
+
+        if mmap:
+            buffer = np.memmap(filepath, dtype=np.uint8, mode='r')
+        else:
+            f.seek(0)
+            buffer = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        count = int(np.prod(entry['shape'], dtype=np.int64))
+        start = data_start + entry['offset']
+        raw = buffer[start:start + count * dtype.itemsize]
+        arrays[name] = raw.view(dtype).reshape(entry['shape'])
+    return header['metadata'], arrays
+
+def save_model_checkpoint(filepath: str, model_dict: Dict[str, Any], fsync: bool = False):
+    """
+    Save the output of MLP.to_dict (or a parameter snapshot) in binary format.
+    Value ndarray lain di top-level (mis. state optimizer) juga disimpan sebagai array.
+    """
+    dtype = np.dtype(model_dict.get('dtype', 'float64'))
+    arrays = {name: np.asarray(model_dict[name], dtype=dtype) for name in PARAM_NAMES}
+    arrays.update({key: value for key, value in model_dict.items()
+                   if isinstance(value, np.ndarray) and key not in arrays})
+    metadata = {key: value for key, value in model_dict.items() if key not in arrays}
+    save_binary_checkpoint(filepath, arrays, metadata, fsync=fsync)
+
+def save_model_json(filepath: str, model_dict: Dict[str, Any], fsync: bool = False):
+    """Save a model dict as pretty-printed JSON (arrays are converted with tolist)"""
+    data = {key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in model_dict.items()}
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    if fsync:
+        _fsync_directory(filepath)
+
+def save_model(filepath: str, model_dict: Dict[str, Any], model_format: str, fsync: bool = False):
+    """Save a model dict in 'binary' or 'json' format"""
+    if model_format == 'binary':
+        save_model_checkpoint(filepath, model_dict, fsync=fsync)
+    elif model_format == 'json':
+        save_model_json(filepath, model_dict, fsync=fsync)
+    else:
+        raise ValueError(f"model_format tidak dikenal: '{model_format}' (pilih 'binary' atau 'json')")
+
+def load_model_checkpoint(filepath: str, mmap: bool = True) -> Dict[str, Any]:
+    """Load a binary checkpoint into the MLP.to_dict layout (parameters as arrays)"""
+    metadata, arrays = load_binary_checkpoint(filepath, mmap=mmap)
+    model_dict = dict(metadata)
+    model_dict.update(arrays)
+    return model_dict
+
+def load_model_metadata(filepath: str) -> Dict[str, Any]:
+    """Metadata of a saved model; binary checkpoint: hanya header yang dibaca (JSON dibaca utuh)"""
+    if is_binary_checkpoint(filepath):
+        with open(filepath, 'rb') as f:
+            return _read_header(f, filepath)[0]['metadata']
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_model_dict(filepath: str, mmap: bool = True) -> Dict[str, Any]:
+    """Load a saved model in either binary or JSON format"""
+    if is_binary_checkpoint(filepath):
+        return load_model_checkpoint(filepath, mmap=mmap)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
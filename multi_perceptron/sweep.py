@@ -0,0 +1,36 @@
+import argparse
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.trainer.sweep import HyperparameterSweep
+from src.data.dataset import XORDataset
+import config
+
+def main():
+    """Run the hyperparameter sweep from SWEEP_CONFIG across all cores"""
+    sweep_config = dict(config.SWEEP_CONFIG)
+    parser = argparse.ArgumentParser(description="Parallel MLP hyperparameter sweep")
+    parser.add_argument('--search', choices=['grid', 'random'], default=sweep_config['search'])
+    parser.add_argument('--num-samples', type=int, default=sweep_config['num_samples'])
+    parser.add_argument('--workers', type=int, default=sweep_config['max_workers'])
+    parser.add_argument('--halving', action='store_true', default=sweep_config['successive_halving'])
+    parser.add_argument('--output-dir', default=sweep_config['output_dir'])
+    args = parser.parse_args()
+    
+    sweep_config.update(search=args.search, num_samples=args.num_samples, max_workers=args.workers,
+                        successive_halving=args.halving, output_dir=args.output_dir)
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    training_data = XORDataset().get_data()
+    sweep = HyperparameterSweep(config.NETWORK_CONFIG, config.TRAINING_CONFIG,
+                                config.LOGGING_CONFIG, sweep_config)
+    sweep.run(training_data)
+    sweep.print_results()
+    
+    results_file = os.path.join(args.output_dir, sweep_config['results_file'])
+    sweep.save_results(results_file)
+    print(f"\nHasil sweep disimpan di: {results_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Pytest setup: project root di sys.path (import seperti main.py) dan fixture bersama
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+XOR_SAMPLES = [([0.0, 0.0], [0.0]), ([0.0, 1.0], [1.0]), ([1.0, 0.0], [1.0]), ([1.0, 1.0], [0.0])]
+
+@pytest.fixture
+def xor_data():
+    """XOR dataset tanpa membaca data/input (dan tanpa membuat cache)"""
+    return [(list(inputs), list(targets)) for inputs, targets in XOR_SAMPLES]
+
+@pytest.fixture
+def logging_config(tmp_path):
+    """LOGGING_CONFIG dengan logs dan models di tmp_path"""
+    logs_dir, models_dir = tmp_path / 'logs', tmp_path / 'models'
+    logs_dir.mkdir()
+    models_dir.mkdir()
+    return dict(config.LOGGING_CONFIG, logs_dir=str(logs_dir), models_dir=str(models_dir))
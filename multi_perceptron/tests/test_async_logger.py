@@ -0,0 +1,98 @@
+"""
+AsyncTrainingLogger: file log sama dengan logger sinkron, flush(wait=True), dan backpressure
+"""
+import csv
+import random
+import threading
+import time
+import pytest
+from src.trainer.async_logger import AsyncTrainingLogger
+from src.trainer.trace_store import TraceStore
+from src.trainer.trainer import MLPTrainer
+import config
+
+def _train(xor_data, logging_config, **overrides):
+    training_config = dict(config.TRAINING_CONFIG, epochs=20, log_first_epochs=3, log_detailed_every=10,
+                           print_progress_every=10 ** 9)
+    random.seed(0)
+    trainer = MLPTrainer(dict(config.NETWORK_CONFIG, engine='python'), training_config,
+                         dict(logging_config, **overrides))
+    trainer.train(xor_data)
+    with open(trainer.logger.epoch_summary_file, encoding='utf-8') as f:
+        summary = f.read()
+    store = TraceStore(trainer.logger.trace_file)
+    rows = store.query()
+    store.close()
+    return summary, rows
+
+def test_async_logs_match_sync(tmp_path, xor_data):
+    def logging_config(name):
+        directory = tmp_path / name
+        directory.mkdir()
+        return dict(config.LOGGING_CONFIG, logs_dir=str(directory), models_dir=str(directory))
+
+    sync_summary, sync_rows = _train(xor_data, logging_config('sync'))
+    async_summary, async_rows = _train(xor_data, logging_config('async'), async_logging=True)
+    assert async_summary == sync_summary
+    assert async_rows == sync_rows and len(sync_rows) > 0
+
+def test_flush_wait_writes_queued_rows(logging_config):
+    logger = AsyncTrainingLogger(dict(logging_config, summary_flush_every=100, summary_flush_seconds=None))
+    for epoch in range(3):
+        logger.log_epoch_summary(epoch, 0.5, 4)
+    logger.flush(wait=True)
+    with open(logger.epoch_summary_file, newline='', encoding='utf-8') as f:
+        assert len(list(csv.reader(f))) == 1 + 3
+    logger.close()
+
+def _slow_logger(logging_config, policy, delay=0.0, gate=None, **overrides):
+    """Logger dengan writer trace yang lambat (delay) atau tertahan (gate); trace yang ditulis dicatat"""
+    logger = AsyncTrainingLogger(dict(logging_config, log_backpressure=policy, log_queue_size=2, **overrides))
+    logger.written = []
+    logger.writing = threading.Event()
+
+    def write_trace(epoch, *args):
+        logger.writing.set()
+        if gate is not None:
+            gate.wait()
+        time.sleep(delay)
+        logger.written.append(epoch)
+
+    logger._write_trace = write_trace
+    return logger
+
+def _log_traces(logger, epochs):
+    for epoch in epochs:
+        logger.log_detailed_calculation(epoch, 0, None, None, None, None, None, None, 0.0, None)
+
+def test_drop_traces_never_blocks(logging_config):
+    gate = threading.Event()
+    logger = _slow_logger(logging_config, 'drop_traces', gate=gate)
+    _log_traces(logger, [0])
+    assert logger.writing.wait(5)
+    # Writer tertahan: 2 trace masuk queue, sisanya dibuang tanpa menunggu
+    _log_traces(logger, range(1, 11))
+    gate.set()
+    logger.close()
+    assert logger.dropped_traces == 8
+    assert logger.written == [0, 1, 2]
+
+def test_sample_keeps_every_nth_overflowing_trace(logging_config):
+    logger = _slow_logger(logging_config, 'sample', delay=0.01, trace_sample_every=3)
+    _log_traces(logger, range(30))
+    logger.close()
+    assert logger.dropped_traces > 0
+    assert logger._full_count - logger.dropped_traces == logger._full_count // 3
+    assert len(logger.written) + logger.dropped_traces == 30
+    assert logger.written == sorted(logger.written)
+
+def test_block_keeps_every_trace(logging_config):
+    logger = _slow_logger(logging_config, 'block', delay=0.002)
+    _log_traces(logger, range(20))
+    logger.close()
+    assert logger.dropped_traces == 0
+    assert logger.written == list(range(20))
+
+def test_unknown_policy(logging_config):
+    with pytest.raises(ValueError, match='log_backpressure'):
+        AsyncTrainingLogger(dict(logging_config, log_backpressure='drop_all'))
@@ -0,0 +1,59 @@
+"""
+BatchedMLP: model k harus identik dengan VectorizedMLP(seed=seeds[k])
+"""
+import numpy as np
+import pytest
+from src.network.batched_mlp import BatchedMLP
+from src.network.vectorized_mlp import VectorizedMLP
+from src.trainer.batched_trainer import BatchedTrainer
+import config
+
+def test_batched_model_matches_vectorized_mlp():
+    seeds, learning_rates = [0, 1, 2], [0.5, 1.0, 2.0]
+    rng = np.random.default_rng(3)
+    X, T = rng.random((8, 2)), rng.random((8, 1))
+
+    batched = BatchedMLP(seeds, 2, 4, 1, learning_rate=learning_rates, weight_init='xavier',
+                         hidden_activation='leaky_relu')
+    singles = [VectorizedMLP(2, 4, 1, learning_rate=lr, weight_init='xavier', seed=seed,
+                             hidden_activation='leaky_relu')
+               for seed, lr in zip(seeds, learning_rates)]
+
+    for _ in range(20):
+        losses = batched.train_step(X, T)
+        for k, mlp in enumerate(singles):
+            # Loss hanya berbeda urutan reduksi (einsum vs vdot); parameter harus identik
+            np.testing.assert_allclose(losses[k], mlp.train_step(X, T), rtol=1e-12)
+    for k, mlp in enumerate(singles):
+        np.testing.assert_array_equal(batched.flat_parameters[k], mlp.flat_parameters)
+
+def test_inactive_models_are_not_updated():
+    rng = np.random.default_rng(4)
+    X, T = rng.random((4, 2)), rng.random((4, 1))
+    batched = BatchedMLP([0, 1, 2], 2, 3, 1)
+    before = batched.flat_parameters.copy()
+
+    batched.train_step(X, T, active=np.array([True, False, True]))
+
+    np.testing.assert_array_equal(batched.flat_parameters[1], before[1])
+    assert not np.array_equal(batched.flat_parameters[0], before[0])
+    assert not np.array_equal(batched.flat_parameters[2], before[2])
+
+@pytest.mark.parametrize('overrides', [
+    {'optimizer': 'adam'},
+    {'lr_schedule': 'cosine'},
+    {'shuffle_data': True},
+    {'resume_from': 'latest'},
+    {'batch_size': 0},
+    {'batch_size': 'half'},
+])
+def test_batched_trainer_rejects_unsupported_settings(logging_config, overrides):
+    with pytest.raises(ValueError):
+        BatchedTrainer(config.NETWORK_CONFIG, dict(config.TRAINING_CONFIG, **overrides), logging_config, seeds=[0, 1])
+
+@pytest.mark.parametrize('batch_size', [1, 3, 'full'])
+def test_batched_trainer_batch_sizes(logging_config, xor_data, batch_size):
+    training_config = dict(config.TRAINING_CONFIG, epochs=5, batch_size=batch_size, print_progress_every=10 ** 9)
+    trainer = BatchedTrainer(config.NETWORK_CONFIG, training_config, logging_config, seeds=[0, 1])
+    trainer.train(xor_data)
+    assert trainer.loss_curves.shape == (5, 2)
@@ -0,0 +1,68 @@
+"""
+Dataset cache: cache dipakai ulang selama file sumber sama, diganti saat file berubah,
+dan dibaca sebagai memmap read-only (pickle hanya membawa path)
+"""
+import json
+import os
+import pickle
+import numpy as np
+from src.data.cache import ArrayDataset, cache_key, cache_paths, load_cached_dataset
+
+def _write_jsonl(path, samples):
+    with open(path, 'w', encoding='utf-8') as f:
+        for inputs, targets in samples:
+            f.write(json.dumps({'input': inputs, 'target': targets}) + '\n')
+
+def test_cache_invalidated_when_source_changes(tmp_path, xor_data):
+    source = str(tmp_path / 'xor.jsonl')
+    cache_dir = str(tmp_path / 'cache')
+    os.makedirs(cache_dir)
+    _write_jsonl(source, xor_data)
+
+    dataset = load_cached_dataset(source, cache_dir)
+    old_files = cache_paths(source, cache_dir)
+    assert len(dataset) == 4
+    assert sorted(os.listdir(cache_dir)) == sorted(os.path.basename(path) for path in old_files)
+    np.testing.assert_array_equal(dataset.X, [inputs for inputs, _ in xor_data])
+
+    # Sumber tidak berubah: cache yang sama dipakai ulang
+    assert load_cached_dataset(source, cache_dir).cache_files == dataset.cache_files
+
+    old_key = cache_key(source)
+    _write_jsonl(source, xor_data + [([0.5, 0.5], [1.0])])
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache_key(source) != old_key
+
+    dataset = load_cached_dataset(source, cache_dir)
+    assert len(dataset) == 5
+    np.testing.assert_array_equal(dataset.Y[-1], [1.0])
+    assert not any(os.path.exists(path) for path in old_files)
+    assert sorted(os.listdir(cache_dir)) == sorted(os.path.basename(path) for path in cache_paths(source, cache_dir))
+
+def test_cached_dataset_is_read_only_memmap(tmp_path, xor_data):
+    source = str(tmp_path / 'xor.jsonl')
+    _write_jsonl(source, xor_data)
+    dataset = load_cached_dataset(source, str(tmp_path / 'cache'), dtype=np.float32)
+
+    assert isinstance(dataset.X, np.memmap) and not dataset.X.flags.writeable
+    assert dataset.X.dtype == np.float32
+    inputs, targets = dataset[1]
+    assert inputs.shape == (2, 1) and targets.shape == (1, 1)
+    assert np.shares_memory(inputs, dataset.X)
+
+def test_pickle_sends_cache_paths_only(tmp_path, xor_data):
+    source = str(tmp_path / 'xor.jsonl')
+    _write_jsonl(source, xor_data * 250)
+    dataset = load_cached_dataset(source, str(tmp_path / 'cache'))
+
+    payload = pickle.dumps(dataset)
+    # Hanya path yang dikirim ke worker process, bukan isi array (1000 x 3 float64)
+    assert len(payload) < 1000
+    assert dataset.cache_files[0].encode() in payload
+    restored = pickle.loads(payload)
+    assert isinstance(restored.X, np.memmap)
+    np.testing.assert_array_equal(restored.X, dataset.X)
+
+    in_memory = ArrayDataset(np.asarray(dataset.X), np.asarray(dataset.Y))
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(in_memory)).Y, dataset.Y)
@@ -0,0 +1,57 @@
+"""
+Model checkpoint: round-trip save/load dalam format binary dan JSON
+"""
+import os
+import numpy as np
+import pytest
+from src.network.factory import create_network, network_from_dict
+from src.network.inference import InferenceModel
+from src.utils.checkpoint import (ALIGNMENT, PARAM_NAMES, load_binary_checkpoint, load_model_dict,
+                                  model_file_extension, save_model)
+import config
+
+@pytest.mark.parametrize('model_format', ['binary', 'json'])
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_checkpoint_round_trip(tmp_path, xor_data, model_format, engine):
+    mlp = create_network(dict(config.NETWORK_CONFIG, engine=engine, hidden_size=3,
+                              weight_init='xavier', seed=5))
+    filepath = str(tmp_path / f"model.{model_file_extension(model_format)}")
+    save_model(filepath, mlp.snapshot(), model_format)
+
+    data = load_model_dict(filepath, mmap=False)
+    loaded = network_from_dict(data)
+    assert type(loaded) is type(mlp)
+    assert loaded.to_dict() == mlp.to_dict()
+    assert (loaded.weight_init, loaded.seed) == ('xavier', 5)
+
+    inference = InferenceModel.load(filepath)
+    for inputs, _ in xor_data:
+        np.testing.assert_array_equal(np.asarray(loaded.predict(inputs)).reshape(-1),
+                                      np.asarray(mlp.predict(inputs)).reshape(-1))
+        np.testing.assert_allclose(inference.predict(inputs), np.asarray(mlp.predict(inputs)).reshape(-1),
+                                   rtol=1e-12)
+
+def test_binary_checkpoint_is_memory_mapped(tmp_path):
+    mlp = create_network(dict(config.NETWORK_CONFIG, engine='numpy', dtype='float32', seed=1))
+    snapshot = mlp.snapshot()
+    snapshot['optimizer_velocity'] = np.arange(mlp.num_parameters, dtype=np.float32)
+    filepath = str(tmp_path / 'model.ckpt')
+    save_model(filepath, snapshot, 'binary')
+    assert os.listdir(tmp_path) == ['model.ckpt']
+
+    metadata, arrays = load_binary_checkpoint(filepath, mmap=True)
+    assert metadata['dtype'] == 'float32' and metadata['seed'] == 1
+    for array in arrays.values():
+        # View read-only dari satu memmap, di-align ke ALIGNMENT byte
+        assert not array.flags.writeable
+        assert array.ctypes.data % ALIGNMENT == 0
+    for name in PARAM_NAMES:
+        assert arrays[name].dtype == np.float32
+        np.testing.assert_array_equal(arrays[name], snapshot[name])
+    np.testing.assert_array_equal(arrays['optimizer_velocity'], snapshot['optimizer_velocity'])
+
+def test_load_rejects_non_checkpoint(tmp_path):
+    filepath = tmp_path / 'model.ckpt'
+    filepath.write_bytes(b'not a checkpoint')
+    with pytest.raises(ValueError):
+        load_binary_checkpoint(str(filepath))
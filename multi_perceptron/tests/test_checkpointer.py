@@ -0,0 +1,41 @@
+"""
+AsyncCheckpointer: retention keep_last / keep_best dan checkpoint run sebelumnya
+"""
+from src.network.factory import create_network
+from src.trainer.checkpointer import AsyncCheckpointer, list_checkpoints
+from src.utils.checkpoint import load_model_metadata
+import config
+
+PATTERN = 'model_epoch_{epoch}.{ext}'
+
+def _snapshot():
+    return create_network(dict(config.NETWORK_CONFIG, engine='numpy', seed=0)).snapshot()
+
+def _write(directory, losses, start=0, keep_last=2, keep_best=True, resume_epoch=None):
+    """Checkpoint epoch start, start+1, ... dengan loss tersebut; return epoch yang tersisa di disk"""
+    # max_pending cukup besar agar tidak ada checkpoint yang dilewati
+    checkpointer = AsyncCheckpointer(str(directory), PATTERN, keep_last=keep_last, keep_best=keep_best,
+                                     max_pending=len(losses), resume_epoch=resume_epoch)
+    for epoch, loss in enumerate(losses, start=start):
+        assert checkpointer.checkpoint(epoch, loss, _snapshot)
+    checkpointer.close()
+    assert checkpointer.errors == []
+    return [epoch for epoch, _ in list_checkpoints(str(directory), PATTERN)]
+
+def test_keep_last_and_best(tmp_path):
+    assert _write(tmp_path, [0.5, 0.1, 0.4, 0.3, 0.2]) == [1, 3, 4]
+    assert load_model_metadata(str(tmp_path / 'model_epoch_1.ckpt'))['checkpoint_loss'] == 0.1
+
+def test_keep_last_only(tmp_path):
+    assert _write(tmp_path, [0.5, 0.1, 0.4, 0.3, 0.2], keep_best=False) == [3, 4]
+
+def test_fresh_run_leaves_existing_checkpoints_alone(tmp_path):
+    # File run sebelumnya dengan loss lebih kecil tidak ikut retention run baru
+    _write(tmp_path, [0.01, 0.02], keep_last=5)
+    assert _write(tmp_path, [0.5, 0.4, 0.3], start=10, keep_last=1) == [0, 1, 12]
+
+def test_resume_adopts_checkpoints_up_to_resume_epoch(tmp_path):
+    _write(tmp_path, [0.5, 0.1, 0.4, 0.3], keep_last=5)
+    # Resume dari epoch 2: epoch 3 (ditulis setelah checkpoint resume) tidak diadopsi
+    assert _write(tmp_path, [0.6, 0.7], start=3, keep_last=2, resume_epoch=2) == [1, 3, 4]
+    assert load_model_metadata(str(tmp_path / 'model_epoch_3.ckpt'))['checkpoint_loss'] == 0.6
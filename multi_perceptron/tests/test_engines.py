@@ -0,0 +1,46 @@
+"""
+Ekuivalensi numerik antar engine: python (MLP) vs numpy (VectorizedMLP)
+"""
+import random
+import numpy as np
+from src.network.factory import create_network
+import config
+
+def test_numpy_engine_matches_python_engine(xor_data):
+    networks = []
+    for engine in ('python', 'numpy'):
+        random.seed(1)
+        networks.append(create_network(dict(config.NETWORK_CONFIG, hidden_size=3, engine=engine)))
+
+    for _ in range(300):
+        for inputs, targets in xor_data:
+            for network in networks:
+                _, hidden_outputs, _, final_outputs = network.forward_pass(inputs)
+                network.backward_pass(inputs, hidden_outputs, final_outputs, targets, trace=False)
+
+    python_mlp, numpy_mlp = networks
+    for name in ('weights_input_hidden', 'weights_hidden_output', 'bias_hidden', 'bias_output'):
+        np.testing.assert_allclose(np.asarray(getattr(numpy_mlp, name)).reshape(-1),
+                                   np.asarray(getattr(python_mlp, name), dtype=float).reshape(-1),
+                                   rtol=1e-12, atol=1e-12)
+    for inputs, _ in xor_data:
+        np.testing.assert_allclose(numpy_mlp.predict(inputs), python_mlp.predict(inputs), rtol=1e-12)
+
+def test_default_engine_is_python():
+    assert config.NETWORK_CONFIG['engine'] == 'python'
+    assert type(create_network(config.NETWORK_CONFIG)).__name__ == 'MLP'
+
+def test_python_engine_accepts_array_samples(xor_data):
+    # XORDataset / dataset cache menghasilkan sample (n, 1) ndarray
+    networks = []
+    for _ in range(2):
+        random.seed(2)
+        networks.append(create_network(dict(config.NETWORK_CONFIG, engine='python')))
+    list_mlp, array_mlp = networks
+
+    for inputs, targets in xor_data:
+        for mlp, x, t in ((list_mlp, inputs, targets),
+                          (array_mlp, np.array(inputs).reshape(-1, 1), np.array(targets).reshape(-1, 1))):
+            _, hidden_outputs, _, final_outputs = mlp.forward_pass(x)
+            mlp.backward_pass(x, hidden_outputs, final_outputs, t, trace=True)
+    assert array_mlp.to_dict() == list_mlp.to_dict()
@@ -0,0 +1,54 @@
+"""
+TrainingLogger: epoch summary di-buffer (flush per N baris, saat close) dan resume memotong log
+"""
+import csv
+from src.trainer.logger import TrainingLogger
+
+def _rows(logger):
+    with open(logger.epoch_summary_file, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))[1:]
+
+def _logger(logging_config, resume_epoch=None, **overrides):
+    return TrainingLogger(dict(logging_config, summary_flush_seconds=None, **overrides), resume_epoch=resume_epoch)
+
+def test_summary_rows_are_flushed_in_groups(logging_config):
+    logger = _logger(logging_config, summary_flush_every=3)
+    for epoch, loss in enumerate([0.5, 0.4, 0.45, 0.3]):
+        logger.log_epoch_summary(epoch, loss, 4, 0.1)
+        assert len(_rows(logger)) == (epoch + 1) // 3 * 3
+    logger.close()
+
+    rows = _rows(logger)
+    assert [int(row[0]) for row in rows] == [0, 1, 2, 3]
+    # best_loss_so_far adalah running minimum
+    assert [float(row[3]) for row in rows] == [0.5, 0.4, 0.4, 0.3]
+    assert (logger.best_loss, logger.last_loss) == (0.3, 0.3)
+
+def test_flush_writes_pending_rows(logging_config):
+    logger = _logger(logging_config, summary_flush_every=100)
+    logger.log_epoch_summary(0, 0.5, 4)
+    assert _rows(logger) == []
+    logger.flush()
+    assert len(_rows(logger)) == 1
+    logger.close()
+
+def test_epoch_logs_keep_limits_memory(logging_config):
+    logger = _logger(logging_config, epoch_logs_keep=2)
+    for epoch in range(5):
+        logger.log_epoch_summary(epoch, 1.0 / (epoch + 1), 4)
+    logger.close()
+    assert [log['epoch'] for log in logger.epoch_logs] == [3, 4]
+    assert len(_rows(logger)) == 5
+
+def test_resume_drops_rows_after_resume_epoch(logging_config):
+    logger = _logger(logging_config)
+    for epoch, loss in enumerate([0.5, 0.2, 0.3, 0.1]):
+        logger.log_epoch_summary(epoch, loss, 4)
+    logger.close()
+
+    resumed = _logger(logging_config, resume_epoch=2)
+    assert [int(row[0]) for row in _rows(resumed)] == [0, 1, 2]
+    assert (resumed.best_loss, resumed.last_loss) == (0.2, 0.3)
+    resumed.log_epoch_summary(3, 0.25, 4)
+    resumed.close()
+    assert [row[1] for row in _rows(resumed)] == ['0.5', '0.2', '0.3', '0.25']
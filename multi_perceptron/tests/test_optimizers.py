@@ -0,0 +1,75 @@
+"""
+Optimizers: update in-place harus sama dengan rumus buku teks (dihitung manual per step)
+"""
+import math
+import numpy as np
+import pytest
+from src.network.optimizers import create_optimizer
+
+GRADIENTS = [np.array([0.5, -1.0, 2.0]), np.array([0.25, 0.5, -1.0]), np.array([-0.5, 0.0, 1.5])]
+LR, BATCH_SIZE = 0.1, 2
+
+def _reference(name, params):
+    """Rumus textbook dengan gradient rata-rata g = sum / batch_size (arah turun: params += ...)"""
+    params = list(params)
+    state = [{'v': 0.0, 'm': 0.0, 's': 0.0} for _ in params]
+    mu, rho, beta1, beta2, eps = 0.9, 0.9, 0.9, 0.999, 1e-8
+    for t, gradients in enumerate(GRADIENTS, start=1):
+        for i, g in enumerate(gradients / BATCH_SIZE):
+            st = state[i]
+            if name == 'sgd':
+                params[i] += LR * g
+            elif name == 'momentum':
+                st['v'] = mu * st['v'] + LR * g
+                params[i] += st['v']
+            elif name == 'nesterov':
+                st['v'] = mu * st['v'] + LR * g
+                params[i] += mu * st['v'] + LR * g
+            elif name == 'rmsprop':
+                st['s'] = rho * st['s'] + (1 - rho) * g * g
+                params[i] += LR * g / (math.sqrt(st['s']) + eps)
+            elif name == 'adam':
+                st['m'] = beta1 * st['m'] + (1 - beta1) * g
+                st['s'] = beta2 * st['s'] + (1 - beta2) * g * g
+                m_hat, v_hat = st['m'] / (1 - beta1 ** t), st['s'] / (1 - beta2 ** t)
+                params[i] += LR * m_hat / (math.sqrt(v_hat) + eps)
+    return params
+
+@pytest.mark.parametrize('name', ['sgd', 'momentum', 'nesterov', 'rmsprop', 'adam'])
+def test_optimizer_matches_reference(name):
+    initial = np.array([1.0, -2.0, 0.5])
+    optimizer = create_optimizer(name)
+    optimizer.initialize(initial.size)
+    params = initial.copy()
+    for gradients in GRADIENTS:
+        optimizer.step(params, gradients.copy(), LR, BATCH_SIZE)
+    np.testing.assert_allclose(params, _reference(name, initial), rtol=1e-12)
+    assert optimizer.step_count == len(GRADIENTS)
+
+def test_sgd_single_step_by_hand():
+    optimizer = create_optimizer('sgd')
+    optimizer.initialize(2)
+    params = np.array([1.0, -2.0])
+    optimizer.step(params, np.array([0.5, 1.0]), 0.1, batch_size=2)
+    np.testing.assert_allclose(params, [1.025, -1.95])
+
+def test_state_dict_round_trip():
+    optimizer = create_optimizer('adam')
+    optimizer.initialize(3)
+    params = np.zeros(3)
+    optimizer.step(params, GRADIENTS[0].copy(), LR)
+
+    restored = create_optimizer('adam')
+    restored.initialize(3)
+    restored.load_state_dict(optimizer.state_dict())
+    restored_params = params.copy()
+    optimizer.step(params, GRADIENTS[1].copy(), LR)
+    restored.step(restored_params, GRADIENTS[1].copy(), LR)
+    np.testing.assert_array_equal(restored_params, params)
+
+    with pytest.raises(ValueError):
+        create_optimizer('momentum').load_state_dict(optimizer.state_dict())
+
+def test_unknown_optimizer():
+    with pytest.raises(ValueError, match='Unknown optimizer'):
+        create_optimizer('lion')
@@ -0,0 +1,49 @@
+"""
+Data pipeline: permutation per epoch dan BatchPrefetcher (sama dengan gather sinkron)
+"""
+import numpy as np
+import pytest
+from src.data.pipeline import BatchPrefetcher, epoch_permutation, iterate_batches
+
+@pytest.fixture
+def arrays():
+    rng = np.random.default_rng(0)
+    return rng.random((23, 3)), rng.random((23, 2))
+
+def test_epoch_permutation_depends_only_on_seed_and_epoch():
+    order = epoch_permutation(7, 3, 50)
+    np.testing.assert_array_equal(order, epoch_permutation(7, 3, 50))
+    np.testing.assert_array_equal(np.sort(order), np.arange(50))
+    assert not np.array_equal(order, epoch_permutation(7, 4, 50))
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+@pytest.mark.parametrize('batch_size', [1, 5, 23, 64])
+def test_prefetch_matches_synchronous_gather(arrays, prefetch, batch_size):
+    X, Y = arrays
+    order = epoch_permutation(0, 0, len(X))
+    expected = list(iterate_batches(X, Y, batch_size, order))
+    # Batch prefetch hanya valid sampai batch berikutnya: salin sebelum lanjut
+    batches = [(X_batch.copy(), Y_batch.copy())
+               for X_batch, Y_batch in iterate_batches(X, Y, batch_size, order, prefetch=prefetch)]
+    assert len(batches) == len(expected)
+    for (X_batch, Y_batch), (X_expected, Y_expected) in zip(batches, expected):
+        np.testing.assert_array_equal(X_batch, X_expected)
+        np.testing.assert_array_equal(Y_batch, Y_expected)
+
+def test_producer_error_is_raised_in_consumer(arrays):
+    X, Y = arrays
+    order = np.arange(len(X) + 5)    # index di luar range
+    with pytest.raises(IndexError):
+        for _ in BatchPrefetcher(X, Y, 4, order, prefetch=2):
+            pass
+
+def test_abandoned_epoch_stops_producer(arrays):
+    X, Y = arrays
+    prefetcher = BatchPrefetcher(X, Y, 1, np.arange(len(X)), prefetch=1)
+    for _ in prefetcher:
+        break
+    assert not prefetcher._thread.is_alive()
+
+def test_prefetch_must_be_positive(arrays):
+    with pytest.raises(ValueError, match='prefetch'):
+        BatchPrefetcher(*arrays, 4, np.arange(23), prefetch=0)
@@ -0,0 +1,44 @@
+"""
+Resume dari checkpoint harus bit-exact dengan training yang tidak terputus
+"""
+import os
+import random
+import pytest
+from src.trainer.trainer import MLPTrainer
+import config
+
+SETTINGS = {
+    'numpy': ({'engine': 'numpy', 'seed': 0, 'learning_rate': 0.1},
+              {'batch_size': 2, 'optimizer': 'adam', 'lr_schedule': 'cosine', 'lr_schedule_params': {'t_max': 60}}),
+    'python': ({'engine': 'python', 'seed': None},
+               {'batch_size': 1, 'optimizer': 'sgd'}),
+}
+
+def _train(xor_data, output_dir, engine: str, epochs: int, resume: bool = False) -> MLPTrainer:
+    network_overrides, training_overrides = SETTINGS[engine]
+    training_config = dict(config.TRAINING_CONFIG, epochs=epochs, shuffle_data=True, shuffle_seed=7,
+                           log_first_epochs=2, log_detailed_every=None, print_progress_every=10 ** 9,
+                           target_loss=0.0, resume_from='latest' if resume else None, **training_overrides)
+    logging_config = dict(config.LOGGING_CONFIG, logs_dir=str(output_dir), models_dir=str(output_dir),
+                          checkpoint_every_epochs=20)
+    os.makedirs(output_dir, exist_ok=True)
+    random.seed(0)
+    trainer = MLPTrainer(dict(config.NETWORK_CONFIG, **network_overrides), training_config, logging_config)
+    trainer.train(xor_data)
+    return trainer
+
+def _summary(output_dir) -> str:
+    with open(os.path.join(output_dir, config.LOGGING_CONFIG['epoch_summary_file']), encoding='utf-8') as f:
+        return f.read()
+
+@pytest.mark.parametrize('engine', ['numpy', 'python'])
+def test_resume_is_bit_exact(tmp_path, xor_data, engine):
+    full = _train(xor_data, tmp_path / 'full', engine, epochs=60)
+
+    # Training terputus setelah epoch 39 (checkpoint terakhir), lalu dilanjutkan sampai 60
+    _train(xor_data, tmp_path / 'resumed', engine, epochs=40)
+    resumed = _train(xor_data, tmp_path / 'resumed', engine, epochs=60, resume=True)
+
+    assert resumed.start_epoch == 40
+    assert resumed.mlp.to_dict() == full.mlp.to_dict()
+    assert _summary(tmp_path / 'resumed') == _summary(tmp_path / 'full')
@@ -0,0 +1,49 @@
+"""
+Learning rate schedulers: kurva LR per epoch dan state ReduceOnPlateau
+"""
+import math
+import pytest
+from src.trainer.schedulers import ReduceOnPlateau, create_scheduler
+
+def _curve(scheduler, epochs):
+    return [scheduler.learning_rate(epoch) for epoch in range(epochs)]
+
+@pytest.mark.parametrize('name, params, expected', [
+    (None, {}, [1.0] * 4),
+    ('warmup', {'warmup_epochs': 4}, [0.25, 0.5, 0.75, 1.0, 1.0]),
+    ('step', {'step_size': 2, 'gamma': 0.5}, [1.0, 1.0, 0.5, 0.5, 0.25]),
+    ('exponential', {'gamma': 0.5}, [1.0, 0.5, 0.25, 0.125]),
+    ('cosine', {'t_max': 4, 'min_lr': 0.2}, [1.0, 0.2 + 0.4 * (1 + math.cos(math.pi / 4)), 0.6,
+                                              0.2 + 0.4 * (1 + math.cos(3 * math.pi / 4)), 0.2, 0.2]),
+    ('step', {'step_size': 2, 'gamma': 0.5, 'warmup_epochs': 2}, [0.5, 1.0, 1.0, 1.0, 0.5]),
+])
+def test_learning_rate_curves(name, params, expected):
+    assert _curve(create_scheduler(name, 1.0, **params), len(expected)) == pytest.approx(expected)
+
+def test_unknown_schedule():
+    with pytest.raises(ValueError, match='lr_schedule'):
+        create_scheduler('linear', 1.0)
+
+def test_plateau_reduces_only_in_step():
+    scheduler = ReduceOnPlateau(1.0, patience=2, factor=0.5, min_lr=0.2)
+    lrs = []
+    for epoch, loss in enumerate([1.0, 0.9, 0.9, 0.9, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8]):
+        lr = scheduler.learning_rate(epoch)
+        # learning_rate tidak mengubah state
+        assert scheduler.learning_rate(epoch) == lr
+        lrs.append(lr)
+        scheduler.step(epoch, loss)
+    # Plateau 2 epoch setelah epoch 3, lalu setiap 2 epoch setelah epoch 6; dibatasi min_lr
+    assert lrs == pytest.approx([1.0, 1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 0.25, 0.25, 0.2, 0.2])
+
+def test_plateau_state_dict_round_trip():
+    scheduler = ReduceOnPlateau(1.0, patience=2)
+    for epoch, loss in enumerate([1.0, 1.0, 1.0, 1.0]):
+        scheduler.step(epoch, loss)
+    restored = ReduceOnPlateau(1.0, patience=2)
+    restored.load_state_dict(scheduler.state_dict())
+    for epoch, loss in enumerate([1.0, 0.5, 0.5], start=4):
+        scheduler.step(epoch, loss)
+        restored.step(epoch, loss)
+        assert restored.learning_rate(epoch + 1) == scheduler.learning_rate(epoch + 1)
+    assert restored.state_dict() == scheduler.state_dict()
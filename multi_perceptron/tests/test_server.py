@@ -0,0 +1,71 @@
+"""
+Prediction server: response untuk request valid, rusak dan terlalu besar
+"""
+import asyncio
+import json
+import numpy as np
+import pytest
+from src.network.factory import create_network
+from src.network.inference import InferenceModel
+from src.serving.server import PredictionServer
+import config
+
+@pytest.fixture
+def mlp():
+    return create_network(dict(config.NETWORK_CONFIG, engine='numpy', seed=0))
+
+def _requests(model, raw_requests, max_body_bytes=1 << 20):
+    """Kirim setiap raw request lewat koneksi baru; return [(status, payload)] dan jumlah error"""
+    async def send(port, raw):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(raw)
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        head, body = data.split(b'\r\n\r\n', 1)
+        return int(head.split(b' ')[1]), json.loads(body)
+
+    async def run():
+        server = PredictionServer(model, max_batch_size=8, max_wait_us=100, max_body_bytes=max_body_bytes)
+        port = (await server.start('127.0.0.1', 0)).sockets[0].getsockname()[1]
+        try:
+            return [await send(port, raw) for raw in raw_requests], server.metrics.errors
+        finally:
+            await server.stop()
+
+    return asyncio.run(run())
+
+def _post(body: bytes) -> bytes:
+    return b'POST /predict HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s' % (len(body), body)
+
+def test_predict(mlp, xor_data):
+    inputs = [inputs for inputs, _ in xor_data]
+    responses, _ = _requests(InferenceModel.from_dict(mlp.snapshot()), [_post(json.dumps({'inputs': inputs}).encode())])
+    status, payload = responses[0]
+    assert status == 200
+    expected = [np.asarray(mlp.predict(row)).reshape(-1) for row in inputs]
+    np.testing.assert_allclose(payload['outputs'], expected, rtol=1e-12)
+
+@pytest.mark.parametrize('raw', [
+    b'GARBAGE\r\n\r\n',
+    b'POST /predict HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+    b'GET /health HTTP/1.1\r\nbadheader\r\n\r\n',
+    _post(b'{"inputs": [0, 1, 2]}'),
+    _post(b'not json'),
+])
+def test_malformed_request_is_400(mlp, raw):
+    responses, errors = _requests(InferenceModel.from_dict(mlp.snapshot()), [raw])
+    assert responses[0][0] == 400
+    assert errors == 1
+
+def test_body_above_limit_is_413(mlp):
+    body = json.dumps({'inputs': [[0.0, 1.0]] * 10}).encode()
+    model = InferenceModel.from_dict(mlp.snapshot())
+    responses, errors = _requests(model, [_post(body)], max_body_bytes=len(body) - 1)
+    assert responses[0][0] == 413
+    assert errors == 1
+    # Content-Length saja yang diperiksa: body tidak perlu dikirim
+    responses, _ = _requests(model, [b'POST /predict HTTP/1.1\r\nContent-Length: 10000000000\r\n\r\n'])
+    assert responses[0][0] == 413
+    responses, _ = _requests(model, [_post(body)], max_body_bytes=len(body))
+    assert responses[0][0] == 200
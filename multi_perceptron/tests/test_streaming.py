@@ -0,0 +1,94 @@
+"""
+Streaming dataset: CSV, JSON Lines dan {"samples": [...]} dibaca per chunk
+"""
+import io
+import json
+import numpy as np
+import pytest
+from src.data.dataset import XORDataset
+from src.data.streaming import StreamingDataset, _iter_json_samples
+import config
+
+XOR_CSV = "x1,x2,target\n0,0,0\n0,1,1\n1,0,1\n1,1,0\n"
+
+@pytest.fixture
+def csv_config(tmp_path, monkeypatch):
+    """DATASET_CONFIG yang menunjuk ke xor.csv di tmp_path (cache juga di tmp_path)"""
+    (tmp_path / 'xor.csv').write_text(XOR_CSV, encoding='utf-8')
+    monkeypatch.setattr(config, 'INPUT_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'DATASET_CONFIG', dict(config.DATASET_CONFIG, xor_dataset_file='xor.csv',
+                                                       cache_dir=str(tmp_path / 'cache')))
+    return config.DATASET_CONFIG
+
+def test_csv_needs_input_size(tmp_path):
+    (tmp_path / 'xor.csv').write_text(XOR_CSV, encoding='utf-8')
+    with pytest.raises(ValueError, match='input_size'):
+        list(StreamingDataset(str(tmp_path / 'xor.csv')))
+
+def test_csv_chunks(tmp_path):
+    (tmp_path / 'xor.csv').write_text(XOR_CSV, encoding='utf-8')
+    dataset = StreamingDataset(str(tmp_path / 'xor.csv'), chunk_size=3, input_size=2, output_size=1)
+    chunks = list(dataset)
+    assert [X.shape for X, _ in chunks] == [(3, 2), (1, 2)]
+    np.testing.assert_array_equal(np.concatenate([Y for _, Y in chunks]).reshape(-1), [0, 1, 1, 0])
+    assert dataset.num_samples == 4
+
+@pytest.mark.parametrize('cache', [False, True])
+def test_xor_dataset_reads_csv(csv_config, cache, monkeypatch):
+    monkeypatch.setitem(csv_config, 'cache', cache)
+    data = XORDataset().get_data()
+    assert len(data) == 4
+    inputs, targets = data[1]
+    np.testing.assert_array_equal(np.asarray(inputs).reshape(-1), [0.0, 1.0])
+    np.testing.assert_array_equal(np.asarray(targets).reshape(-1), [1.0])
+
+def test_cache_rebuilt_for_other_csv_split(csv_config, monkeypatch):
+    monkeypatch.setitem(csv_config, 'cache', True)
+    assert XORDataset().get_data().X.shape == (4, 2)
+    monkeypatch.setitem(config.NETWORK_CONFIG, 'input_size', 1)
+    monkeypatch.setitem(config.NETWORK_CONFIG, 'output_size', 2)
+    data = XORDataset().get_data()
+    assert (data.X.shape, data.Y.shape) == ((4, 1), (4, 2))
+
+SAMPLES = [{'input': [i * 0.5, -i], 'target': [i % 2]} for i in range(20)]
+
+def _parse(text: str, read_size: int):
+    return list(_iter_json_samples(io.StringIO(text), read_size))
+
+@pytest.mark.parametrize('read_size', [1, 2, 7, 1 << 16])
+@pytest.mark.parametrize('document', [
+    {'samples': SAMPLES},
+    # "samples" di object bertingkat dan di dalam string tidak boleh dipakai
+    {'meta': {'samples': [{'input': [9], 'target': [9]}]}, 'note': 'teks "samples": [ palsu',
+     'version': 123456, 'samples': SAMPLES, 'after': [1, 2]},
+    {'list': [1, {'samples': 2}], 'samples': SAMPLES},
+])
+def test_json_samples_only_top_level_key(document, read_size):
+    expected = [(sample['input'], sample['target']) for sample in SAMPLES]
+    assert _parse(json.dumps(document), read_size) == expected
+    assert _parse(json.dumps(document, indent=2), read_size) == expected
+
+@pytest.mark.parametrize('text, message', [
+    ('{"meta": {"samples": [{"input": [1], "target": [1]}]}}', "tidak berisi array 'samples'"),
+    ('[{"input": [1], "target": [1]}]', 'harus berupa object'),
+    ('{"samples": 3}', 'harus berupa array'),
+    ('{"samples": [{"input": [1], "target": [1]}', 'terpotong'),
+])
+def test_json_samples_errors(text, message):
+    for read_size in (1, 5, 1 << 16):
+        with pytest.raises(ValueError, match=message):
+            _parse(text, read_size)
+
+def test_jsonl_chunks(tmp_path):
+    path = tmp_path / 'data.jsonl'
+    path.write_text(''.join(json.dumps(sample) + '\n' for sample in SAMPLES) + '\n', encoding='utf-8')
+    dataset = StreamingDataset(str(path), chunk_size=8)
+    shapes = [(X.shape, Y.shape) for X, Y in dataset]
+    assert shapes == [((8, 2), (8, 1)), ((8, 2), (8, 1)), ((4, 2), (4, 1))]
+    assert dataset.num_samples == len(SAMPLES)
+
+def test_inconsistent_sample_size(tmp_path):
+    path = tmp_path / 'data.jsonl'
+    path.write_text('{"input": [1, 2], "target": [1]}\n{"input": [1], "target": [1]}\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='Sample 1'):
+        list(StreamingDataset(str(path)))
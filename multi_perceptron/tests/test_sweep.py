@@ -0,0 +1,49 @@
+"""
+Hyperparameter sweep: trial yang gagal dan successive halving
+"""
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.trainer import sweep as sweep_module
+from src.trainer.sweep import HyperparameterSweep
+import config
+
+def _sweep(tmp_path, space, epochs=20, **sweep_overrides):
+    sweep_config = dict(config.SWEEP_CONFIG, space=space, output_dir=str(tmp_path), **sweep_overrides)
+    training_config = dict(config.TRAINING_CONFIG, epochs=epochs, print_progress_every=10 ** 9)
+    return HyperparameterSweep(dict(config.NETWORK_CONFIG, engine='numpy'), training_config,
+                               config.LOGGING_CONFIG, sweep_config)
+
+def test_failed_trial_does_not_stop_sweep(tmp_path, xor_data):
+    sweep = _sweep(tmp_path, {'hidden_activation': ['sigmoid', 'bogus']})
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = sweep._run_batch(executor, sweep.build_trials(xor_data))
+
+    by_activation = {result['hidden_activation']: result for result in results}
+    assert by_activation['sigmoid']['status'] == 'completed'
+    assert by_activation['bogus']['status'] == 'failed'
+    assert 'bogus' in by_activation['bogus']['error']
+
+def test_halving_keeps_last_completed_rung_of_failed_trial(tmp_path, xor_data, monkeypatch):
+    def fake_run_trial(trial):
+        # Trial 0 gagal saat dilanjutkan (rung 1); loss turun dengan epochs
+        if trial['trial_id'] == 0 and trial.get('resume'):
+            raise RuntimeError('checkpoint rusak')
+        epochs = trial['training_config']['epochs']
+        loss = (trial['trial_id'] + 1) / epochs
+        return dict(trial['params'], trial_id=trial['trial_id'], seed=trial['seed'], status='completed',
+                    epochs=epochs, final_loss=loss, best_loss=loss, wall_time=0.0,
+                    output_dir=trial['output_dir'])
+
+    monkeypatch.setattr(sweep_module, 'run_trial', fake_run_trial)
+    sweep = _sweep(tmp_path, {'hidden_size': [2, 3, 4, 5]}, epochs=40, min_epochs=10, reduction_factor=2)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = {r['trial_id']: r for r in sweep._successive_halving(executor, sweep.build_trials(xor_data))}
+
+    # Rung 0 (10 epochs): trial 0 dan 1 lanjut; rung 1 (20 epochs): trial 0 gagal
+    assert results[0]['epochs'] == 10
+    assert results[0]['best_loss'] == pytest.approx(0.1)
+    assert results[0]['failed_at_rung'] == 1
+    assert 'checkpoint rusak' in results[0]['error']
+    assert results[1]['epochs'] == 40
+    assert 'failed_at_rung' not in results[1]
+    assert [results[i]['status'] for i in (2, 3)] == ['pruned', 'pruned']
@@ -0,0 +1,65 @@
+"""
+TraceStore: query per epoch / sample / step_type, truncate saat resume, dan trace dari training
+"""
+import os
+import random
+import pytest
+from src.trainer.trace_store import TraceStore, trace_row
+from src.trainer.trainer import MLPTrainer
+import config
+
+def _fill(store):
+    for epoch in range(3):
+        for sample_index in range(2):
+            store.append([trace_row(epoch, sample_index, 'loss_calculation', loss_value=epoch + sample_index / 10),
+                          trace_row(epoch, sample_index, 'forward_hidden', neuron_index=0, weighted_sum=1.0)])
+    store.commit()
+
+def test_query_filters(tmp_path):
+    store = TraceStore.create(str(tmp_path / 'trace.sqlite'))
+    _fill(store)
+    assert len(store) == 12
+    assert store.samples() == [(epoch, sample) for epoch in range(3) for sample in range(2)]
+    assert store.step_counts(epoch=1) == {'loss_calculation': 2, 'forward_hidden': 2}
+
+    rows = store.query(epoch=2, sample_index=1, columns=['step_type', 'loss_value'])
+    assert rows == [{'step_type': 'loss_calculation', 'loss_value': 2.1},
+                    {'step_type': 'forward_hidden', 'loss_value': None}]
+    assert store.column_values('loss_value', sample_index=0) == [0.0, 1.0, 2.0]
+    with pytest.raises(ValueError, match='tidak dikenal'):
+        store.query(columns=['loss'])
+    store.close()
+
+def test_truncate_after_and_create(tmp_path):
+    path = str(tmp_path / 'trace.sqlite')
+    store = TraceStore.create(path)
+    _fill(store)
+    store.close()
+
+    # Resume: baris setelah epoch checkpoint dibuang, data lain tetap ada setelah reopen
+    store = TraceStore(path)
+    store.truncate_after(0)
+    store.close()
+    store = TraceStore(path)
+    assert store.samples() == [(0, 0), (0, 1)]
+    store.close()
+
+    # Run baru: file lama diganti
+    store = TraceStore.create(path)
+    assert len(store) == 0
+    store.close()
+
+def test_training_writes_one_trace_per_detailed_sample(logging_config, xor_data):
+    training_config = dict(config.TRAINING_CONFIG, epochs=3, log_first_epochs=2, log_detailed_every=None,
+                           print_progress_every=10 ** 9)
+    random.seed(0)
+    trainer = MLPTrainer(dict(config.NETWORK_CONFIG, engine='python'), training_config, logging_config)
+    trainer.train(xor_data)
+
+    store = TraceStore(os.path.join(logging_config['logs_dir'], logging_config['trace_file']))
+    assert store.samples() == [(epoch, sample) for epoch in range(2) for sample in range(4)]
+    counts = store.step_counts(epoch=0, sample_index=0)
+    assert counts['loss_calculation'] == 1
+    assert counts['weight_update_input_hidden'] == 2 * 2
+    assert counts['weight_update_hidden_output'] == 2 * 1
+    store.close()
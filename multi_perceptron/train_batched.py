@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.trainer.batched_trainer import BatchedTrainer
+from src.data.dataset import XORDataset
+import config
+
+def main():
+    """Train K models at once and keep the best one"""
+    batched = config.BATCHED_CONFIG
+    parser = argparse.ArgumentParser(description="Train many small MLPs as one batched model")
+    parser.add_argument('--num-models', type=int, default=batched['num_models'])
+    parser.add_argument('--base-seed', type=int, default=batched['base_seed'])
+    parser.add_argument('--learning-rates', type=float, nargs='+', default=batched['learning_rates'],
+                        help="Diulang (round-robin) sampai num-models nilai")
+    args = parser.parse_args()
+    
+    seeds = range(args.base_seed, args.base_seed + args.num_models)
+    learning_rates = None
+    if args.learning_rates:
+        learning_rates = [args.learning_rates[k % len(args.learning_rates)] for k in range(args.num_models)]
+    
+    training_data = XORDataset().get_data()
+    trainer = BatchedTrainer(config.NETWORK_CONFIG, config.TRAINING_CONFIG, config.LOGGING_CONFIG,
+                             seeds=seeds, learning_rates=learning_rates)
+    trainer.train(training_data)
+    
+    # Ringkasan 10 model terbaik
+    print("\nmodel |  seed |     lr | epochs |  best_loss")
+    print("-" * 45)
+    for result in sorted(trainer.results(), key=lambda r: r['best_loss'])[:10]:
+        print(f"{result['model']:5d} | {result['seed']:5d} | {result['learning_rate']:6.3f} | "
+              f"{result['epochs']:6d} | {result['best_loss']:.6f}")
+    
+    print(f"\nLoss curves: {trainer.save_loss_curves(batched['loss_curves_file'])}")
+    print(f"Model terbaik disimpan di: {trainer.save_best_model()}")
+
+if __name__ == "__main__":
+    main()